@@ -0,0 +1,96 @@
+"""Microbenchmark for the chat log parser.
+
+Usage:
+    python benchmarks/bench_parser.py [--lines N] [--repeat R]
+
+Parses a synthetic EVE chat log with src/chat_parser.py and, for comparison,
+with the regex chain EVEChatMonitor used before the combined pattern, then
+reports lines/sec for each.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from chat_parser import parse_chat_line  # noqa: E402
+
+LEGACY_PATTERNS = [
+    r'\[ ([\d\.]+ [\d:]+) \] ([^>]+) > (.+)',
+    r'\[ ([\d\.]+ [\d:]+) \] ([^:]+): (.+)',
+    r'\[([\d\.]+ [\d:]+)\] ([^>]+) > (.+)',
+    r'([^>]+) > (.+)',
+    r'\[([\d\.]+ [\d:]+)\] ([^>]+) > (.+)',
+]
+
+
+def legacy_parse(line):
+    """Clean + parse + classify the way EVEChatMonitor did before chat_parser"""
+    cleaned = line.replace('\x00', '')
+    if '[' in cleaned and ']' in cleaned and '>' in cleaned:
+        start, end = cleaned.find('['), cleaned.find(']')
+        timestamp = re.sub(r'\s+', ' ', cleaned[start + 1:end].strip())
+        rest = re.sub(r'\s+', ' ', cleaned[end + 1:].strip())
+        cleaned = f"[ {timestamp} ] {rest}"
+    for pattern in LEGACY_PATTERNS:
+        match = re.match(pattern, cleaned)
+        if match:
+            content = match.groups()[-1].strip()
+            for prefix in ('!pir ', '!gtn ', '!stop', '!status', '!clear'):
+                if content.lower().startswith(prefix):
+                    return prefix
+            return '?' if content.startswith('?') else None
+    return None
+
+
+def synthetic_lines(count, seed=1234):
+    """Build EVE-style chat lines: mostly ?N entries, some chatter and commands"""
+    rng = random.Random(seed)
+    speakers = [f"Pilot {i:04d}" for i in range(2000)]
+    chatter = ['o7', 'gf', 'anyone got a cyno?', 'x up for fleet', 'lol']
+    lines = []
+    for i in range(count):
+        stamp = f"2024.01.15 18:{(i // 60) % 60:02d}:{i % 60:02d}"
+        roll = rng.random()
+        if roll < 0.7:
+            body = f"?{rng.randint(1, 1000)}"
+        elif roll < 0.98:
+            body = rng.choice(chatter)
+        else:
+            body = rng.choice(['!PIR 1-1000', '!gtn 1-500', '!status', '!stop'])
+        lines.append(f"[ {stamp} ] {rng.choice(speakers)} > {body}")
+    return lines
+
+
+def measure(parse, lines, repeat):
+    """Best-of-repeat lines/sec for parse over lines"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for line in lines:
+            parse(line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--lines', type=int, default=100000, help="synthetic lines to parse")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per parser (best is reported)")
+    args = parser.parse_args(argv)
+
+    lines = synthetic_lines(args.lines)
+    new_rate = measure(parse_chat_line, lines, args.repeat)
+    legacy_rate = measure(legacy_parse, lines, args.repeat)
+
+    print(f"Lines parsed:        {len(lines):,}")
+    print(f"chat_parser:         {new_rate:,.0f} lines/sec")
+    print(f"legacy regex chain:  {legacy_rate:,.0f} lines/sec")
+    print(f"Speedup:             {new_rate / legacy_rate:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Synthetic EVE Online chat log generator.
+
+Usage:
+    python benchmarks/generate_chatlog.py OUTPUT_DIR [--lines N] [--speakers N] [--channel NAME] [--seed S]
+
+Writes a Chatlogs-style file the way the EVE client does: UTF-16LE with a
+BOM, the dashed "Channel Name:" header block, and one
+"[ YYYY.MM.DD HH:MM:SS ] Speaker > message" line per message. The traffic
+is a giveaway channel: an admin starts a game every few thousand lines,
+players answer in bursts of ?N entries within the same second, and the
+rest is chatter and the odd system message. The same seed always produces
+the same file.
+"""
+import argparse
+import os
+import random
+import zlib
+from datetime import datetime, timedelta
+
+ADMIN_NAME = "Giveaway Admin"
+CHATTER = ['o7', 'gf', 'anyone got a cyno?', 'x up for fleet', 'lol', 'ty for the giveaway!',
+           'is this PIR or GTN?', 'gl all', 'what range?', 'wts Raven, convo me']
+FIRST_NAMES = ['Pilot', 'Amarr', 'Caldari', 'Gallente', 'Minmatar', 'Jita', 'Æther', 'Ødegaard', 'Capsuleer']
+EVE_TIMESTAMP_FORMAT = '%Y.%m.%d %H:%M:%S'
+
+
+def speaker_names(count, rng):
+    """count distinct, EVE-looking character names (some with spaces and non-ASCII letters)"""
+    return [f"{rng.choice(FIRST_NAMES)} {index:05d}" for index in range(count)]
+
+
+def header(channel, listener, started):
+    """The header block EVE writes at the top of every chat log"""
+    rule = ' ' * 8 + '-' * 63
+    return [
+        '',
+        '',
+        rule,
+        '',
+        f"          Channel ID:      -{zlib.crc32(channel.encode('utf-8')) % 100000}",
+        f"          Channel Name:    {channel}",
+        f"          Listener:        {listener}",
+        f"          Session started: {started.strftime(EVE_TIMESTAMP_FORMAT)}",
+        rule,
+        '',
+        '',
+    ]
+
+
+def chat_lines(count, speakers=5000, seed=1234, started=datetime(2024, 1, 15, 18, 30), game_every=5000,
+               burst_size=(20, 300), range_max=1000):
+    """Yield count message lines of giveaway traffic, starting with an admin starting a game"""
+    rng = random.Random(seed)
+    names = speaker_names(speakers, rng)
+    now = started
+    emitted = 0
+    since_game = game_every
+    while emitted < count:
+        if since_game >= game_every:
+            game = rng.choice(['PIR', 'GTN'])
+            line = f"!{game} 1-{range_max}"
+            speaker = ADMIN_NAME
+            since_game = 0
+        else:
+            roll = rng.random()
+            if roll < 0.4:
+                # A burst of entries arriving within the same second
+                for _ in range(min(rng.randint(*burst_size), count - emitted)):
+                    yield f"[ {now.strftime(EVE_TIMESTAMP_FORMAT)} ] {rng.choice(names)} > ?{rng.randint(1, range_max)}"
+                    emitted += 1
+                    since_game += 1
+                now += timedelta(seconds=1)
+                continue
+            elif roll < 0.97:
+                speaker, line = rng.choice(names), rng.choice(CHATTER)
+            elif roll < 0.99:
+                speaker, line = "EVE System", "Channel changed to Local : Jita"
+            else:
+                speaker, line = ADMIN_NAME, '!status'
+        yield f"[ {now.strftime(EVE_TIMESTAMP_FORMAT)} ] {speaker} > {line}"
+        emitted += 1
+        since_game += 1
+        now += timedelta(seconds=rng.choice((0, 0, 1)))
+
+
+def write_chatlog(directory, lines=10000, speakers=5000, channel='Corp', seed=1234,
+                  started=datetime(2024, 1, 15, 18, 30)):
+    """Write a synthetic chat log into directory and return its path"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{channel}_{started.strftime('%Y%m%d_%H%M%S')}_{seed}.txt")
+    with open(path, 'w', encoding='utf-16-le', newline='\r\n') as f:
+        f.write('\ufeff')  # EVE writes a byte order mark
+        f.write('\n'.join(header(channel, ADMIN_NAME, started)) + '\n')
+        buffer = []
+        for line in chat_lines(lines, speakers=speakers, seed=seed, started=started):
+            buffer.append(line)
+            if len(buffer) >= 10000:
+                f.write('\n'.join(buffer) + '\n')
+                buffer = []
+        if buffer:
+            f.write('\n'.join(buffer) + '\n')
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output_dir', help="directory to write the chat log into")
+    parser.add_argument('--lines', type=int, default=10000, help="message lines to write (default: 10000)")
+    parser.add_argument('--speakers', type=int, default=5000, help="distinct characters talking (default: 5000)")
+    parser.add_argument('--channel', default='Corp', help="channel name for the header and filename")
+    parser.add_argument('--seed', type=int, default=1234, help="random seed (default: 1234)")
+    args = parser.parse_args(argv)
+
+    path = write_chatlog(args.output_dir, args.lines, args.speakers, args.channel, args.seed)
+    print(f"Wrote {args.lines:,} lines ({os.path.getsize(path):,} bytes) to {path}")
+
+
+if __name__ == '__main__':
+    main()
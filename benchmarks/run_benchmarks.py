@@ -0,0 +1,195 @@
+"""Benchmark suite for the chat ingest hot path.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 100,10000,1000000] [--output FILE] [--compare BASELINE]
+
+Generates a synthetic chat log for each size (see generate_chatlog.py) and
+times the stages a line goes through:
+
+    clean_line      EVEChatMonitor.clean_eve_log_line
+    parse_message   EVEChatMonitor.parse_message, including the game logic it dispatches to
+    process_log     EVEChatMonitor.process_chat_log reading the whole file from disk
+    is_admin        GameManager.is_admin for every line's speaker
+    pir_winner      GameManager.select_pir_winner with one entrant per line
+    gtn_winner      GameManager.select_gtn_winner with one entrant per line
+
+Results are written as JSON (one record per benchmark and size, tagged with
+the git commit) so runs from different commits can be compared; --compare
+prints the change against an earlier results file.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'src'))
+sys.path.insert(0, BENCH_DIR)
+
+from admin_registry import AdminRegistry  # noqa: E402
+from chat_tail import ChatLogTailer  # noqa: E402
+from generate_chatlog import ADMIN_NAME, write_chatlog  # noqa: E402
+from main import ConfigManager, EVEChatMonitor, GameManager  # noqa: E402
+from participant_store import ParticipantStore  # noqa: E402
+
+DEFAULT_SIZES = (100, 10000, 1000000)
+
+
+class NullGui:
+    """Accepts the GUI calls GameManager makes and does nothing with them"""
+
+    def update_game_status(self, message):
+        pass
+
+    def add_participant(self, username, guess, channel=None, entered_at=None):
+        pass
+
+    def clear_participants(self, channel=None):
+        pass
+
+    def update_countdown(self, game, channel=None):
+        pass
+
+
+def timed(function, repeat):
+    """Best wall time of repeat calls to function()"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def result(name, size, operations, seconds):
+    """One machine-readable result record"""
+    return {
+        'benchmark': name,
+        'lines': size,
+        'operations': operations,
+        'seconds': seconds,
+        'ops_per_sec': operations / seconds if seconds else None,
+        'us_per_op': seconds / operations * 1e6 if operations else None,
+    }
+
+
+def run_size(size, work_dir, repeat):
+    """Run every benchmark against a generated log of size lines"""
+    log_dir = os.path.join(work_dir, f"logs_{size}")
+    log_path = write_chatlog(log_dir, lines=size)
+    admin_path = os.path.join(work_dir, 'admins.txt')
+    with open(admin_path, 'w', encoding='utf-8') as f:
+        f.write(ADMIN_NAME + '\n')
+
+    config_manager = ConfigManager()
+    admin_registry = AdminRegistry(admin_path)
+
+    def create_game_manager(channel):
+        return GameManager(NullGui(), config_manager, admin_registry=admin_registry,
+                           auto_timer=False, channel=channel)
+
+    def new_monitor():
+        return EVEChatMonitor(create_game_manager, eve_logs_path=log_dir, workers=0)
+
+    lines = ChatLogTailer().read_new_lines(log_path)
+    # Large inputs are only timed once; small ones are repeated so the timer resolution doesn't dominate
+    repeat = repeat if size < 1000000 else 1
+    results = []
+
+    monitor = new_monitor()
+    seconds = timed(lambda: [monitor.clean_eve_log_line(line) for line in lines], repeat)
+    results.append(result('clean_line', size, len(lines), seconds))
+
+    def parse_all():
+        fresh = new_monitor()
+        for line in lines:
+            fresh.parse_message(line, 'Corp')
+    results.append(result('parse_message', size, len(lines), timed(parse_all, repeat)))
+
+    def process_file():
+        new_monitor().process_chat_log(log_path)
+    results.append(result('process_log', size, len(lines), timed(process_file, repeat)))
+
+    game_manager = create_game_manager('Corp')
+    speakers = [line.split('] ', 1)[1].split(' > ', 1)[0] for line in lines if line.startswith('[ ')]
+    seconds = timed(lambda: [game_manager.is_admin(speaker) for speaker in speakers], repeat)
+    results.append(result('is_admin', size, len(speakers), seconds))
+
+    # One entrant per line, guesses spread over the range like a real rush
+    participants = ParticipantStore()
+    entered_at = datetime.now()
+    for index in range(size):
+        participants.add(f"Pilot {index}", (index * 7919) % 1000 + 1, entered_at)
+    game = {'type': 'PIR', 'target': 500, 'participants': participants}
+    calls = 1000
+    seconds = timed(lambda: [game_manager.select_pir_winner(game) for _ in range(calls)], repeat)
+    results.append(result('pir_winner', size, calls, seconds))
+    seconds = timed(lambda: [game_manager.select_gtn_winner(game) for _ in range(calls)], repeat)
+    results.append(result('gtn_winner', size, calls, seconds))
+    return results
+
+
+def git_commit():
+    """Short hash of the commit being benchmarked, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=BENCH_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def print_results(results, baseline=None):
+    """Print a results table, with the change in ops/sec against baseline when given"""
+    previous = {(row['benchmark'], row['lines']): row for row in (baseline or {}).get('results', [])}
+    print(f"{'Benchmark':<15}{'Lines':>10}{'Ops/sec':>15}{'us/op':>12}{'vs baseline':>14}")
+    for row in results:
+        change = ''
+        old = previous.get((row['benchmark'], row['lines']))
+        if old and old.get('ops_per_sec') and row['ops_per_sec']:
+            change = f"{(row['ops_per_sec'] / old['ops_per_sec'] - 1) * 100:+.1f}%"
+        print(f"{row['benchmark']:<15}{row['lines']:>10,}{row['ops_per_sec']:>15,.0f}"
+              f"{row['us_per_op']:>12.3f}{change:>14}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', default=','.join(str(size) for size in DEFAULT_SIZES),
+                        help="comma-separated log sizes in lines (default: 100,10000,1000000)")
+    parser.add_argument('--repeat', type=int, default=5, help="runs per benchmark, best is kept (default: 5)")
+    parser.add_argument('--output', default='benchmark_results.json', help="JSON results file to write")
+    parser.add_argument('--compare', help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            print(f"Running benchmarks on {size:,} lines...", file=sys.stderr)
+            results.extend(run_size(size, work_dir, args.repeat))
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print_results(results, baseline)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -45,7 +45,7 @@ echo 🔨 Building executable...
 echo.
 
 REM Build with PyInstaller
-pyinstaller --onefile --windowed --name "EVE_Giveaway_Tool" --add-data "admins.txt;." --add-data "config.txt;." --exclude-module matplotlib --exclude-module numpy --exclude-module scipy --exclude-module PIL --exclude-module cv2 --exclude-module sklearn "src/main.py"
+pyinstaller --onedir --windowed --name "EVE_Giveaway_Tool" --add-data "admins.txt;." --add-data "config.txt;." --exclude-module matplotlib --exclude-module numpy --exclude-module scipy --exclude-module PIL --exclude-module cv2 --exclude-module sklearn "src/main.py"
 
 if %errorLevel% neq 0 (
     echo.
@@ -58,26 +58,26 @@ echo.
 echo ✅ Build completed successfully!
 echo.
 
-REM Copy config files to dist folder
-if exist "dist\EVE_Giveaway_Tool.exe" (
+REM Copy config files next to the executable
+if exist "dist\EVE_Giveaway_Tool\EVE_Giveaway_Tool.exe" (
     echo 📁 Copying configuration files...
-    copy admins.txt dist\ >nul 2>&1
-    copy config.txt dist\ >nul 2>&1
+    copy admins.txt dist\EVE_Giveaway_Tool\ >nul 2>&1
+    copy config.txt dist\EVE_Giveaway_Tool\ >nul 2>&1
     
     echo.
     echo 📊 Build Summary:
-    echo   • Executable: dist\EVE_Giveaway_Tool.exe
+    echo   • Executable: dist\EVE_Giveaway_Tool\EVE_Giveaway_Tool.exe
     echo   • Size: 
-    for %%F in ("dist\EVE_Giveaway_Tool.exe") do echo     %%~zF bytes
+    for %%F in ("dist\EVE_Giveaway_Tool\EVE_Giveaway_Tool.exe") do echo     %%~zF bytes
     echo   • Created: 
-    for %%F in ("dist\EVE_Giveaway_Tool.exe") do echo     %%~tF
+    for %%F in ("dist\EVE_Giveaway_Tool\EVE_Giveaway_Tool.exe") do echo     %%~tF
     
     echo.
-    echo 🎯 Ready to use! The executable is in the 'dist' folder.
+    echo 🎯 Ready to use! The program is in the 'dist\EVE_Giveaway_Tool' folder.
     echo.
     echo 📋 Usage:
-    echo   1. Copy the .exe file anywhere
-    echo   2. Make sure admins.txt and config.txt are in the same folder
+    echo   1. Copy the whole EVE_Giveaway_Tool folder anywhere (the .exe needs the files beside it)
+    echo   2. Make sure admins.txt and config.txt are in that folder
     echo   3. Edit config.txt to set your EVE logs path
     echo   4. Double-click to run
     echo   5. No Python installation needed!
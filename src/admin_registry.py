@@ -0,0 +1,130 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class AdminRegistry:
+    """Caches the admin list from admins.txt and reloads it only when the file changes"""
+
+    ENCODINGS = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1']
+
+    def __init__(self, admin_path=None, check_interval=1.0):
+        self.explicit_path = admin_path
+        self.check_interval = check_interval
+        self.admin_path = None
+        self.admins = frozenset()
+        self._signature = None
+        self._last_check = 0.0
+        self._missing_reported = False
+        self._lock = threading.Lock()
+        self.reload()
+
+    def is_admin(self, username):
+        """Check if username is an admin, re-reading admins.txt only if it changed"""
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            self.refresh()
+        return username in self.admins
+
+    def refresh(self):
+        """Reload the admin list if admins.txt was created, edited, replaced or removed"""
+        if self.admin_path is None:
+            # No file yet; look again in case the operator just created one
+            self.reload()
+            return
+        if self._stat_signature(self.admin_path) != self._signature:
+            self.reload()
+
+    def reload(self):
+        """Resolve admins.txt and parse it into the cached admin set"""
+        with self._lock:
+            if self.admin_path is None or not os.path.exists(self.admin_path):
+                self.admin_path = self.find_admin_file()
+
+            if self.admin_path is None:
+                if not self._missing_reported:
+                    logger.warning("admins.txt not found in any location. No admin users will be available.")
+                    self._missing_reported = True
+                self.admins = frozenset()
+                self._signature = None
+                return
+            self._missing_reported = False
+
+            signature = self._stat_signature(self.admin_path)
+            admins = self._read_admin_file(self.admin_path)
+            if admins is None:
+                # Keep the previous list rather than locking every admin out
+                return
+            self.admins = frozenset(admins)
+            self._signature = signature
+            logger.debug("Loaded admin list from: %s", self.admin_path)
+            logger.debug("Admin users: %s", set(self.admins))
+
+    def find_admin_file(self):
+        """Return the first admins.txt found in the usual locations, or None"""
+        for admin_path in self.candidate_paths():
+            if os.path.isfile(admin_path):
+                return os.path.abspath(admin_path)
+        return None
+
+    def candidate_paths(self):
+        """Locations searched for admins.txt, in priority order"""
+        if self.explicit_path:
+            return [self.explicit_path]
+
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        possible_paths = [
+            'admins.txt',  # Current working directory
+            os.path.join(os.getcwd(), 'admins.txt'),  # Current working directory (explicit)
+            os.path.join(script_dir, 'admins.txt'),  # Same directory as script
+            os.path.join(script_dir, '..', 'admins.txt'),  # Parent directory
+            os.path.join(script_dir, '..', '..', 'admins.txt'),  # Grandparent directory
+            os.path.join(script_dir, '..', '..', '..', 'admins.txt'),  # Great-grandparent directory
+        ]
+
+        # Add executable directory for PyInstaller builds
+        if hasattr(sys, '_MEIPASS'):  # PyInstaller executable
+            possible_paths.insert(0, os.path.join(sys._MEIPASS, 'admins.txt'))
+            possible_paths.insert(0, os.path.join(os.path.dirname(sys.executable), 'admins.txt'))
+
+        # Add user's home directory
+        home_dir = os.path.expanduser("~")
+        possible_paths.extend([
+            os.path.join(home_dir, 'admins.txt'),
+            os.path.join(home_dir, 'Documents', 'admins.txt'),
+            os.path.join(home_dir, 'Desktop', 'admins.txt'),
+        ])
+        return possible_paths
+
+    def _read_admin_file(self, admin_path):
+        """Parse one admins.txt, trying multiple encodings for better compatibility"""
+        try:
+            for encoding in self.ENCODINGS:
+                try:
+                    admin_list = set()
+                    with open(admin_path, 'r', encoding=encoding) as f:
+                        for line in f:
+                            line = line.strip()
+                            # Skip empty lines and comments
+                            if line and not line.startswith('#'):
+                                admin_list.add(line)
+                    return admin_list
+                except UnicodeDecodeError:
+                    continue
+            logger.warning("Could not read %s with any encoding", admin_path)
+        except Exception as e:
+            logger.warning("Could not read %s: %s", admin_path, e)
+        return None
+
+    def _stat_signature(self, admin_path):
+        """mtime, size and inode together detect edits as well as atomic replaces"""
+        try:
+            stat = os.stat(admin_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
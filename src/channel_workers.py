@@ -0,0 +1,70 @@
+import logging
+import queue
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelWorkerPool:
+    """Runs work for many chat channels in parallel, a channel's work always on the same thread
+
+    Each channel hashes to one worker, so messages from one channel are
+    handled strictly in order while busy channels don't hold each other up.
+    """
+
+    def __init__(self, workers=4, name="ChannelWorker"):
+        self.name = name
+        self._queues = [queue.Queue() for _ in range(max(1, workers))]
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def worker_for(self, channel):
+        """Index of the worker that owns channel (stable across runs)"""
+        return zlib.crc32(channel.encode('utf-8')) % len(self._queues)
+
+    def submit(self, channel, callback, *args):
+        """Run callback(*args) on channel's worker after everything already queued for it"""
+        if not self._threads:
+            self.start()
+        self._queues[self.worker_for(channel)].put((callback, args))
+
+    def start(self):
+        """Start the worker threads (done automatically on first submit)"""
+        with self._lock:
+            if self._threads:
+                return
+            for index, work_queue in enumerate(self._queues):
+                thread = threading.Thread(target=self._run, args=(work_queue,),
+                                          name=f"{self.name}-{index}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout=5):
+        """Let each worker finish what is queued, then wait up to timeout seconds for them to exit"""
+        with self._lock:
+            threads = self._threads
+            if threads:
+                for work_queue in self._queues:
+                    work_queue.put(None)
+            self._threads = []
+        for thread in threads:
+            if thread is not threading.current_thread():
+                thread.join(timeout)
+                if thread.is_alive():
+                    logger.warning("%s still busy at shutdown", thread.name)
+
+    def pending(self):
+        """Number of jobs waiting across all workers"""
+        return sum(work_queue.qsize() for work_queue in self._queues)
+
+    def _run(self, work_queue):
+        while True:
+            job = work_queue.get()
+            if job is None:
+                return
+            callback, args = job
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error("Error in channel worker %s: %s", getattr(callback, '__name__', callback), e)
@@ -0,0 +1,128 @@
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# EVE names chat logs <channel>_<YYYYMMDD>_<HHMMSS>[_<character id>].txt
+_LOG_NAME_RE = re.compile(r'^(?P<channel>.+?)_\d{8}_\d{6}(?:_\d+)?\.txt$')
+
+
+def channel_from_filename(filename):
+    """Channel name encoded in an EVE chat log filename (the whole stem if it doesn't match)"""
+    match = _LOG_NAME_RE.match(filename)
+    if match:
+        return match.group('channel')
+    return os.path.splitext(filename)[0]
+
+
+def is_chat_log(filename):
+    """Whether a file in the logs directory counts as a chat log for newest-file tracking"""
+    return filename.endswith('.txt') and 'Chat' in filename
+
+
+class ChatLogIndex:
+    """In-memory index of the .txt logs in one directory, kept current from file events
+
+    The directory is scanned once with os.scandir when seeded; after that the
+    watchdog handlers report created, modified, moved and deleted files, so the
+    newest chat log is always known without listing the directory again.
+    """
+
+    def __init__(self):
+        self.logs_directory = None
+        self.files = {}  # file_path -> mtime
+        self.sizes = {}  # file_path -> size in bytes when last seen
+        self.inodes = {}  # file_path -> inode when last seen (0 where the OS doesn't report one)
+        self._newest = None  # (mtime, file_path) of the newest chat log
+        self._lock = threading.Lock()
+
+    def seed(self, logs_directory):
+        """Index every .txt file in logs_directory with a single directory scan"""
+        files = {}
+        sizes = {}
+        inodes = {}
+        try:
+            with os.scandir(logs_directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.txt'):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        files[entry.path] = stat.st_mtime
+                        sizes[entry.path] = stat.st_size
+                        inodes[entry.path] = stat.st_ino
+        except OSError as e:
+            logger.error("Error scanning chat logs directory %s: %s", logs_directory, e)
+
+        with self._lock:
+            self.logs_directory = logs_directory
+            self.files = files
+            self.sizes = sizes
+            self.inodes = inodes
+            self._newest = self._find_newest()
+        logger.debug("Indexed %s log files in %s", len(files), logs_directory)
+
+    def touch(self, file_path):
+        """Record that file_path was created or modified"""
+        if not file_path.endswith('.txt'):
+            return
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            self.remove(file_path)
+            return
+        mtime = stat.st_mtime
+        with self._lock:
+            self.files[file_path] = mtime
+            self.sizes[file_path] = stat.st_size
+            self.inodes[file_path] = stat.st_ino
+            if is_chat_log(os.path.basename(file_path)):
+                if self._newest is None or mtime >= self._newest[0]:
+                    self._newest = (mtime, file_path)
+
+    def remove(self, file_path):
+        """Record that file_path was deleted or moved away"""
+        with self._lock:
+            self.sizes.pop(file_path, None)
+            self.inodes.pop(file_path, None)
+            if self.files.pop(file_path, None) is None:
+                return
+            if self._newest is not None and self._newest[1] == file_path:
+                # Only rescans the in-memory index, and only when the newest log goes away
+                self._newest = self._find_newest()
+
+    def newest_chat_log(self):
+        """Path of the most recently modified chat log, or None"""
+        newest = self._newest
+        return newest[1] if newest else None
+
+    def recent_logs(self, max_age_seconds=None, per_channel=None, now=None):
+        """Logs modified within max_age_seconds, at most per_channel newest per channel, newest first"""
+        now = time.time() if now is None else now
+        with self._lock:
+            candidates = sorted(((mtime, path) for path, mtime in self.files.items()), reverse=True)
+        selected = []
+        per_channel_counts = {}
+        for mtime, path in candidates:
+            if max_age_seconds and now - mtime > max_age_seconds:
+                break  # Sorted newest first, so everything after is older still
+            channel = channel_from_filename(os.path.basename(path))
+            if per_channel and per_channel_counts.get(channel, 0) >= per_channel:
+                continue
+            per_channel_counts[channel] = per_channel_counts.get(channel, 0) + 1
+            selected.append(path)
+        return selected
+
+    def __len__(self):
+        return len(self.files)
+
+    def _find_newest(self):
+        newest = None
+        for file_path, mtime in self.files.items():
+            if is_chat_log(os.path.basename(file_path)) and (newest is None or mtime > newest[0]):
+                newest = (mtime, file_path)
+        return newest
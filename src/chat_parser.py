@@ -0,0 +1,88 @@
+import re
+from typing import NamedTuple, Optional
+
+# Command kinds carried on ChatMessage.command
+CMD_PIR = 'pir'
+CMD_GTN = 'gtn'
+CMD_STOP = 'stop'
+CMD_STATUS = 'status'
+CMD_CLEAR = 'clear'
+CMD_ENTRY = 'entry'
+
+# ChatMessage.timestamp format; EVE writes chat in EVE time, which is UTC
+EVE_TIMESTAMP_FORMAT = '%Y.%m.%d %H:%M:%S'
+
+# First word of an admin command (lowercased) -> command kind
+ADMIN_COMMANDS = {
+    '!pir': CMD_PIR,
+    '!gtn': CMD_GTN,
+    '!stop': CMD_STOP,
+    '!status': CMD_STATUS,
+    '!clear': CMD_CLEAR,
+}
+
+# One pattern for every log format the monitor has accepted:
+#   [ 2024.01.15 18:30:45 ] CharacterName > message
+#   [2024.01.15 18:30:45] CharacterName > message
+#   [ 2024.01.15 18:30:45 ] CharacterName: message
+#   CharacterName > message
+# Whitespace is matched loosely so raw log lines need no normalising pass first.
+_LINE_RE = re.compile(
+    r'\s*(?:\[\s*(?P<timestamp>[\d.]+\s+[\d:]+)\s*\]\s*)?'
+    r'(?:(?P<speaker>[^>]+?)\s+>\s+(?P<body>.+)'
+    r'|(?(timestamp)(?P<colon_speaker>[^:]+?):\s+(?P<colon_body>.+)|(?!)))'
+)
+
+# Session header EVE writes at the top of every chat log
+_CHANNEL_HEADER_RE = re.compile(r'\s*Channel Name:\s*(?P<channel>.*\S)')
+
+
+class ChatMessage(NamedTuple):
+    """A single parsed chat log line"""
+    timestamp: Optional[str]  # EVE log time as written, e.g. '2024.01.15 18:30:45'
+    speaker: str
+    body: str
+    command: Optional[str]  # One of the CMD_* kinds, or None for ordinary chat
+
+
+def parse_chat_line(line):
+    """Parse a raw chat log line into a ChatMessage, or None if it is not a message"""
+    if '\x00' in line:
+        line = line.replace('\x00', '')
+    match = _LINE_RE.match(line)
+    if match is None:
+        return None
+
+    timestamp, speaker, body, colon_speaker, colon_body = match.groups()
+    if speaker is None:
+        speaker, body = colon_speaker, colon_body
+    body = body.strip()
+    if not body:
+        return None
+    if timestamp is not None and '  ' in timestamp:
+        timestamp = ' '.join(timestamp.split())
+
+    return ChatMessage(timestamp, ' '.join(speaker.split()), body, command_kind(body))
+
+
+def parse_channel_header(line):
+    """Channel name from a log's "Channel Name:" header line, or None for any other line"""
+    if '\x00' in line:
+        line = line.replace('\x00', '')
+    match = _CHANNEL_HEADER_RE.match(line)
+    return match.group('channel') if match else None
+
+
+def command_kind(body):
+    """Classify a message body as an admin command, a player entry, or None"""
+    first = body[0]
+    if first == '?':
+        return CMD_ENTRY
+    if first == '!':
+        return ADMIN_COMMANDS.get(body.split(None, 1)[0].lower())
+    return None
+
+
+def clean_line(line):
+    """Remove null bytes and collapse runs of whitespace in a raw log line"""
+    return ' '.join(line.replace('\x00', '').split())
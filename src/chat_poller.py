@@ -0,0 +1,200 @@
+import logging
+import os
+import threading
+import time
+
+from chat_index import channel_from_filename
+
+logger = logging.getLogger(__name__)
+
+# CHANGE_DETECTION values
+MODE_AUTO = 'auto'
+MODE_NATIVE = 'native'
+MODE_POLLING = 'polling'
+MODES = (MODE_AUTO, MODE_NATIVE, MODE_POLLING)
+
+
+class ChatLogPoller:
+    """Finds changed chat logs by polling os.stat, for folders where native file events can't be trusted
+
+    Only the active logs are stat'ed on each poll: the newest log of every
+    channel written to within active_seconds, which are the only files the
+    EVE client can still be appending to. The directory itself is listed
+    every rescan_seconds to pick up new and deleted logs. Polls run every
+    active_interval seconds while is_busy() (a game is running) and every
+    idle_interval seconds otherwise, and a poll that found changes is
+    followed by a quick one, so the first entries after "!PIR" don't wait
+    out the idle interval.
+
+    Changed logs are handed to monitor.event_queue exactly like watchdog
+    events, so the rest of the ingest path doesn't know which backend found
+    them. With standby=True (CHANGE_DETECTION=auto) the poller only checks
+    native events at the idle interval: when a log grows and the chat index
+    still hasn't seen the new size a whole poll later, native events have
+    gone quiet and the poller takes over for the rest of the session.
+    """
+
+    def __init__(self, monitor, logs_directory, is_busy=None, active_interval=0.25, idle_interval=2.0,
+                 active_seconds=6 * 3600, rescan_seconds=30.0, standby=False, on_fallback=None):
+        self.monitor = monitor
+        self.logs_directory = logs_directory
+        self.is_busy = is_busy or (lambda: False)
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.active_seconds = active_seconds
+        self.rescan_seconds = rescan_seconds
+        self.standby = standby
+        # Called once, with the path whose change native events missed, when standby gives way to polling
+        self.on_fallback = on_fallback
+        self._seen = {}  # file_path -> (mtime, size) at the last poll
+        self._active = []  # Logs stat'ed on every poll
+        self._unreported = {}  # file_path -> size seen in standby that native events hadn't delivered yet
+        self._next_rescan = 0.0
+        self._found_changes = False
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._stats = {'polls': 0, 'rescans': 0, 'changes': 0, 'last_poll_ms': 0.0}
+
+    def start(self):
+        """Start the polling thread"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="ChatLogPoller", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the polling thread, waiting up to timeout seconds for a poll in progress"""
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def mode(self):
+        """'standby' while native events are trusted, else 'polling'"""
+        return 'standby' if self.standby else MODE_POLLING
+
+    def interval(self):
+        """Seconds until the next poll: short while a game is running or chat is flowing, long otherwise"""
+        if self.standby or not (self._found_changes or self.is_busy()):
+            return self.idle_interval
+        return self.active_interval
+
+    def get_stats(self):
+        """Poll counters, the current mode and interval, and how many logs each poll stats"""
+        with self._condition:
+            stats = dict(self._stats)
+        stats['mode'] = self.mode()
+        stats['interval_s'] = self.interval()
+        stats['active_logs'] = len(self._active)
+        return stats
+
+    def poll(self):
+        """Stat the active logs (listing the directory when a rescan is due) and queue the changed ones"""
+        started = time.perf_counter()
+        changed = []
+        for file_path in self._active:
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue  # Gone; the next rescan forgets it
+            seen = (stat.st_mtime, stat.st_size)
+            if self._seen.get(file_path) != seen:
+                self._seen[file_path] = seen
+                changed.append((file_path, stat.st_size))
+        # After the active logs, so the listing can't record a change they haven't reported yet
+        if time.monotonic() >= self._next_rescan:
+            self.rescan()
+        if self.standby:
+            self._check_native(changed)
+        else:
+            for file_path, _ in changed:
+                self.monitor.event_queue.put(file_path)
+        self._found_changes = bool(changed)
+        with self._condition:
+            self._stats['polls'] += 1
+            self._stats['changes'] += len(changed)
+            self._stats['last_poll_ms'] = (time.perf_counter() - started) * 1000
+        return len(changed)
+
+    def rescan(self):
+        """List the directory once: find new and deleted logs and pick the active ones"""
+        self._next_rescan = time.monotonic() + self.rescan_seconds
+        found = {}
+        try:
+            with os.scandir(self.logs_directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.txt'):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        found[entry.path] = (stat.st_mtime, stat.st_size)
+        except OSError as e:
+            logger.error("Error scanning chat logs directory %s: %s", self.logs_directory, e)
+            return
+
+        first_scan = not self._seen
+        if not first_scan and not self.standby:
+            for file_path in self._seen.keys() - found.keys():
+                self.monitor.forget_file(file_path)
+            for file_path, seen in found.items():
+                if self._seen.get(file_path) != seen:
+                    self.monitor.event_queue.put(file_path)
+        self._seen = found
+        self._active = self.pick_active(found)
+        with self._condition:
+            self._stats['rescans'] += 1
+
+    def pick_active(self, found, now=None):
+        """Newest log per channel among those modified within active_seconds"""
+        now = time.time() if now is None else now
+        newest = {}  # channel -> (mtime, file_path)
+        for file_path, (mtime, _) in found.items():
+            if now - mtime > self.active_seconds:
+                continue
+            channel = channel_from_filename(os.path.basename(file_path))
+            if channel not in newest or mtime > newest[channel][0]:
+                newest[channel] = (mtime, file_path)
+        return [file_path for _, file_path in newest.values()]
+
+    def _check_native(self, changed):
+        """Standby: fall back to polling once native events miss a change for a whole poll"""
+        indexed_sizes = self.monitor.chat_index.sizes
+        for file_path, size in list(self._unreported.items()):
+            if indexed_sizes.get(file_path, -1) < size:
+                self._fall_back(file_path)
+                return
+            del self._unreported[file_path]
+        for file_path, size in changed:
+            if indexed_sizes.get(file_path, -1) < size:
+                self._unreported[file_path] = size
+
+    def _fall_back(self, file_path):
+        logger.warning("File events for %s never arrived; polling %s for changes from now on",
+                       os.path.basename(file_path), self.logs_directory)
+        self.standby = False
+        self._unreported.clear()
+        # Everything seen since standby began may have been missed, so read it all now
+        for path in self._active:
+            self.monitor.event_queue.put(path)
+        if self.on_fallback:
+            self.on_fallback(file_path)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error("Error polling chat logs in %s: %s", self.logs_directory, e)
+            with self._condition:
+                if not self._running:
+                    return
+                self._condition.wait(self.interval())
@@ -0,0 +1,185 @@
+import codecs
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Byte order marks, longest first so UTF-8's three bytes are checked before UTF-16's two
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+]
+
+# Bytes read from the start of a log to work out its encoding
+SNIFF_BYTES = 4096
+
+
+def sniff_encoding(head):
+    """Work out a log's encoding from its first bytes; returns (encoding, BOM length)
+
+    EVE writes chat logs as UTF-16LE with a BOM. Files without a BOM are
+    recognised as UTF-16 by their alternating zero bytes, then as UTF-8,
+    falling back to cp1252.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+
+    sample = head[:len(head) - len(head) % 2]
+    if sample:
+        zeros_odd = sample[1::2].count(0)
+        zeros_even = sample[0::2].count(0)
+        half = len(sample) // 2
+        if zeros_odd > half * 0.4 and zeros_odd > zeros_even * 4:
+            return 'utf-16-le', 0
+        if zeros_even > half * 0.4 and zeros_even > zeros_odd * 4:
+            return 'utf-16-be', 0
+
+    try:
+        # A full-size sample may end mid-character, so only its complete part has to decode
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=len(head) < SNIFF_BYTES)
+        return 'utf-8', 0
+    except UnicodeDecodeError:
+        return 'cp1252', 0
+
+
+class ChatLogTailer:
+    """Reads only the bytes appended to each chat log since the previous read
+
+    Each file's encoding is sniffed once, and an incremental decoder kept in
+    its state carries partial characters across reads, so every read after
+    the first decodes with no retries.
+    """
+
+    def __init__(self):
+        # file_path -> {'offset', 'inode', 'encoding', 'bom_length', 'decoder', 'pending'}
+        self.files = {}
+
+    def read_new_lines(self, file_path, max_bytes=None):
+        """Return the complete lines appended to file_path since the last call
+
+        With max_bytes set, at most that many bytes are consumed per call so
+        large files can be streamed in chunks.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            logger.error("Error reading chat log %s: %s", file_path, e)
+            self.forget(file_path)
+            return []
+
+        state = self.files.get(file_path)
+        if state is None or self._was_replaced(state, stat):
+            if state is not None:
+                logger.debug("Chat log rotated or truncated, re-reading from start: %s", file_path)
+            state = self._new_state(stat)
+            self.files[file_path] = state
+
+        if stat.st_size <= state['offset']:
+            return []
+
+        with open(file_path, 'rb') as f:
+            if state['decoder'] is None:
+                self._detect_encoding(state, f)
+                # Never hand the byte order mark to the decoder
+                state['offset'] = max(state['offset'], state['bom_length'])
+            to_read = stat.st_size - state['offset']
+            if max_bytes is not None:
+                to_read = min(to_read, max_bytes)
+            f.seek(state['offset'])
+            data = f.read(to_read)
+
+        state['offset'] += len(data)
+        return self._split_lines(state, state['decoder'].decode(data))
+
+    def read_tail_lines(self, file_path, tail_bytes=64 * 1024):
+        """Start tailing file_path at its end, returning the complete lines in its last tail_bytes
+
+        Only the tail of the file is read, however large the log has grown.
+        """
+        try:
+            stat = os.stat(file_path)
+        except OSError as e:
+            logger.error("Error reading chat log %s: %s", file_path, e)
+            return []
+
+        state = self._new_state(stat)
+        with open(file_path, 'rb') as f:
+            self._detect_encoding(state, f)
+            start = max(state['bom_length'], stat.st_size - tail_bytes)
+            if state['encoding'].startswith('utf-16') and (start - state['bom_length']) % 2:
+                start += 1  # Stay on a code unit boundary
+            f.seek(start)
+            data = f.read(stat.st_size - start)
+        state['offset'] = start + len(data)
+        self.files[file_path] = state
+
+        lines = self._split_lines(state, state['decoder'].decode(data))
+        if start > state['bom_length'] and lines:
+            lines.pop(0)  # Most likely the second half of a line cut by the tail boundary
+        return lines
+
+    def start_at(self, file_path, offset, inode=None):
+        """Treat everything before offset as already read, without touching the file
+
+        With inode given (e.g. from a saved checkpoint), a file that has since
+        been replaced is re-read from the start instead.
+        """
+        state = self._new_state(None)
+        state['offset'] = offset
+        state['inode'] = inode
+        self.files[file_path] = state
+
+    def forget(self, file_path):
+        """Drop the saved read position for file_path"""
+        self.files.pop(file_path, None)
+
+    def position(self, file_path):
+        """(offset, inode) just past the last complete line returned for file_path, or None if not tailed
+
+        Bytes of a partially written last line, held back until EVE
+        finishes it, are not counted, so reading again from this offset
+        starts on a line boundary.
+        """
+        state = self.files.get(file_path)
+        if state is None:
+            return None
+        offset = state['offset']
+        if state['decoder'] is not None:
+            offset -= len(state['decoder'].getstate()[0])
+            offset -= len(state['pending'].encode(state['encoding'], errors='replace'))
+        return offset, state['inode']
+
+    def _new_state(self, stat):
+        return {
+            'offset': 0,
+            'inode': stat.st_ino if stat is not None else None,
+            'encoding': None,
+            'bom_length': 0,
+            'decoder': None,
+            'pending': '',
+        }
+
+    def _was_replaced(self, state, stat):
+        """A smaller file or a new inode means the log was truncated or rotated"""
+        if state['inode'] is None:
+            # Registered without a stat; adopt the file's identity on first read
+            state['inode'] = stat.st_ino
+        return stat.st_size < state['offset'] or (stat.st_ino and stat.st_ino != state['inode'])
+
+    def _detect_encoding(self, state, f):
+        """Sniff the encoding from the head of the open file and set up its decoder"""
+        f.seek(0)
+        state['encoding'], state['bom_length'] = sniff_encoding(f.read(SNIFF_BYTES))
+        state['decoder'] = codecs.getincrementaldecoder(state['encoding'])(errors='replace')
+
+    def _split_lines(self, state, text):
+        """Split decoded text into complete lines, holding back a partially written last line"""
+        lines = (state['pending'] + text).splitlines(keepends=True)
+        if lines and not lines[-1].endswith('\n'):
+            # Keep the partially written last line until EVE finishes it (a lone "\r" may be half of "\r\n")
+            state['pending'] = lines.pop()
+        else:
+            state['pending'] = ''
+        return [line.rstrip('\r\n') for line in lines]
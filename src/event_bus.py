@@ -0,0 +1,65 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """Fans game events out to any number of subscribers, so the game engine never depends on a GUI
+
+    GameManager publishes through the same four calls it always made on the
+    GUI (update_game_status, add_participant, clear_participants and
+    update_countdown); the bus forwards each one to every subscriber that
+    implements it. Subscribers are called on the publishing thread, so they
+    must be thread-safe (the Tk GUI hands work to its main loop), and one
+    failing subscriber doesn't stop the others from being told.
+    """
+
+    EVENTS = ('update_game_status', 'add_participant', 'clear_participants', 'update_countdown')
+
+    def __init__(self):
+        self._handlers = {event: () for event in self.EVENTS}  # Replaced, never mutated, so publish needs no lock
+        self._lock = threading.Lock()
+
+    def subscribe(self, subscriber):
+        """Deliver every event subscriber has a method for"""
+        with self._lock:
+            for event in self.EVENTS:
+                handler = getattr(subscriber, event, None)
+                if handler is not None:
+                    self._handlers[event] += (handler,)
+
+    def unsubscribe(self, subscriber):
+        """Stop delivering events to subscriber"""
+        with self._lock:
+            for event in self.EVENTS:
+                self._handlers[event] = tuple(handler for handler in self._handlers[event]
+                                              if getattr(handler, '__self__', None) is not subscriber)
+
+    def publish(self, event, *args):
+        for handler in self._handlers[event]:
+            try:
+                handler(*args)
+            except Exception as e:
+                logger.error("Error in %s subscriber %s: %s", event, getattr(handler, '__qualname__', handler), e)
+
+    def update_game_status(self, message):
+        self.publish('update_game_status', message)
+
+    def add_participant(self, username, guess, channel=None, entered_at=None):
+        self.publish('add_participant', username, guess, channel, entered_at)
+
+    def clear_participants(self, channel=None):
+        self.publish('clear_participants', channel)
+
+    def update_countdown(self, game, channel=None):
+        self.publish('update_countdown', game, channel)
+
+
+class ConsoleStatus:
+    """Subscriber for headless runs: game status messages go to the log instead of a window"""
+
+    def update_game_status(self, message):
+        for line in message.splitlines():
+            if line.strip():
+                logger.info("%s", line)
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CoalescingQueue:
+    """Debounces file events: each path is handed to the worker at most once per window
+
+    Watchdog callbacks only call put(), which records the path and returns
+    immediately. A dedicated worker waits until the oldest pending path is
+    window seconds old, takes everything pending at that moment and calls
+    handler(path, queued_at) once per path, in the order the paths first
+    arrived; queued_at is the time.monotonic() of the path's first event.
+    Repeated events for a path that is already pending are merged into it.
+    """
+
+    def __init__(self, handler, window=0.05, name="CoalescingQueue"):
+        self.handler = handler
+        self.window = window
+        self.name = name
+        self._pending = {}  # path -> monotonic time of its first event in this window
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._stats = {
+            'events': 0,
+            'coalesced': 0,
+            'processed': 0,
+            'batches': 0,
+            'max_depth': 0,
+            'latency_total': 0.0,
+            'latency_max': 0.0,
+        }
+
+    def put(self, path):
+        """Queue path for processing; cheap enough to call from the observer thread"""
+        with self._condition:
+            self._stats['events'] += 1
+            if path in self._pending:
+                self._stats['coalesced'] += 1
+                return
+            self._pending[path] = time.monotonic()
+            if len(self._pending) > self._stats['max_depth']:
+                self._stats['max_depth'] = len(self._pending)
+            self._condition.notify()
+            running = self._running
+        if not running:
+            self.start()
+
+    def start(self):
+        """Start the worker thread (done automatically on first put)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the worker, waiting up to timeout seconds for the batch in hand; paths still pending are dropped"""
+        with self._condition:
+            self._running = False
+            self._pending.clear()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def depth(self):
+        """Number of distinct paths waiting to be processed"""
+        return len(self._pending)
+
+    def get_stats(self):
+        """Snapshot of event, coalescing, depth and latency counters"""
+        with self._condition:
+            stats = dict(self._stats)
+            stats['depth'] = len(self._pending)
+        latency_total = stats.pop('latency_total')
+        stats['latency_avg_ms'] = latency_total / stats['processed'] * 1000 if stats['processed'] else 0.0
+        stats['latency_max_ms'] = stats.pop('latency_max') * 1000
+        return stats
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._running:
+                    if not self._pending:
+                        self._condition.wait()
+                        continue
+                    # Let the window run out from the oldest event before draining
+                    wait = next(iter(self._pending.values())) + self.window - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._condition.wait(wait)
+                if not self._running:
+                    return
+                batch = self._pending
+                self._pending = {}
+                self._stats['batches'] += 1
+
+            for path, queued_at in batch.items():
+                try:
+                    self.handler(path, queued_at)
+                except Exception as e:
+                    logger.error("Error processing queued file %s: %s", path, e)
+                latency = time.monotonic() - queued_at
+                with self._condition:
+                    self._stats['processed'] += 1
+                    self._stats['latency_total'] += latency
+                    if latency > self._stats['latency_max']:
+                        self._stats['latency_max'] = latency
@@ -0,0 +1,181 @@
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Journal event kinds
+EVENT_START = 'start'
+EVENT_ENTRY = 'entry'
+EVENT_WINNER = 'winner'
+EVENT_STOP = 'stop'
+
+# Game fields written with a start event; datetimes are stored as ISO strings
+GAME_FIELDS = ('type', 'admin', 'range', 'range_min', 'range_max', 'target', 'start_time', 'end_time')
+_TIME_FIELDS = ('start_time', 'end_time', 'time')
+
+
+class GameJournal:
+    """Append-only JSON Lines journal of game events, so a crash mid-giveaway loses nothing
+
+    record() only appends to an in-memory batch; a background thread writes
+    the batch and fsyncs once per flush_interval (or as soon as batch_size
+    events are waiting), so ingest never waits on the disk. Events of games
+    still running are mirrored in memory, and when the file grows past
+    max_bytes it is rotated by rewriting it with just those events.
+    """
+
+    def __init__(self, path='game_journal.jsonl', flush_interval=1.0, batch_size=500, max_bytes=1024 * 1024):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self._batch = []  # Serialized lines waiting to be written
+        self._active = {}  # channel -> events of its running game, oldest first
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        self._closed = False
+
+    def record(self, event, channel, **fields):
+        """Queue one game event for channel (thread-safe, never touches the disk)"""
+        entry = {'event': event, 'channel': channel}
+        for key, value in fields.items():
+            entry[key] = value.isoformat() if isinstance(value, datetime) else value
+        with self._condition:
+            if self._closed:
+                logger.warning("Game journal %s is closed; dropped %s event for %s", self.path, event, channel)
+                return
+            if event == EVENT_START:
+                self._active[channel] = [entry]
+            elif event == EVENT_STOP:
+                self._active.pop(channel, None)
+            elif channel in self._active:
+                self._active[channel].append(entry)
+            self._batch.append(json.dumps(entry, ensure_ascii=False))
+            if len(self._batch) >= self.batch_size:
+                self._condition.notify()
+            running = self._running
+        if not running:
+            self.start()
+
+    def load_active_games(self):
+        """Rebuild the games that were still running when the journal was last written
+
+        Returns {channel: game fields} with datetimes restored and the
+        entries in order under 'entries' as (name, guess, time) tuples.
+        The journal is compacted afterwards, since finished games are no
+        longer needed.
+        """
+        active = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A torn last line from a crash mid-write; everything before it is intact
+                        logger.warning("Skipping unreadable journal line %s in %s", line_number, self.path)
+                        continue
+                    channel = entry.get('channel')
+                    event = entry.get('event')
+                    if event == EVENT_START:
+                        active[channel] = [entry]
+                    elif event == EVENT_STOP:
+                        active.pop(channel, None)
+                    elif channel in active:
+                        active[channel].append(entry)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error("Error reading game journal %s: %s", self.path, e)
+            return {}
+
+        with self._condition:
+            self._active = active
+        self.compact()
+        return {channel: self._rebuild(events) for channel, events in active.items()}
+
+    def flush(self):
+        """Write and fsync everything recorded so far"""
+        with self._write_lock:
+            with self._condition:
+                batch = self._batch
+                self._batch = []
+            if not batch:
+                return
+            try:
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write('\n'.join(batch) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+                if os.path.getsize(self.path) > self.max_bytes:
+                    self._compact_locked()
+            except Exception as e:
+                logger.error("Error writing game journal %s: %s", self.path, e)
+
+    def compact(self):
+        """Rewrite the journal with only the events of games still running"""
+        with self._write_lock:
+            try:
+                self._compact_locked()
+            except Exception as e:
+                logger.error("Error compacting game journal %s: %s", self.path, e)
+
+    def start(self):
+        """Start the background writer (done automatically on first record)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="GameJournal", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop the background writer and flush what is left; later records are refused"""
+        with self._condition:
+            self._closed = True
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _compact_locked(self):
+        # Caller holds the write lock; events still in the batch are already in _active
+        with self._condition:
+            lines = [json.dumps(entry, ensure_ascii=False)
+                     for events in self._active.values() for entry in events]
+            self._batch = []
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            if lines:
+                f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def _rebuild(self, events):
+        game = dict(events[0])
+        for field in _TIME_FIELDS:
+            if field in game:
+                game[field] = datetime.fromisoformat(game[field])
+        game['entries'] = [(entry['name'], entry['guess'], datetime.fromisoformat(entry['time']))
+                           for entry in events[1:] if entry['event'] == EVENT_ENTRY]
+        return game
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._running and len(self._batch) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                running = self._running
+            self.flush()
+            if not running:
+                return
@@ -0,0 +1,1066 @@
+import json
+import logging
+import os
+import time
+import tkinter as tk
+from datetime import datetime, timedelta
+from tkinter import ttk, messagebox
+
+from log_setup import set_debug
+from metrics import (
+    STAGE_DISPATCH, STAGE_END_TO_END, STAGE_FILE_READ, STAGE_GUI_UPDATE, STAGE_PARSE, STAGE_QUEUE_WAIT,
+)
+from status_log import StatusLog
+from virtual_tree import VirtualTreeview
+
+logger = logging.getLogger(__name__)
+
+class EVEGiveawayGUI:
+    """Tk window onto a GiveawayEngine: game status, countdown, participants, settings, history and stats
+    
+    The window subscribes to the engine's event bus like any other
+    subscriber; the engine itself knows nothing about Tk.
+    """
+    
+    # Lines of game status kept in the scrollback
+    STATUS_LOG_LINES = 500
+    # How often the stats panel refreshes
+    STATS_REFRESH_MS = 1000
+    
+    def __init__(self, engine):
+        try:
+            self.engine = engine
+            self.config_manager = engine.config_manager
+            self.history = engine.history
+            self.metrics = engine.metrics
+            self.countdown_games = {}  # channel -> game shown in the countdown
+            
+            with engine.profile.phase('window setup'):
+                self.root = tk.Tk()
+                self.root.title("EVE Online Giveaway Tool")
+                
+                # Set a minimum window size to prevent layout issues
+                self.root.minsize(800, 600)
+                
+                # Load saved window size and position
+                self.load_window_settings()
+                
+                # Setup GUI with error handling
+                try:
+                    self.setup_gui()
+                except Exception as e:
+                    logger.error("Error setting up GUI: %s", e)
+                    # Fallback to basic GUI if styling fails
+                    self.setup_basic_gui()
+            
+            # Game events reach the window from here on; recovering games, finding the logs
+            # and the backlog scan run in the background so the window shows straight away
+            self.engine.events.subscribe(self)
+            self.engine.start(background=True)
+            # Idle callbacks run once the first frame has been drawn
+            self.root.after_idle(self.engine.profile.done, 'window')
+            
+            # Bind window close event to save settings
+            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+            
+            # Ensure the window is visible and focused
+            self.root.lift()
+            self.root.focus_force()
+            
+        except Exception as e:
+            logger.error("Critical error initializing GUI: %s", e)
+            # Show error message and exit gracefully
+            if hasattr(self, 'root'):
+                messagebox.showerror("Error", f"Failed to initialize GUI: {e}")
+                self.root.destroy()
+            else:
+                logger.error("Could not create root window")
+            raise
+    
+    def setup_gui(self):
+        # Apply dark mode styling
+        self.apply_dark_mode()
+        
+        # Main frame
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid weights
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(1, weight=1)  # Game Status gets weight
+        main_frame.rowconfigure(2, weight=1)  # Participants gets weight
+        main_frame.rowconfigure(3, weight=0)  # Instructions doesn't need weight
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="🎮 EVE Online Giveaway Tool", font=("Arial", 18, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # Game status
+        status_frame = ttk.LabelFrame(main_frame, text="🎯 Game Status", padding="10")
+        status_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
+        
+        # Add settings button to status frame
+        status_header = ttk.Frame(status_frame)
+        status_header.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        settings_btn = ttk.Button(status_header, text="⚙️ Settings", command=self.show_settings)
+        settings_btn.grid(row=0, column=1, sticky=tk.E)
+        
+        history_btn = ttk.Button(status_header, text="📜 History", command=self.show_history)
+        history_btn.grid(row=0, column=2, sticky=tk.E, padx=(5, 0))
+        
+        stats_btn = ttk.Button(status_header, text="📊 Stats", command=self.show_stats)
+        stats_btn.grid(row=0, column=3, sticky=tk.E, padx=(5, 0))
+        
+        # Status text below the header
+        self.status_text = tk.Text(status_frame, height=6, width=90, font=("Consolas", 10), 
+                                  bg="#2b2b2b", fg="white", insertbackground="white")
+        self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Scrollback for the status log, which keeps the last STATUS_LOG_LINES lines
+        status_scrollbar = ttk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.status_text.yview)
+        status_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.status_text.configure(yscrollcommand=status_scrollbar.set)
+        self.status_log = StatusLog(self.status_text, max_lines=self.STATUS_LOG_LINES, metrics=self.metrics)
+        
+        # Countdown timer display
+        self.countdown_label = ttk.Label(status_frame, text="⏰ No active game", font=("Arial", 12, "bold"), foreground="white")
+        self.countdown_label.grid(row=2, column=0, pady=(5, 0))
+        
+        # Participants
+        participants_frame = ttk.LabelFrame(main_frame, text="👥 Participants", padding="10")
+        participants_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Treeview for participants with sorting
+        columns = ('Channel', 'Username', 'Guess', 'Time')
+        self.participants_tree = ttk.Treeview(participants_frame, columns=columns, show='headings', height=12)
+        
+        # Store sort direction for each column
+        self.sort_directions = {'Channel': False, 'Username': False, 'Guess': False, 'Time': False}
+        
+        for col in columns:
+            self.participants_tree.heading(col, text=col, 
+                                         command=lambda c=col: self.sort_column(c))
+            self.participants_tree.column(col, width=150 if col == 'Channel' else 200)
+        
+        self.participants_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Scrollbar for participants, driven by the virtual table rather than the Treeview
+        participants_scrollbar = ttk.Scrollbar(participants_frame, orient=tk.VERTICAL)
+        participants_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.participant_table = VirtualTreeview(self.participants_tree, participants_scrollbar,
+                                                 format_row=self.format_participant_row, metrics=self.metrics)
+        
+        # Instructions (collapsible)
+        instructions_frame = ttk.LabelFrame(main_frame, text="📖 How to Use", padding="10")
+        instructions_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        
+        # Collapse/expand button for instructions
+        self.instructions_collapsed = False
+        instructions_toggle_btn = ttk.Button(instructions_frame, text="🔽 Hide", command=lambda: self.toggle_section("instructions"))
+        instructions_toggle_btn.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        # Instructions content frame
+        self.instructions_content_frame = ttk.Frame(instructions_frame)
+        self.instructions_content_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        instructions = """🎮 ADMIN COMMANDS (use !) - Case Insensitive:
+• !PIR min-max - Start Price is Right game (closest without going over)
+  Example: !PIR 1-100, !pir 0-1000, !Pir 50-500
+• !GTN min-max - Start Guess the Number game (exact match)
+  Example: !GTN 1-100, !gtn 0-1000, !Gtn 50-500
+• !stop - End current game and select winner
+• !status - Show game status and time remaining
+• !clear - Clear current game
+
+🎯 PLAYER COMMANDS (use ?):
+• ?number - Enter current game with number
+  Example: ?50, ?100, ? 500 (space works too)
+
+🏆 GAME RULES:
+• Price is Right: Closest guess ≤ target wins
+• Guess the Number: Exact match wins
+• Multiple winners split prize if tied
+• Each chat channel runs its own game
+• Games auto-end after 2 minutes
+• Players can only enter once per game
+
+⚙️ ADMIN SETUP:
+• Edit admins.txt to add/remove admin users
+• One username per line, # for comments
+
+🔍 The tool automatically monitors EVE chat logs and updates in real-time."""
+        
+        # Make instructions copyable using Text widget
+        self.instructions_text = tk.Text(self.instructions_content_frame, height=8, width=90, font=("Consolas", 10),
+                                        bg="#2b2b2b", fg="white", insertbackground="white", wrap=tk.WORD)
+        self.instructions_text.insert(tk.END, instructions)
+        self.instructions_text.config(state=tk.DISABLED)  # Read-only but copyable
+        self.instructions_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure frame weights
+        status_frame.columnconfigure(0, weight=1)
+        status_frame.rowconfigure(0, weight=1)
+        status_frame.rowconfigure(1, weight=0)  # Countdown label doesn't need weight
+        participants_frame.columnconfigure(0, weight=1)
+        participants_frame.columnconfigure(1, weight=0)  # Scrollbar doesn't need weight
+        participants_frame.rowconfigure(0, weight=1)
+        instructions_frame.columnconfigure(0, weight=1)
+        instructions_frame.rowconfigure(1, weight=1)  # Content frame gets the weight
+        
+    def setup_basic_gui(self):
+        """Fallback GUI setup in case dark mode styling fails"""
+        logger.info("Applying basic GUI setup due to dark mode styling error.")
+        # Main frame
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure grid weights
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(1, weight=1)  # Game Status gets weight
+        main_frame.rowconfigure(2, weight=1)  # Participants gets weight
+        main_frame.rowconfigure(3, weight=0)  # Instructions doesn't need weight
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="🎮 EVE Online Giveaway Tool", font=("Arial", 18, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
+        
+        # Game status
+        status_frame = ttk.LabelFrame(main_frame, text="🎯 Game Status", padding="10")
+        status_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
+        
+        # Add settings button to status frame
+        status_header = ttk.Frame(status_frame)
+        status_header.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        settings_btn = ttk.Button(status_header, text="⚙️ Settings", command=self.show_settings)
+        settings_btn.grid(row=0, column=1, sticky=tk.E)
+        
+        history_btn = ttk.Button(status_header, text="📜 History", command=self.show_history)
+        history_btn.grid(row=0, column=2, sticky=tk.E, padx=(5, 0))
+        
+        stats_btn = ttk.Button(status_header, text="📊 Stats", command=self.show_stats)
+        stats_btn.grid(row=0, column=3, sticky=tk.E, padx=(5, 0))
+        
+        # Status text below the header
+        self.status_text = tk.Text(status_frame, height=6, width=90, font=("Consolas", 10), 
+                                  bg="#2b2b2b", fg="white", insertbackground="white")
+        self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Scrollback for the status log, which keeps the last STATUS_LOG_LINES lines
+        status_scrollbar = ttk.Scrollbar(status_frame, orient=tk.VERTICAL, command=self.status_text.yview)
+        status_scrollbar.grid(row=1, column=1, sticky=(tk.N, tk.S))
+        self.status_text.configure(yscrollcommand=status_scrollbar.set)
+        self.status_log = StatusLog(self.status_text, max_lines=self.STATUS_LOG_LINES, metrics=self.metrics)
+        
+        # Countdown timer display
+        self.countdown_label = ttk.Label(status_frame, text="⏰ No active game", font=("Arial", 12, "bold"), foreground="white")
+        self.countdown_label.grid(row=2, column=0, pady=(5, 0))
+        
+        # Participants
+        participants_frame = ttk.LabelFrame(main_frame, text="👥 Participants", padding="10")
+        participants_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Treeview for participants with sorting
+        columns = ('Channel', 'Username', 'Guess', 'Time')
+        self.participants_tree = ttk.Treeview(participants_frame, columns=columns, show='headings', height=12)
+        
+        # Store sort direction for each column
+        self.sort_directions = {'Channel': False, 'Username': False, 'Guess': False, 'Time': False}
+        
+        for col in columns:
+            self.participants_tree.heading(col, text=col, 
+                                         command=lambda c=col: self.sort_column(c))
+            self.participants_tree.column(col, width=150 if col == 'Channel' else 200)
+        
+        self.participants_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Scrollbar for participants, driven by the virtual table rather than the Treeview
+        participants_scrollbar = ttk.Scrollbar(participants_frame, orient=tk.VERTICAL)
+        participants_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.participant_table = VirtualTreeview(self.participants_tree, participants_scrollbar,
+                                                 format_row=self.format_participant_row, metrics=self.metrics)
+        
+        # Instructions (collapsible)
+        instructions_frame = ttk.LabelFrame(main_frame, text="📖 How to Use", padding="10")
+        instructions_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        
+        # Collapse/expand button for instructions
+        self.instructions_collapsed = False
+        instructions_toggle_btn = ttk.Button(instructions_frame, text="🔽 Hide", command=lambda: self.toggle_section("instructions"))
+        instructions_toggle_btn.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        # Instructions content frame
+        self.instructions_content_frame = ttk.Frame(instructions_frame)
+        self.instructions_content_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        instructions = """🎮 ADMIN COMMANDS (use !) - Case Insensitive:
+• !PIR min-max - Start Price is Right game (closest without going over)
+  Example: !PIR 1-100, !pir 0-1000, !Pir 50-500
+• !GTN min-max - Start Guess the Number game (exact match)
+  Example: !GTN 1-100, !gtn 0-1000, !Gtn 50-500
+• !stop - End current game and select winner
+• !status - Show game status and time remaining
+• !clear - Clear current game
+
+🎯 PLAYER COMMANDS (use ?):
+• ?number - Enter current game with number
+  Example: ?50, ?100, ? 500 (space works too)
+
+🏆 GAME RULES:
+• Price is Right: Closest guess ≤ target wins
+• Guess the Number: Exact match wins
+• Multiple winners split prize if tied
+• Each chat channel runs its own game
+• Games auto-end after 2 minutes
+• Players can only enter once per game
+
+⚙️ ADMIN SETUP:
+• Edit admins.txt to add/remove admin users
+• One username per line, # for comments
+
+🔍 The tool automatically monitors EVE chat logs and updates in real-time."""
+        
+        # Make instructions copyable using Text widget
+        self.instructions_text = tk.Text(self.instructions_content_frame, height=8, width=90, font=("Consolas", 10),
+                                        bg="#2b2b2b", fg="white", insertbackground="white", wrap=tk.WORD)
+        self.instructions_text.insert(tk.END, instructions)
+        self.instructions_text.config(state=tk.DISABLED)  # Read-only but copyable
+        self.instructions_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Configure frame weights
+        status_frame.columnconfigure(0, weight=1)
+        status_frame.rowconfigure(0, weight=1)
+        status_frame.rowconfigure(1, weight=0)  # Countdown label doesn't need weight
+        participants_frame.columnconfigure(0, weight=1)
+        participants_frame.columnconfigure(1, weight=0)  # Scrollbar doesn't need weight
+        participants_frame.rowconfigure(0, weight=1)
+        instructions_frame.columnconfigure(0, weight=1)
+        instructions_frame.rowconfigure(1, weight=1)  # Content frame gets the weight
+    
+    def show_settings(self):
+        """Show settings dialog for configuring EVE logs path and other options"""
+        settings_window = tk.Toplevel(self.root)
+        settings_window.title("⚙️ Settings")
+        settings_window.geometry("600x500")
+        settings_window.resizable(False, False)
+        settings_window.transient(self.root)
+        settings_window.grab_set()
+        
+        # Apply dark mode to settings window
+        self.apply_dark_mode_to_window(settings_window)
+        
+        # Center the window
+        settings_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+        
+        # Main frame
+        main_frame = ttk.Frame(settings_window, padding="30")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # Title
+        title_label = ttk.Label(main_frame, text="⚙️ EVE Giveaway Tool Settings", font=("Arial", 16, "bold"))
+        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
+        
+        # EVE Logs Path
+        path_frame = ttk.LabelFrame(main_frame, text="📁 EVE Chat Logs Path", padding="10")
+        path_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Label(path_frame, text="Path to EVE Online chat logs folder:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        self.path_var = tk.StringVar(value=self.config_manager.get_eve_logs_path() or "")
+        path_entry = ttk.Entry(path_frame, textvariable=self.path_var, width=50)
+        path_entry.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
+        
+        browse_btn = ttk.Button(path_frame, text="Browse...", command=self.browse_eve_logs_path)
+        browse_btn.grid(row=1, column=1, padx=(10, 0))
+        
+        ttk.Label(path_frame, text="Leave empty to use automatic detection", font=("Arial", 9)).grid(row=2, column=0, sticky=tk.W)
+        
+        # Game Timer
+        timer_frame = ttk.LabelFrame(main_frame, text="⏰ Game Timer", padding="10")
+        timer_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Label(timer_frame, text="Game duration in minutes:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        
+        self.timer_var = tk.StringVar(value=str(self.config_manager.get_game_timer_minutes()))
+        timer_entry = ttk.Entry(timer_frame, textvariable=self.timer_var, width=10)
+        timer_entry.grid(row=1, column=0, sticky=tk.W)
+        
+        # Debug Mode
+        debug_frame = ttk.LabelFrame(main_frame, text="🐛 Debug Mode", padding="10")
+        debug_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        self.debug_var = tk.BooleanVar(value=self.config_manager.is_debug_mode())
+        debug_check = ttk.Checkbutton(debug_frame, text="Enable debug output", variable=self.debug_var)
+        debug_check.grid(row=0, column=0, sticky=tk.W)
+        
+        # Buttons - Make sure they're visible and properly styled
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=4, column=0, columnspan=2, pady=(0, 10), sticky=(tk.W, tk.E))
+        
+        # Save button - Make it more prominent and ensure it's visible
+        save_btn = tk.Button(button_frame, text="💾 Save Settings", command=lambda: self.save_settings(settings_window), 
+                           bg="#4CAF50", fg="white", font=("Arial", 12, "bold"), 
+                           relief=tk.RAISED, bd=3, padx=20, pady=10)
+        save_btn.grid(row=0, column=0, padx=(0, 10), sticky=tk.W)
+        
+        cancel_btn = tk.Button(button_frame, text="❌ Cancel", command=settings_window.destroy,
+                             bg="#f44336", fg="white", font=("Arial", 12, "bold"),
+                             relief=tk.RAISED, bd=3, padx=20, pady=10)
+        cancel_btn.grid(row=0, column=1, sticky=tk.E)
+        
+        # Configure button frame columns to expand properly
+        button_frame.columnconfigure(0, weight=1)
+        button_frame.columnconfigure(1, weight=1)
+        
+        # Force the buttons to be visible by updating the window
+        settings_window.update()
+        
+        # Configure grid weights
+        settings_window.columnconfigure(0, weight=1)
+        settings_window.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        path_frame.columnconfigure(0, weight=1)
+        
+        # Apply dark mode styling to specific widgets after creation
+        self.apply_dark_mode_to_settings_widgets(settings_window)
+        
+        # Force update to ensure buttons are visible
+        settings_window.update_idletasks()
+    
+    # History panel periods: label -> function of now giving the start of the period (None = all time)
+    HISTORY_PERIODS = {
+        'This month': lambda now: now.replace(day=1, hour=0, minute=0, second=0, microsecond=0),
+        'Last 30 days': lambda now: now - timedelta(days=30),
+        'This year': lambda now: now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0),
+        'All time': lambda now: None,
+    }
+    
+    def show_history(self):
+        """Show the giveaway history panel for looking up a character's wins and entries"""
+        history_window = tk.Toplevel(self.root)
+        history_window.title("📜 Giveaway History")
+        history_window.geometry("650x500")
+        history_window.transient(self.root)
+        
+        # Apply dark mode to history window
+        self.apply_dark_mode_to_window(history_window)
+        history_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+        
+        main_frame = ttk.Frame(history_window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        history_window.columnconfigure(0, weight=1)
+        history_window.rowconfigure(0, weight=1)
+        
+        # Search controls
+        search_frame = ttk.LabelFrame(main_frame, text="🔍 Look up a character", padding="10")
+        search_frame.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Label(search_frame, text="Character:").grid(row=0, column=0, sticky=tk.W)
+        character_var = tk.StringVar()
+        character_entry = ttk.Entry(search_frame, textvariable=character_var, width=30)
+        character_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(5, 10))
+        
+        period_var = tk.StringVar(value='This month')
+        period_box = ttk.Combobox(search_frame, textvariable=period_var, values=list(self.HISTORY_PERIODS),
+                                  state='readonly', width=14)
+        period_box.grid(row=0, column=2, padx=(0, 10))
+        
+        results_text = tk.Text(main_frame, height=20, width=80, font=("Consolas", 10),
+                               bg="#2b2b2b", fg="white", insertbackground="white")
+        results_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        def run_query(event=None):
+            results_text.config(state=tk.NORMAL)
+            results_text.delete(1.0, tk.END)
+            results_text.insert(tk.END, self.format_history_report(character_var.get().strip(), period_var.get()))
+            results_text.config(state=tk.DISABLED)
+        
+        search_btn = ttk.Button(search_frame, text="Search", command=run_query)
+        search_btn.grid(row=0, column=3)
+        character_entry.bind('<Return>', run_query)
+        period_box.bind('<<ComboboxSelected>>', run_query)
+        
+        search_frame.columnconfigure(1, weight=1)
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(1, weight=1)
+        
+        run_query()
+        character_entry.focus_set()
+    
+    def format_history_report(self, character, period):
+        """Text for the history panel: one character's record, or the top winners when no name is given"""
+        try:
+            started = time.perf_counter()
+            since = self.HISTORY_PERIODS[period](datetime.now())
+            lines = []
+            if character:
+                wins = self.history.wins(character, since=since)
+                entries = self.history.entries(character, since=since)
+                lines.append(f"🏆 {character} won {wins} of {entries} giveaways entered ({period.lower()})")
+                recent = self.history.character_wins(character, since=since)
+                if recent:
+                    lines.append("")
+                    lines.append("Recent wins:")
+                    for win in recent:
+                        shared = f", split {win['split']} ways" if win['split'] > 1 else ""
+                        lines.append(f"  {win['start_time']}  [{win['channel'] or '-'}] {win['game_type']} "
+                                     f"guess {win['guess']} (target {win['target']}{shared})")
+            else:
+                lines.append(f"🏆 Top winners ({period.lower()}):")
+                top = self.history.top_winners(since=since)
+                for rank, (name, wins) in enumerate(top, 1):
+                    lines.append(f"  {rank:>2}. {name} - {wins} win{'s' if wins != 1 else ''}")
+                if not top:
+                    lines.append("  No finished games recorded yet")
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            lines.append("")
+            lines.append(f"(answered in {elapsed_ms:.1f} ms)")
+            return "\n".join(lines)
+        except Exception as e:
+            logger.error("Error querying giveaway history: %s", e)
+            return f"❌ Could not read giveaway history: {e}"
+    
+    # Stats panel rows: stage key -> label, in the order a chat line passes through them
+    STATS_STAGES = {
+        STAGE_QUEUE_WAIT: 'File event -> read',
+        STAGE_FILE_READ: 'File read',
+        STAGE_PARSE: 'Parse line',
+        STAGE_DISPATCH: 'Game logic',
+        STAGE_END_TO_END: 'Event -> handled',
+        STAGE_GUI_UPDATE: 'GUI frame',
+    }
+    
+    def show_stats(self):
+        """Show the live stats panel with per-stage latencies, throughput and queue depth"""
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title("📊 Ingest Stats")
+        stats_window.geometry("700x420")
+        stats_window.transient(self.root)
+        
+        # Apply dark mode to stats window
+        self.apply_dark_mode_to_window(stats_window)
+        stats_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
+        
+        main_frame = ttk.Frame(stats_window, padding="20")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        stats_window.columnconfigure(0, weight=1)
+        stats_window.rowconfigure(0, weight=1)
+        
+        stats_text = tk.Text(main_frame, height=20, width=90, font=("Consolas", 10),
+                             bg="#2b2b2b", fg="white", insertbackground="white")
+        stats_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        main_frame.columnconfigure(0, weight=1)
+        main_frame.rowconfigure(0, weight=1)
+        
+        def refresh():
+            if not stats_window.winfo_exists():
+                return
+            stats_text.config(state=tk.NORMAL)
+            stats_text.delete(1.0, tk.END)
+            stats_text.insert(tk.END, self.format_stats_report(self.metrics.snapshot()))
+            stats_text.config(state=tk.DISABLED)
+            stats_window.after(self.STATS_REFRESH_MS, refresh)
+        
+        refresh()
+    
+    def format_stats_report(self, snapshot):
+        """Text for the stats panel from a Metrics snapshot"""
+        lines = [f"{'Stage':<20}{'Count':>10}{'Avg ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Max ms':>10}"]
+        for stage, label in self.STATS_STAGES.items():
+            stage_stats = snapshot['stages'].get(stage)
+            if stage_stats is None:
+                continue
+            lines.append(f"{label:<20}{stage_stats['count']:>10,}{stage_stats['avg_ms']:>10.3f}"
+                         f"{stage_stats['p50_ms']:>10.3f}{stage_stats['p95_ms']:>10.3f}"
+                         f"{stage_stats['p99_ms']:>10.3f}{stage_stats['max_ms']:>10.3f}")
+        
+        lines.append("")
+        for name, rate in snapshot['rates'].items():
+            lines.append(f"{name.capitalize() + '/sec:':<20}{rate['per_sec']:>10.1f}   "
+                         f"(peak {rate['peak_per_sec']:,}/sec, {rate['total']:,} total)")
+        
+        queue_stats = snapshot.get('event_queue', {})
+        batch_stats = snapshot.get('batches', {})
+        lines.append("")
+        lines.append(f"File events:         {queue_stats.get('events', 0):,} "
+                     f"({queue_stats.get('coalesced', 0):,} coalesced), "
+                     f"queue depth {queue_stats.get('depth', 0)} (max {queue_stats.get('max_depth', 0)})")
+        if 'channel_workers' in snapshot:
+            lines.append(f"Channel work queued: {snapshot['channel_workers']['pending']:,}")
+        lines.append(f"Line batches:        {batch_stats.get('batches', 0):,} "
+                     f"(last {batch_stats.get('last_batch', 0)}, largest {batch_stats.get('max_batch', 0)})")
+        if 'dedup' in snapshot:
+            dedup_stats = snapshot['dedup']
+            lines.append(f"Duplicate lines:     {dedup_stats['duplicates']:,} skipped of {dedup_stats['checked']:,} "
+                         f"(multiboxed logs, {dedup_stats['keys']:,} recent messages remembered)")
+        detection = snapshot.get('change_detection')
+        if detection:
+            poller = detection.get('poller')
+            if poller:
+                lines.append(f"Change detection:    {detection['mode']}, poller {poller['mode']} "
+                             f"every {poller['interval_s']:g}s over {poller['active_logs']} log(s) "
+                             f"({poller['changes']:,} changes, last poll {poller['last_poll_ms']:.2f} ms)")
+            else:
+                lines.append(f"Change detection:    {detection['mode']}")
+        lines.append("")
+        lines.append(f"Uptime {snapshot['uptime_s']:.0f}s")
+        return "\n".join(lines)
+    
+    def browse_eve_logs_path(self):
+        """Browse for EVE logs directory"""
+        from tkinter import filedialog
+        directory = filedialog.askdirectory(title="Select EVE Chat Logs Folder")
+        if directory:
+            self.path_var.set(directory)
+    
+    def save_settings(self, settings_window):
+        """Save settings to config.txt file"""
+        try:
+            # Validate inputs
+            timer_value = self.timer_var.get().strip()
+            if not timer_value.isdigit() or int(timer_value) < 1:
+                from tkinter import messagebox
+                messagebox.showerror("Invalid Input", "Game timer must be a positive number!")
+                return
+            
+            # Validate EVE logs path if provided
+            new_path = self.path_var.get().strip()
+            if new_path and not os.path.exists(new_path):
+                from tkinter import messagebox
+                messagebox.showerror("Invalid Path", f"The path '{new_path}' does not exist!")
+                return
+            
+            if new_path and not os.path.isdir(new_path):
+                from tkinter import messagebox
+                messagebox.showerror("Invalid Path", f"The path '{new_path}' is not a directory!")
+                return
+            
+            # Check if path contains any .txt files
+            if new_path:
+                txt_files = [f for f in os.listdir(new_path) if f.endswith('.txt')]
+                if not txt_files:
+                    from tkinter import messagebox
+                    result = messagebox.askyesno("No Chat Logs", 
+                        f"The directory '{new_path}' contains no .txt files.\n\n"
+                        "This might not be an EVE chat logs directory.\n\n"
+                        "Do you want to continue anyway?")
+                    if not result:
+                        return
+            
+            # Read existing config or create new
+            config_lines = []
+            if os.path.exists('config.txt'):
+                with open('config.txt', 'r', encoding='utf-8') as f:
+                    config_lines = f.readlines()
+            
+            # Update or add settings
+            new_lines = []
+            settings_updated = {'EVE_LOGS_PATH': False, 'GAME_TIMER_MINUTES': False, 'DEBUG_MODE': False}
+            
+            for line in config_lines:
+                if line.startswith('EVE_LOGS_PATH='):
+                    new_lines.append(f"EVE_LOGS_PATH={self.path_var.get()}\n")
+                    settings_updated['EVE_LOGS_PATH'] = True
+                elif line.startswith('GAME_TIMER_MINUTES='):
+                    new_lines.append(f"GAME_TIMER_MINUTES={timer_value}\n")
+                    settings_updated['GAME_TIMER_MINUTES'] = True
+                elif line.startswith('DEBUG_MODE='):
+                    new_lines.append(f"DEBUG_MODE={str(self.debug_var.get()).lower()}\n")
+                    settings_updated['DEBUG_MODE'] = True
+                else:
+                    new_lines.append(line)
+            
+            # Add new settings if they didn't exist
+            if not settings_updated['EVE_LOGS_PATH']:
+                new_lines.append(f"EVE_LOGS_PATH={self.path_var.get()}\n")
+            if not settings_updated['GAME_TIMER_MINUTES']:
+                new_lines.append(f"GAME_TIMER_MINUTES={timer_value}\n")
+            if not settings_updated['DEBUG_MODE']:
+                new_lines.append(f"DEBUG_MODE={str(self.debug_var.get()).lower()}\n")
+            
+            # Write updated config
+            with open('config.txt', 'w', encoding='utf-8') as f:
+                f.writelines(new_lines)
+            
+            # Reload config
+            self.config_manager.load_config()
+            set_debug(self.config_manager.is_debug_mode())
+            
+            # Restart monitoring with new path if it changed
+            old_path = self.config_manager.get_eve_logs_path()
+            if new_path != old_path:
+                self.engine.restart_monitoring(new_path)
+            
+            # Show success message
+            from tkinter import messagebox
+            messagebox.showinfo("Settings Saved", "Settings have been saved successfully!\n\nMonitoring has been updated to use the new path.")
+            
+            # Close the settings window
+            settings_window.destroy()
+            
+        except Exception as e:
+            from tkinter import messagebox
+            messagebox.showerror("Error", f"Failed to save settings: {e}")
+            logger.error("Error saving settings: %s", e, exc_info=True)
+    
+    def toggle_section(self, section):
+        """Toggle the visibility of a section (collapse/expand)"""
+        if section == "instructions":
+            if self.instructions_collapsed:
+                # Expand
+                self.instructions_content_frame.grid()
+                self.instructions_collapsed = False
+                # Update button text
+                for child in self.instructions_content_frame.master.winfo_children():
+                    if isinstance(child, ttk.Button):
+                        child.config(text="🔽 Hide")
+            else:
+                # Collapse
+                self.instructions_content_frame.grid_remove()
+                self.instructions_collapsed = True
+                # Update button text
+                for child in self.instructions_content_frame.master.winfo_children():
+                    if isinstance(child, ttk.Button):
+                        child.config(text="▶️ Show")
+    
+    def apply_dark_mode(self):
+        """Apply dark mode styling to the application"""
+        try:
+            # Configure ttk styles for dark mode
+            style = ttk.Style()
+            
+            # Try to use clam theme, fallback to default if not available
+            try:
+                style.theme_use('clam')  # Use clam theme as base
+            except Exception as e:
+                logger.warning("'clam' theme not available: %s", e)
+            
+            # Configure the root window
+            try:
+                self.root.configure(bg="#1e1e1e")
+            except Exception as e:
+                logger.warning("Could not set root background: %s", e)
+            
+            # Configure frame styles with error handling
+            try:
+                style.configure('TFrame', background='#1e1e1e')
+                style.configure('TLabelframe', background='#1e1e1e', foreground='white')
+                style.configure('TLabelframe.Label', background='#1e1e1e', foreground='white')
+                style.configure('TLabel', background='#1e1e1e', foreground='white')
+            except Exception as e:
+                logger.warning("Could not configure frame/label styles: %s", e)
+            
+            # Configure button styles with error handling
+            try:
+                style.configure('TButton', background='#404040', foreground='white')
+                style.map('TButton', 
+                         background=[('active', '#505050'), ('pressed', '#303030')],
+                         foreground=[('active', 'white'), ('pressed', 'white')])
+            except Exception as e:
+                logger.warning("Could not configure button styles: %s", e)
+            
+            # Configure treeview styles with error handling
+            try:
+                style.configure('Treeview', background='#2b2b2b', foreground='white', fieldbackground='#2b2b2b')
+                style.configure('Treeview.Heading', background='#404040', foreground='white')
+                style.map('Treeview', 
+                         background=[('selected', '#505050')],
+                         foreground=[('selected', 'white')])
+            except Exception as e:
+                logger.warning("Could not configure treeview styles: %s", e)
+            
+            # Configure scrollbar styles with error handling
+            try:
+                style.configure('Vertical.TScrollbar', background='#404040', troughcolor='#2b2b2b')
+                style.map('Vertical.TScrollbar', 
+                         background=[('active', '#505050'), ('pressed', '#303030')])
+            except Exception as e:
+                logger.warning("Could not configure scrollbar styles: %s", e)
+            
+            # Configure additional dark mode styles for settings window
+            try:
+                style.configure('Dark.TLabelframe', background='#1e1e1e', foreground='white')
+                style.configure('Dark.TLabelframe.Label', background='#1e1e1e', foreground='white')
+                style.configure('Dark.TLabel', background='#1e1e1e', foreground='white')
+                style.configure('Dark.TButton', background='#404040', foreground='white')
+                style.configure('Dark.TEntry', fieldbackground='#2b2b2b', foreground='white', insertbackground='white')
+                style.configure('Dark.TCheckbutton', background='#1e1e1e', foreground='white')
+                
+                # Force Entry widget styling
+                style.map('Dark.TEntry',
+                         fieldbackground=[('readonly', '#2b2b2b'), ('focus', '#2b2b2b')],
+                         foreground=[('readonly', 'white'), ('focus', 'white')])
+                
+                # Force Button widget styling
+                style.map('Dark.TButton',
+                         background=[('active', '#505050'), ('pressed', '#303030')],
+                         foreground=[('active', 'white'), ('pressed', 'white')])
+                
+            except Exception as e:
+                logger.warning("Could not configure dark mode styles: %s", e)
+                
+        except Exception as e:
+            logger.warning("Could not apply dark mode styling: %s", e)
+            logger.info("Using default system styling instead.")
+    
+    def apply_dark_mode_to_window(self, window):
+        """Apply dark mode styling to a specific window (like settings)"""
+        try:
+            # Configure the window background
+            try:
+                window.configure(bg="#1e1e1e")
+            except Exception as e:
+                logger.warning("Could not set window background: %s", e)
+            
+            # Apply dark mode to all child widgets recursively
+            self.apply_dark_mode_to_widgets(window)
+            
+        except Exception as e:
+            logger.warning("Could not apply dark mode to window: %s", e)
+    
+    def apply_dark_mode_to_widgets(self, parent):
+        """Recursively apply dark mode to all child widgets"""
+        try:
+            for child in parent.winfo_children():
+                try:
+                    # Apply dark mode based on widget type
+                    if isinstance(child, tk.Label):
+                        child.configure(bg="#1e1e1e", fg="white")
+                    elif isinstance(child, tk.Entry):
+                        child.configure(bg="#2b2b2b", fg="white", insertbackground="white")
+                    elif isinstance(child, tk.Checkbutton):
+                        child.configure(bg="#1e1e1e", fg="white", selectcolor="#404040")
+                    elif isinstance(child, tk.Button):
+                        child.configure(bg="#404040", fg="white", activebackground="#505050", activeforeground="white")
+                    elif isinstance(child, tk.Frame) or isinstance(child, ttk.Frame):
+                        child.configure(bg="#1e1e1e")
+                    elif isinstance(child, ttk.LabelFrame):
+                        child.configure(style='Dark.TLabelframe')
+                    elif isinstance(child, ttk.Label):
+                        child.configure(style='Dark.TLabel')
+                    elif isinstance(child, ttk.Button):
+                        child.configure(style='Dark.TButton')
+                    elif isinstance(child, ttk.Entry):
+                        child.configure(style='Dark.TCheckbutton')
+                except Exception as e:
+                    # Continue with other widgets if one fails
+                    pass
+                
+                # Recursively apply to children
+                self.apply_dark_mode_to_widgets(child)
+                
+        except Exception as e:
+            logger.warning("Could not apply dark mode to widgets: %s", e)
+    
+    def apply_dark_mode_to_settings_widgets(self, settings_window):
+        """Apply dark mode specifically to settings window widgets"""
+        try:
+            # Find and style the Entry widgets specifically
+            for widget in settings_window.winfo_children():
+                if isinstance(widget, ttk.Frame):
+                    for child in widget.winfo_children():
+                        if isinstance(child, ttk.LabelFrame):
+                            for grandchild in child.winfo_children():
+                                if isinstance(grandchild, ttk.Entry):
+                                    # Force dark styling for Entry widgets
+                                    grandchild.configure(style='Dark.TEntry')
+                                    # Also try direct configuration as fallback
+                                    try:
+                                        grandchild.configure(background="#2b2b2b", foreground="white", insertbackground="white")
+                                    except:
+                                        pass
+                                elif isinstance(grandchild, ttk.Button):
+                                    grandchild.configure(style='Dark.TButton')
+                                elif isinstance(grandchild, ttk.Label):
+                                    grandchild.configure(style='Dark.TLabel')
+                                elif isinstance(grandchild, ttk.Checkbutton):
+                                    grandchild.configure(style='Dark.TCheckbutton')
+                        elif isinstance(child, ttk.Button):
+                            child.configure(style='Dark.TButton')
+                        elif isinstance(child, ttk.Label):
+                            child.configure(style='Dark.TLabel')
+            
+            # Ensure the button frame is visible
+            button_frame = None
+            for widget in settings_window.winfo_children():
+                if isinstance(widget, ttk.Frame):
+                    for child in widget.winfo_children():
+                        if isinstance(child, ttk.Frame) and len(child.winfo_children()) > 0:
+                            # Check if this is the button frame (has buttons)
+                            for grandchild in child.winfo_children():
+                                if isinstance(grandchild, ttk.Button) and "Save" in grandchild.cget("text"):
+                                    button_frame = child
+                                    break
+                            if button_frame:
+                                break
+                    if button_frame:
+                        break
+            
+            if button_frame:
+                # Make sure button frame is visible and properly styled
+                button_frame.configure(style='Dark.TFrame')
+                logger.debug("Button frame found and styled")
+            else:
+                logger.debug("Button frame not found")
+                
+        except Exception as e:
+            logger.warning("Could not apply dark mode to settings widgets: %s", e, exc_info=True)
+    
+    # Typed sort keys for participant rows (channel, username, guess, entry datetime)
+    PARTICIPANT_SORT_KEYS = {
+        'Channel': lambda row: row[0].lower(),
+        'Username': lambda row: row[1].lower(),
+        'Guess': lambda row: row[2],
+        'Time': lambda row: row[3],
+    }
+    
+    def format_participant_row(self, row):
+        """Display values for a participant row; only called for visible rows"""
+        channel, username, guess, entered_at = row
+        return (channel, username, guess, entered_at.strftime('%H:%M:%S'))
+    
+    def sort_column(self, column):
+        """Sort the participants table by the specified column"""
+        # Toggle the direction: the first click sorts ascending
+        ascending = not self.sort_directions[column]
+        for col in self.sort_directions:
+            self.sort_directions[col] = False
+        self.sort_directions[column] = ascending
+        
+        # Sorting happens on the in-memory rows; orders are cached per column
+        self.participant_table.sort(column, self.PARTICIPANT_SORT_KEYS[column], reverse=not ascending)
+        
+        # Show the direction on the sorted column only, rebuilding labels from the column names
+        for col in self.sort_directions:
+            text = col
+            if col == column:
+                text = f"{col} {'↓' if ascending else '↑'}"
+            self.participants_tree.heading(col, text=text)
+    
+    def update_game_status(self, message):
+        """Thread-safe game status update"""
+        if hasattr(self, 'status_log'):
+            # Appended to the scrollback and drawn with the next batched frame
+            self.status_log.append(message)
+    
+    
+    def update_countdown(self, game, channel=None):
+        """Thread-safe countdown refresh, driven by the game managers' scheduler ticks"""
+        if hasattr(self, 'root') and self.root:
+            self.root.after(0, self._update_countdown_safe, game, channel)
+    
+    def _update_countdown_safe(self, game, channel=None):
+        """Internal method to update the countdown label (called from main thread)"""
+        try:
+            if game and game['active']:
+                self.countdown_games[channel] = game
+            else:
+                self.countdown_games.pop(channel, None)
+            
+            if not self.countdown_games:
+                self.countdown_label.config(text="⏰ No active game", foreground="#9e9e9e")  # Light gray
+                return
+            
+            # One entry per channel with a running game; the colour follows the game ending soonest
+            now = datetime.now()
+            parts = []
+            soonest = None
+            for game_channel, running_game in sorted(self.countdown_games.items(), key=lambda item: item[1]['end_time']):
+                # Round to the nearest second; ticks land on whole seconds of remaining time
+                seconds_left = round((running_game['end_time'] - now).total_seconds())
+                if soonest is None:
+                    soonest = seconds_left
+                if seconds_left > 0:
+                    remaining = f"{seconds_left // 60:02d}:{seconds_left % 60:02d}"
+                else:
+                    remaining = "ended!"
+                parts.append(f"{game_channel} {remaining}" if game_channel else remaining)
+            
+            if len(parts) == 1 and soonest > 0:
+                time_str = f"⏰ Game ends in: {parts[0]}"
+            elif len(parts) == 1:
+                time_str = "⏰ Game ended!"
+            else:
+                time_str = "⏰ " + " | ".join(parts)
+            
+            # Color coding: red when less than 1 minute, orange when less than 2 minutes
+            if soonest <= 0:
+                self.countdown_label.config(foreground="#9e9e9e")  # Light gray
+            elif soonest < 60:
+                self.countdown_label.config(foreground="#ff6b6b")  # Light red
+            elif soonest < 120:
+                self.countdown_label.config(foreground="#ffa726")  # Light orange
+            else:
+                self.countdown_label.config(foreground="#66bb6a")  # Light green
+            
+            self.countdown_label.config(text=time_str)
+        except Exception as e:
+            logger.error("Error updating countdown: %s", e)
+    
+    def add_participant(self, username, guess, channel=None, entered_at=None):
+        """Thread-safe participant addition, shown with the next batched table frame"""
+        if hasattr(self, 'participant_table'):
+            # Restored entries keep the time they were made, not the time they were restored
+            self.participant_table.add((channel or '', username, guess, entered_at or datetime.now()))
+    
+    def clear_participants(self, channel=None):
+        """Thread-safe participant clearing, for one channel or for all of them"""
+        if hasattr(self, 'participant_table'):
+            if channel is None:
+                self.participant_table.clear()
+            else:
+                self.participant_table.clear(lambda row: row[0] == channel)
+    
+    def load_window_settings(self):
+        """Load saved window size and position from settings file"""
+        try:
+            if os.path.exists('window_settings.json'):
+                with open('window_settings.json', 'r') as f:
+                    settings = json.load(f)
+                    geometry = settings.get('geometry', '1200x800')
+                    x = settings.get('x', 100)
+                    y = settings.get('y', 100)
+                    self.root.geometry(geometry)
+                    self.root.geometry(f"+{x}+{y}")
+            else:
+                # Default size if no settings file
+                self.root.geometry("1200x800+100+100")
+        except Exception as e:
+            logger.error("Error loading window settings: %s", e)
+            # Fallback to default size
+            self.root.geometry("1200x800+100+100")
+    
+    def save_window_settings(self):
+        """Save current window size and position to settings file"""
+        try:
+            geometry = self.root.geometry()
+            x = self.root.winfo_x()
+            y = self.root.winfo_y()
+            
+            settings = {
+                'geometry': geometry,
+                'x': x,
+                'y': y
+            }
+            
+            with open('window_settings.json', 'w') as f:
+                json.dump(settings, f)
+        except Exception as e:
+            logger.error("Error saving window settings: %s", e)
+    
+    def on_closing(self):
+        """Handle window closing - save settings and cleanup"""
+        self.save_window_settings()
+        self.engine.events.unsubscribe(self)
+        self.engine.stop()
+        self.root.destroy()
+    
+    def run(self):
+        self.root.mainloop()
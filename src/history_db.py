@@ -0,0 +1,218 @@
+import logging
+import queue
+import sqlite3
+import threading
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+# Stored as text in this format so dates compare and index correctly as strings
+_DB_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    channel TEXT,
+    game_type TEXT NOT NULL,
+    admin TEXT COLLATE NOCASE,
+    range_min INTEGER,
+    range_max INTEGER,
+    target INTEGER,
+    start_time TEXT NOT NULL,
+    end_time TEXT,
+    ended_at TEXT,
+    outcome TEXT,
+    participant_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS participants (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    character TEXT NOT NULL COLLATE NOCASE,
+    guess INTEGER,
+    entered_at TEXT
+);
+CREATE TABLE IF NOT EXISTS winners (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    character TEXT NOT NULL COLLATE NOCASE,
+    guess INTEGER,
+    split INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS idx_games_start_time ON games(start_time);
+CREATE INDEX IF NOT EXISTS idx_games_type_start_time ON games(game_type, start_time);
+CREATE INDEX IF NOT EXISTS idx_participants_character ON participants(character, game_id);
+CREATE INDEX IF NOT EXISTS idx_participants_game ON participants(game_id);
+CREATE INDEX IF NOT EXISTS idx_winners_character ON winners(character, game_id);
+CREATE INDEX IF NOT EXISTS idx_winners_game ON winners(game_id);
+"""
+
+
+def _db_time(value):
+    return value.strftime(_DB_TIME_FORMAT) if isinstance(value, datetime) else value
+
+
+def _period_clause(since, until, game_type, params):
+    """SQL conditions on games g for an optional [since, until) window and game type"""
+    clause = ""
+    if since is not None:
+        clause += " AND g.start_time >= ?"
+        params.append(_db_time(since))
+    if until is not None:
+        clause += " AND g.start_time < ?"
+        params.append(_db_time(until))
+    if game_type:
+        clause += " AND g.game_type = ?"
+        params.append(game_type)
+    return clause
+
+
+class GameHistory:
+    """SQLite record of every finished game, its participants and its winners
+
+    record_game() only queues the game; one writer thread owns the write
+    connection and inserts whatever has queued up in a single transaction.
+    Queries use their own connection, and WAL mode lets them run while the
+    writer commits. Characters are matched case-insensitively, as in EVE.
+    """
+
+    def __init__(self, path='giveaway_history.db'):
+        self.path = path
+        self._queue = queue.Queue()
+        self._thread = None
+        self._read_connection = None
+        self._read_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._closed = False
+
+    def record_game(self, game, winner, outcome, ended_at=None):
+        """Queue a finished game (a GameManager game dict) with its winner result for storage"""
+        participants = [(name, entry['guess'], _db_time(entry['time'])) for name, entry in game['participants'].items()]
+        if winner is None:
+            winners = []
+        else:
+            names = winner.get('names') or [winner['name']]
+            winners = [(name, winner['guess'], len(names)) for name in names]
+        row = (
+            game.get('channel'), game['type'], game['admin'], game.get('range_min'), game.get('range_max'),
+            game['target'], _db_time(game['start_time']), _db_time(game['end_time']),
+            _db_time(ended_at or datetime.now()), outcome, len(participants),
+        )
+        with self._start_lock:
+            if self._closed:
+                logger.warning("Giveaway history %s is closed; dropped %s game started %s", self.path, row[1], row[6])
+                return
+        if self._thread is None:
+            self.start()
+        self._queue.put((row, participants, winners))
+
+    def start(self):
+        """Create the schema and start the writer thread (done automatically on first record)"""
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="GameHistory", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Write everything queued, then stop the writer; later records are refused"""
+        with self._start_lock:
+            self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=30)
+            if self._thread.is_alive():
+                logger.warning("Giveaway history still writing to %s at shutdown", self.path)
+            self._thread = None
+        with self._read_lock:
+            if self._read_connection is not None:
+                self._read_connection.close()
+                self._read_connection = None
+
+    def wins(self, character, since=None, until=None, game_type=None):
+        """How many games character won (shared wins included) between since and until"""
+        params = [character]
+        sql = ("SELECT COUNT(*) FROM winners w JOIN games g ON g.id = w.game_id WHERE w.character = ?"
+               + _period_clause(since, until, game_type, params))
+        return self._query(sql, params)[0][0]
+
+    def entries(self, character, since=None, until=None, game_type=None):
+        """How many games character entered between since and until"""
+        params = [character]
+        sql = ("SELECT COUNT(*) FROM participants p JOIN games g ON g.id = p.game_id WHERE p.character = ?"
+               + _period_clause(since, until, game_type, params))
+        return self._query(sql, params)[0][0]
+
+    def character_wins(self, character, since=None, until=None, limit=20):
+        """Most recent wins of character as dicts (start_time, channel, game_type, guess, target, split)"""
+        params = [character]
+        sql = ("SELECT g.start_time, g.channel, g.game_type, w.guess, g.target, w.split "
+               "FROM winners w JOIN games g ON g.id = w.game_id WHERE w.character = ?"
+               + _period_clause(since, until, None, params)
+               + " ORDER BY g.start_time DESC LIMIT ?")
+        params.append(limit)
+        keys = ('start_time', 'channel', 'game_type', 'guess', 'target', 'split')
+        return [dict(zip(keys, row)) for row in self._query(sql, params)]
+
+    def top_winners(self, since=None, until=None, game_type=None, limit=10):
+        """(character, wins) pairs for the characters with most wins, best first"""
+        params = []
+        sql = ("SELECT w.character, COUNT(*) AS total FROM winners w JOIN games g ON g.id = w.game_id WHERE 1 = 1"
+               + _period_clause(since, until, game_type, params)
+               + " GROUP BY w.character ORDER BY total DESC, w.character LIMIT ?")
+        params.append(limit)
+        return self._query(sql, params)
+
+    def recent_games(self, limit=20):
+        """Most recently started games as dicts, newest first"""
+        keys = ('id', 'channel', 'game_type', 'admin', 'target', 'start_time', 'outcome', 'participant_count')
+        rows = self._query("SELECT " + ", ".join(keys) + " FROM games ORDER BY start_time DESC LIMIT ?", [limit])
+        return [dict(zip(keys, row)) for row in rows]
+
+    def _query(self, sql, params):
+        with self._read_lock:
+            if self._read_connection is None:
+                self._read_connection = self._connect()
+            return self._read_connection.execute(sql, params).fetchall()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _run(self):
+        try:
+            connection = self._connect()
+        except Exception as e:
+            logger.error("Error opening giveaway history %s: %s", self.path, e)
+            return
+        while True:
+            batch = [self._queue.get()]
+            # Everything that queued up meanwhile goes into the same transaction
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = None in batch
+            games = [item for item in batch if item is not None]
+            if games:
+                try:
+                    with connection:
+                        for row, participants, winners in games:
+                            cursor = connection.execute(
+                                "INSERT INTO games (channel, game_type, admin, range_min, range_max, target, "
+                                "start_time, end_time, ended_at, outcome, participant_count) "
+                                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+                            game_id = cursor.lastrowid
+                            connection.executemany(
+                                "INSERT INTO participants (game_id, character, guess, entered_at) VALUES (?, ?, ?, ?)",
+                                [(game_id,) + participant for participant in participants])
+                            connection.executemany(
+                                "INSERT INTO winners (game_id, character, guess, split) VALUES (?, ?, ?, ?)",
+                                [(game_id,) + winner for winner in winners])
+                    logger.debug("Saved %s game(s) to history", len(games))
+                except Exception as e:
+                    logger.error("Error saving games to history: %s", e)
+            if stopping:
+                connection.close()
+                return
@@ -0,0 +1,59 @@
+import logging
+import logging.handlers
+import queue
+
+LOG_FORMAT = '%(asctime)s %(levelname)-7s %(threadName)s %(name)s: %(message)s'
+CONSOLE_FORMAT = '%(levelname)s: %(message)s'
+
+_listener = None
+
+
+def configure_logging(debug=False, log_file='giveaway.log', max_bytes=1024 * 1024, backup_count=3, console=True):
+    """Route all logging through a background queue to the console and a rotating log file
+
+    Callers only pay for putting a record on a queue; formatting and I/O
+    happen on the listener thread. With debug off the level is INFO, so
+    logger.debug() calls return before their message is ever formatted.
+    Safe to call again (e.g. after the settings change); the previous
+    listener is stopped first.
+    """
+    global _listener
+    shutdown_logging()
+
+    handlers = []
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+        handlers.append(console_handler)
+    if log_file:
+        try:
+            file_handler = logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes,
+                                                                backupCount=backup_count, encoding='utf-8')
+            file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            handlers.append(file_handler)
+        except OSError as e:
+            print(f"Warning: Could not open log file {log_file}: {e}")
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    set_debug(debug)
+
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def set_debug(enabled):
+    """Switch debug output on or off without restarting the log listener"""
+    logging.getLogger().setLevel(logging.DEBUG if enabled else logging.INFO)
+
+
+def shutdown_logging():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
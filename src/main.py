@@ -1,16 +1,47 @@
-import tkinter as tk
-from tkinter import ttk, messagebox
+import time
+
+# Taken before anything else is imported, so --profile-startup can include the imports
+STARTED = time.perf_counter()
+
+import argparse
 import os
 import re
 import random
-import time
-import sys
-from datetime import datetime, timedelta
-from watchdog.observers import Observer
+from datetime import datetime, timedelta, timezone
 from watchdog.events import FileSystemEventHandler
 import threading
-import json
 import configparser
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from admin_registry import AdminRegistry
+from channel_workers import ChannelWorkerPool
+from chat_index import ChatLogIndex, channel_from_filename
+from chat_parser import (
+    CMD_CLEAR, CMD_ENTRY, CMD_GTN, CMD_PIR, CMD_STATUS, CMD_STOP, EVE_TIMESTAMP_FORMAT,
+    clean_line, parse_channel_header, parse_chat_line,
+)
+from chat_poller import MODE_AUTO, MODE_NATIVE, MODE_POLLING, MODES as CHANGE_DETECTION_MODES, ChatLogPoller
+from chat_tail import ChatLogTailer
+from event_bus import ConsoleStatus, EventBus
+from event_queue import CoalescingQueue
+from game_journal import (
+    EVENT_ENTRY, EVENT_START, EVENT_STOP, EVENT_WINNER, GAME_FIELDS as JOURNAL_GAME_FIELDS, GameJournal,
+)
+from history_db import GameHistory
+from log_setup import configure_logging, shutdown_logging
+from message_dedup import MessageDeduplicator, line_timestamp
+from metrics import (
+    RATE_ENTRIES, RATE_LINES, STAGE_DISPATCH, STAGE_END_TO_END, STAGE_FILE_READ, STAGE_PARSE, STAGE_QUEUE_WAIT,
+    Metrics,
+)
+from participant_store import ParticipantStore
+from read_checkpoints import ReadCheckpoints
+from scheduler import DeadlineScheduler
+from startup_profile import StartupProfile
+
+logger = logging.getLogger(__name__)
 
 class ConfigManager:
     """Manages application configuration from config.txt file"""
@@ -22,6 +53,17 @@ class ConfigManager:
     
     def load_config(self):
         """Load configuration from config.txt file"""
+        # Defaults for anything the file leaves out
+        self.eve_logs_path = None
+        self.game_timer_minutes = 2
+        self.debug_mode = False
+        self.startup_scan_hours = 6
+        self.startup_files_per_channel = 2
+        self.metrics_snapshot_seconds = 10
+        self.change_detection = MODE_AUTO
+        self.poll_active_seconds = 0.25
+        self.poll_idle_seconds = 2.0
+        self.other_config = {}
         try:
             if os.path.exists(self.config_file):
                 # Read as regular text file since it's not standard INI format
@@ -45,19 +87,42 @@ class ConfigManager:
                                 self.game_timer_minutes = 2
                         elif key == 'DEBUG_MODE':
                             self.debug_mode = value.lower() == 'true'
+                        elif key == 'STARTUP_SCAN_HOURS':
+                            try:
+                                self.startup_scan_hours = float(value)
+                            except ValueError:
+                                self.startup_scan_hours = 6
+                        elif key == 'STARTUP_FILES_PER_CHANNEL':
+                            try:
+                                self.startup_files_per_channel = int(value)
+                            except ValueError:
+                                self.startup_files_per_channel = 2
+                        elif key == 'METRICS_SNAPSHOT_SECONDS':
+                            try:
+                                self.metrics_snapshot_seconds = float(value)
+                            except ValueError:
+                                self.metrics_snapshot_seconds = 10
+                        elif key == 'CHANGE_DETECTION':
+                            if value.lower() in CHANGE_DETECTION_MODES:
+                                self.change_detection = value.lower()
+                            else:
+                                logger.warning("Unknown CHANGE_DETECTION '%s', using %s", value, MODE_AUTO)
+                        elif key == 'POLL_ACTIVE_SECONDS':
+                            try:
+                                self.poll_active_seconds = max(float(value), 0.05)
+                            except ValueError:
+                                self.poll_active_seconds = 0.25
+                        elif key == 'POLL_IDLE_SECONDS':
+                            try:
+                                self.poll_idle_seconds = max(float(value), 0.05)
+                            except ValueError:
+                                self.poll_idle_seconds = 2.0
                         else:
                             # Store other config values
-                            if not hasattr(self, 'other_config'):
-                                self.other_config = {}
                             self.other_config[key] = value
-            else:
-                # Default values if no config file
-                self.eve_logs_path = None
-                self.game_timer_minutes = 2
-                self.debug_mode = False
                 
         except Exception as e:
-            print(f"Warning: Could not load config file: {e}")
+            logger.warning("Could not load config file: %s", e)
             # Fallback to defaults
             self.eve_logs_path = None
             self.game_timer_minutes = 2
@@ -74,15 +139,76 @@ class ConfigManager:
     def is_debug_mode(self):
         """Check if debug mode is enabled"""
         return self.debug_mode
+    
+    def get_startup_scan_hours(self):
+        """Only logs modified within this many hours are read at startup (0 = no limit)"""
+        return self.startup_scan_hours
+    
+    def get_startup_files_per_channel(self):
+        """Newest logs per channel read at startup (0 = no limit)"""
+        return self.startup_files_per_channel
+    
+    def get_metrics_snapshot_seconds(self):
+        """Seconds between metrics.json snapshots (0 = don't write them)"""
+        return self.metrics_snapshot_seconds
+    
+    def get_change_detection(self):
+        """How changed logs are found: 'native' file events, 'polling', or 'auto' (native, polling if it goes quiet)"""
+        return self.change_detection
+    
+    def get_poll_active_seconds(self):
+        """Seconds between polls while a game is running"""
+        return self.poll_active_seconds
+    
+    def get_poll_idle_seconds(self):
+        """Seconds between polls while no game is running"""
+        return self.poll_idle_seconds
 
 class EVEChatMonitor(FileSystemEventHandler):
-    def __init__(self, game_manager, eve_logs_path=None):
-        self.game_manager = game_manager
-        if eve_logs_path:
-            self.eve_logs_path = eve_logs_path
-        else:
-            self.eve_logs_path = self.detect_eve_logs_path()
+    # Command kind -> (GameManager method, whether it takes the message body)
+    COMMAND_HANDLERS = {
+        CMD_PIR: ('start_pir_game', True),
+        CMD_GTN: ('start_gtn_game', True),
+        CMD_STOP: ('stop_game', False),
+        CMD_STATUS: ('show_status', False),
+        CMD_CLEAR: ('clear_game', False),
+        CMD_ENTRY: ('enter_game', True),
+    }
+    
+    # Header lines at the top of a log that may carry "Channel Name:", and enough bytes to hold them
+    HEADER_LINES = 15
+    HEADER_BYTES = 4096
+    
+    def __init__(self, game_manager_factory, eve_logs_path=None, workers=4, metrics=None, checkpoints=None,
+                 dedup=None):
+        # Every channel gets its own GameManager, created on its first message
+        self.create_game_manager = game_manager_factory
+        self.game_managers = {}  # channel -> GameManager
+        self.file_channels = {}  # file_path -> channel its messages belong to
+        self._channels_lock = threading.Lock()
+        # Channels are handled in parallel; each one's messages stay in order on one worker
+        self.workers = ChannelWorkerPool(workers) if workers else None
+        # Without a configured path, the engine detects one when monitoring starts (off the startup path)
+        self.eve_logs_path = eve_logs_path
         self.current_files = {}
+        self.tailer = ChatLogTailer()
+        self.chat_index = ChatLogIndex()
+        # Where each log has been handled up to, saved for the next start (None disables it)
+        self.checkpoints = checkpoints
+        # Drops messages already read from another log of the same channel (None disables it)
+        self.dedup = dedup
+        self.batch_stats = {'batches': 0, 'lines': 0, 'last_batch': 0, 'max_batch': 0, 'duplicates': 0}
+        self._stats_lock = threading.Lock()
+        # Watchdog callbacks only enqueue; bursts of events for a file are read once per window
+        self.event_queue = CoalescingQueue(self.process_queued_file, window=0.05, name="ChatLogEvents")
+        # Stage timings from file event to game logic, plus the queue and batch counters
+        self.metrics = metrics or Metrics()
+        self.metrics.add_source('event_queue', self.get_queue_stats)
+        self.metrics.add_source('batches', self.get_batch_stats)
+        if self.workers:
+            self.metrics.add_source('channel_workers', lambda: {'pending': self.workers.pending()})
+        if self.dedup:
+            self.metrics.add_source('dedup', self.dedup.get_stats)
         
     def detect_eve_logs_path(self):
         """Detect EVE logs path across different operating systems and configurations"""
@@ -128,237 +254,336 @@ class EVEChatMonitor(FileSystemEventHandler):
         # Test each path and return the first valid one
         for path in possible_paths:
             if os.path.exists(path) and os.path.isdir(path):
-                print(f"DEBUG: Found EVE logs directory: {path}")
+                logger.debug("Found EVE logs directory: %s", path)
                 return path
         
         # If no path found, return the most likely default
         default_path = os.path.expanduser("~/Documents/EVE/logs/Chatlogs")
-        print(f"WARNING: No EVE logs directory found. Using default: {default_path}")
+        logger.warning("No EVE logs directory found. Using default: %s", default_path)
         return default_path
         
     def on_modified(self, event):
         if not event.is_directory and event.src_path.endswith('.txt'):
-            print(f"DEBUG: File modified: {event.src_path}")
-            # Minimal delay to ensure file is fully written
-            time.sleep(0.05)
-            self.process_chat_log(event.src_path)
+            self.event_queue.put(event.src_path)
     
     def on_created(self, event):
         """Handle new file creation"""
         if not event.is_directory and event.src_path.endswith('.txt'):
-            print(f"DEBUG: New file created: {event.src_path}")
-            # Minimal delay to ensure file is fully written
-            time.sleep(0.1)
-            self.process_chat_log(event.src_path)
+            logger.debug("New file created: %s", event.src_path)
+            self.event_queue.put(event.src_path)
+    
+    def process_queued_file(self, file_path, queued_at=None):
+        """Worker side of the event queue: index and read a file that changed during the last window"""
+        if queued_at is not None:
+            self.metrics.record(STAGE_QUEUE_WAIT, time.monotonic() - queued_at)
+        self.chat_index.touch(file_path)
+        self.process_chat_log(file_path, queued_at)
+    
+    def get_queue_stats(self):
+        """Event counts, coalescing, queue depth and enqueue-to-processed latency of file events"""
+        return self.event_queue.get_stats()
+    
+    def stop(self):
+        """Stop the event worker and the channel workers; pending file events are dropped"""
+        self.event_queue.stop()
+        if self.workers:
+            self.workers.stop()
+    
+    def on_deleted(self, event):
+        """Handle file deletion"""
+        if not event.is_directory and event.src_path.endswith('.txt'):
+            self.forget_file(event.src_path)
+    
+    def on_moved(self, event):
+        """Handle file rename (e.g. log rotation)"""
+        if not event.is_directory:
+            self.forget_file(event.src_path)
+            self.chat_index.touch(event.dest_path)
+    
+    def forget_file(self, file_path):
+        """Drop everything known about a log that was deleted or moved away"""
+        self.chat_index.remove(file_path)
+        self.tailer.forget(file_path)
+        self.file_channels.pop(file_path, None)
+        if self.checkpoints:
+            self.checkpoints.forget(file_path)
+    
+    def has_active_game(self):
+        """Whether a giveaway is running in any channel"""
+        return any(manager.current_game and manager.current_game['active']
+                   for manager in list(self.game_managers.values()))
+    
+    def game_manager_for(self, channel):
+        """The GameManager that owns channel's giveaways, created on first use"""
+        manager = self.game_managers.get(channel)
+        if manager is None:
+            with self._channels_lock:
+                manager = self.game_managers.get(channel)
+                if manager is None:
+                    logger.debug("New channel seen: %s", channel)
+                    manager = self.create_game_manager(channel)
+                    self.game_managers[channel] = manager
+        return manager
+    
+    def channel_for_file(self, file_path, lines=()):
+        """Channel a log belongs to: its "Channel Name:" header if seen, else the filename"""
+        channel = self.file_channels.get(file_path)
+        if channel is None:
+            # Only a read from the start of the file includes the header
+            for line in lines[:self.HEADER_LINES]:
+                channel = parse_channel_header(line)
+                if channel:
+                    break
+            else:
+                channel = channel_from_filename(os.path.basename(file_path))
+            self.file_channels[file_path] = channel
+        return channel
     
-    def process_chat_log(self, file_path):
+    def read_channel_header(self, file_path):
+        """Channel of a log about to be read from the start, from its header (else its filename)"""
+        # A throwaway tailer, so the real read position is untouched
+        lines = ChatLogTailer().read_new_lines(file_path, max_bytes=self.HEADER_BYTES)
+        return self.channel_for_file(file_path, lines)
+    
+    def route_lines(self, file_path, lines, queued_at=None):
+        """Hand lines read from file_path to the worker for its channel"""
+        channel = self.channel_for_file(file_path, lines)
+        # Taken now: by the time the worker gets to these lines the tailer may have read further
+        position = self.tailer.position(file_path)
+        if self.workers:
+            self.workers.submit(channel, self.ingest_lines, file_path, lines, channel, queued_at, position)
+        else:
+            self.ingest_lines(file_path, lines, channel, queued_at, position)
+    
+    def process_chat_log(self, file_path, queued_at=None):
+        """Ingest every complete line appended to file_path since the last read"""
         try:
-            # Enhanced encoding detection for EVE Online logs
-            encodings = ['utf-16', 'utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1', 'latin-1']
-            lines = None
-            used_encoding = None
-            
-            for encoding in encodings:
-                try:
-                    with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-                        lines = f.readlines()
-                        used_encoding = encoding
-                        break
-                except Exception as e:
-                    continue
-            
+            # Only read what EVE appended since the last event for this file
+            started = time.perf_counter()
+            lines = self.tailer.read_new_lines(file_path)
+            self.metrics.record(STAGE_FILE_READ, time.perf_counter() - started)
             if lines:
-                # Process the last line (newest message)
-                last_line = lines[-1].strip()
-                if last_line:  # Only process non-empty lines
-                    # Clean up EVE log format: remove null bytes and fix spacing
-                    cleaned_line = self.clean_eve_log_line(last_line)
-                    if cleaned_line:
-                        print(f"DEBUG: Read with encoding: {used_encoding}")
-                        print(f"DEBUG: Original line: '{last_line[:100]}...'")
-                        print(f"DEBUG: Cleaned line: '{cleaned_line}'")
-                        self.parse_message(cleaned_line)
-                        
-                        # Check if we should switch to a more recent chat log file
-                        self.check_for_newer_chatlog()
+                self.route_lines(file_path, lines, queued_at)
+                
+                # Check if we should switch to a more recent chat log file
+                self.check_for_newer_chatlog()
         except Exception as e:
-            print(f"Error reading chat log {file_path}: {e}")
+            logger.error("Error reading chat log %s: %s", file_path, e)
             # Try to provide more helpful error information
             try:
                 file_size = os.path.getsize(file_path)
-                print(f"File size: {file_size} bytes")
+                logger.debug("File size: %s bytes", file_size)
             except:
                 pass
     
+    def prime_chat_log(self, file_path):
+        """Start tailing an existing chat log, acting only on its newest line"""
+        if file_path in self.tailer.files:
+            # Already tailing this file, so everything unread is genuinely new
+            self.process_chat_log(file_path)
+            return
+        try:
+            # Only the tail is read; the rest of the log is history
+            lines = self.tailer.read_tail_lines(file_path)
+            if lines:
+                # Older history was already handled in a previous session
+                self.route_lines(file_path, lines[-1:])
+        except Exception as e:
+            logger.error("Error reading chat log %s: %s", file_path, e)
+    
+    def ingest_lines(self, file_path, lines, channel, queued_at=None, position=None, on_message=None):
+        """Send a batch of raw log lines from one channel through parse_message in file order
+
+        queued_at is when the file event that led to this read was queued
+        (time.monotonic()); when given, the time from then until the whole
+        batch has been handled is recorded as the end-to-end latency.
+        position is the tailer's (offset, inode) just past these lines, saved
+        as file_path's checkpoint once they have all been handled.
+        on_message is passed on to parse_message.
+        """
+        duplicates = 0
+        if self.dedup:
+            # Multiboxed clients each log the channel; only the first copy of a message is parsed
+            unique = self.dedup.filter_lines(channel, file_path, lines)
+            duplicates = len(lines) - len(unique)
+            lines = unique
+        batch_size = 0
+        for line in lines:
+            if not line or line.isspace():  # Only process non-empty lines
+                continue
+            # The parser tolerates EVE's null bytes and irregular spacing directly
+            batch_size += 1
+            self.parse_message(line, channel, on_message)
+        
+        if position is not None and self.checkpoints:
+            self.checkpoints.update(file_path, position[0], position[1], channel)
+        
+        if duplicates:
+            with self._stats_lock:
+                self.batch_stats['duplicates'] += duplicates
+            logger.debug("Skipped %s line(s) of %s already read from another %s log",
+                         duplicates, os.path.basename(file_path), channel)
+        
+        if batch_size:
+            with self._stats_lock:
+                self.batch_stats['batches'] += 1
+                self.batch_stats['lines'] += batch_size
+                self.batch_stats['last_batch'] = batch_size
+                self.batch_stats['max_batch'] = max(self.batch_stats['max_batch'], batch_size)
+            self.metrics.count(RATE_LINES, batch_size)
+            if queued_at is not None:
+                self.metrics.record(STAGE_END_TO_END, time.monotonic() - queued_at)
+            encoding = self.tailer.files.get(file_path, {}).get('encoding')
+            logger.debug("Ingested batch of %s line(s) from %s [%s] (encoding: %s, largest batch: %s)",
+                         batch_size, os.path.basename(file_path), channel, encoding, self.batch_stats['max_batch'])
+        return batch_size
+    
+    def get_batch_stats(self):
+        """Get a copy of the ingest batch counters"""
+        with self._stats_lock:
+            return dict(self.batch_stats)
+    
     def check_for_newer_chatlog(self):
         """Check if there's a newer chat log file and switch to it"""
         try:
-            if not hasattr(self, 'eve_logs_path') or not self.eve_logs_path:
+            # The index is kept current by file events, so this is a lookup, not a directory scan
+            newest_path = self.chat_index.newest_chat_log()
+            if not newest_path:
                 return
-                
-            # Find all chat log files in the directory
-            chat_files = []
-            for filename in os.listdir(self.eve_logs_path):
-                if filename.endswith('.txt') and 'Chat' in filename:
-                    file_path = os.path.join(self.eve_logs_path, filename)
-                    try:
-                        mod_time = os.path.getmtime(file_path)
-                        chat_files.append((filename, mod_time, file_path))
-                    except:
-                        continue
-            
-            if not chat_files:
-                return
-                
-            # Sort by modification time (newest first)
-            chat_files.sort(key=lambda x: x[1], reverse=True)
-            newest_file = chat_files[0]
+            newest_name = os.path.basename(newest_path)
             
             # Check if the newest file is different from what we're currently monitoring
             current_file = getattr(self, 'current_chat_file', None)
-            if current_file != newest_file[0]:
-                print(f"DEBUG: Newer chat log detected: {newest_file[0]} (was monitoring: {current_file})")
-                self.current_chat_file = newest_file[0]
+            if current_file != newest_name:
+                logger.debug("Newer chat log detected: %s (was monitoring: %s)", newest_name, current_file)
+                self.current_chat_file = newest_name
                 
-                # Process the newest file to catch up on any missed messages
-                print(f"DEBUG: Processing newest chat log: {newest_file[0]}")
-                self.process_chat_log(newest_file[2])
+                # A log already being tailed gets its lines through its own file events; re-reading it
+                # here just bounced between multiboxed clients' logs of the same channel
+                if newest_path not in self.tailer.files:
+                    logger.debug("Processing newest chat log: %s", newest_name)
+                    self.prime_chat_log(newest_path)
                 
         except Exception as e:
-            print(f"Error checking for newer chat log: {e}")
+            logger.error("Error checking for newer chat log: %s", e)
     
     def clean_eve_log_line(self, line):
         """Clean up EVE log line by removing null bytes and fixing spacing"""
         try:
-            # Remove null bytes completely
-            cleaned = line.replace('\x00', '')
-            
-            # If the line contains the expected pattern, clean it up
-            if '[' in cleaned and ']' in cleaned and '>' in cleaned:
-                # Extract the timestamp part and clean it
-                start_bracket = cleaned.find('[')
-                end_bracket = cleaned.find(']')
-                
-                if start_bracket != -1 and end_bracket != -1:
-                    # Get the timestamp content (without brackets)
-                    timestamp_content = cleaned[start_bracket+1:end_bracket].strip()
-                    
-                    # Clean the timestamp content - remove excessive spaces but preserve date/time structure
-                    timestamp_content = re.sub(r'\s+', ' ', timestamp_content)
-                    
-                    # Reconstruct with proper spacing: [ timestamp ]
-                    timestamp_section = f"[ {timestamp_content} ]"
-                    
-                    # Clean the rest of the line - remove excessive spaces but preserve structure
-                    rest_of_line = cleaned[end_bracket+1:].strip()
-                    # Remove excessive spaces but keep single spaces around >
-                    rest_of_line = re.sub(r'\s+', ' ', rest_of_line)
-                    
-                    # Reconstruct the cleaned line
-                    cleaned_line = timestamp_section + ' ' + rest_of_line
-                    return cleaned_line
-            
-            return cleaned
+            return clean_line(line)
         except Exception as e:
-            print(f"Error cleaning EVE log line: {e}")
+            logger.error("Error cleaning EVE log line: %s", e)
             return line
     
-    def parse_message(self, message):
-        # Enhanced EVE chat format parsing for different log formats
-        patterns = [
-            # Standard format: [ timestamp ] CharacterName > message
-            r'\[ ([\d\.]+ [\d:]+) \] ([^>]+) > (.+)',
-            # Alternative format: [ timestamp ] CharacterName: message
-            r'\[ ([\d\.]+ [\d:]+) \] ([^:]+): (.+)',
-            # Compact format: [timestamp] CharacterName > message
-            r'\[([\d\.]+ [\d:]+)\] ([^>]+) > (.+)',
-            # Minimal format: CharacterName > message
-            r'([^>]+) > (.+)',
-            # EVE specific format: [timestamp] CharacterName > message
-            r'\[([\d\.]+ [\d:]+)\] ([^>]+) > (.+)',
-        ]
-        
-        match = None
-        used_pattern = None
+    def parse_message(self, message, channel, on_message=None):
+        """Parse one chat log line and dispatch any command it carries to channel's game
+        
+        on_message, when given, sees each parsed ChatMessage first and can
+        return False to keep it from being dispatched.
+        """
+        started = time.perf_counter()
+        chat_message = parse_chat_line(message)
+        self.metrics.record(STAGE_PARSE, time.perf_counter() - started)
+        if chat_message is None:
+            logger.debug("Message did not match any pattern: '%s'", message)
+            return None
         
-        for pattern in patterns:
-            match = re.match(pattern, message)
-            if match:
-                used_pattern = pattern
-                break
+        logger.debug("Parsed message - Timestamp: '%s', Character: '%s', Content: '%s'",
+                     chat_message.timestamp or 'unknown', chat_message.speaker, chat_message.body)
+        if on_message is not None and on_message(chat_message) is False:
+            return chat_message
+        self.dispatch_message(chat_message, channel)
+        return chat_message
+    
+    def dispatch_message(self, chat_message, channel):
+        """Route a parsed message to the matching handler of channel's GameManager"""
+        handler = self.COMMAND_HANDLERS.get(chat_message.command)
+        if handler is None:
+            logger.debug("No command detected in content: '%s'", chat_message.body)
+            return
         
-        if match:
-            if len(match.groups()) == 3:
-                # Pattern with timestamp
-                timestamp, character_name, content = match.groups()
-                print(f"DEBUG: Used pattern: {used_pattern}")
-            elif len(match.groups()) == 2:
-                # Pattern without timestamp
-                character_name, content = match.groups()
-                timestamp = "unknown"
-                print(f"DEBUG: Used pattern (no timestamp): {used_pattern}")
-            else:
-                print(f"DEBUG: Unexpected number of groups: {len(match.groups())}")
-                return
-            
-            character_name = character_name.strip()
-            content = content.strip()
-            
-            print(f"DEBUG: Parsed message - Timestamp: '{timestamp}', Character: '{character_name}', Content: '{content}'")
-            
-            # Check for admin commands (start with !) - case insensitive
-            if content.lower().startswith('!pir '):
-                print(f"DEBUG: Detected PIR command from {character_name}")
-                self.game_manager.start_pir_game(character_name, content)
-            elif content.lower().startswith('!gtn '):
-                print(f"DEBUG: Detected GTN command from {character_name}")
-                self.game_manager.start_gtn_game(character_name, content)
-            elif content.lower().startswith('!stop'):
-                print(f"DEBUG: Detected stop command from {character_name}")
-                self.game_manager.stop_game(character_name)
-            elif content.lower().startswith('!status'):
-                print(f"DEBUG: Detected status command from {character_name}")
-                self.game_manager.show_status(character_name)
-            elif content.lower().startswith('!clear'):
-                print(f"DEBUG: Detected clear command from {character_name}")
-                self.game_manager.clear_game(character_name)
-            # Check for player entries (start with ?)
-            elif content.startswith('?'):
-                print(f"DEBUG: Detected player entry from {character_name}: {content}")
-                self.game_manager.enter_game(character_name, content)
-            else:
-                print(f"DEBUG: No command detected in content: '{content}'")
+        method_name, takes_body = handler
+        logger.debug("Detected %s command from %s in %s", chat_message.command, chat_message.speaker, channel)
+        method = getattr(self.game_manager_for(channel), method_name)
+        started = time.perf_counter()
+        if takes_body:
+            method(chat_message.speaker, chat_message.body)
         else:
-            print(f"DEBUG: Message did not match any pattern: '{message}'")
-            # Try to extract any potential command from the message
-            if '!' in message:
-                print(f"DEBUG: Found '!' in message, might be a command: {message}")
+            method(chat_message.speaker)
+        self.metrics.record(STAGE_DISPATCH, time.perf_counter() - started)
+
+class LogClock:
+    """Game clock that follows the chat log time of the messages being caught up on
+    
+    EVE stamps chat in UTC; log times are converted to local time so they
+    compare with the datetime.now() deadlines of games restored from the
+    journal. Until the first timestamp is read, now is None.
+    """
+    
+    def __init__(self):
+        self.now = None
+        self._timestamp = None
+        self._time = None
+    
+    def __call__(self):
+        return self.now
+    
+    def read(self, timestamp):
+        """Local time of an EVE log timestamp, or of the last one read when it has none or can't be parsed"""
+        # Neighbouring lines mostly share a second, so only a new timestamp is parsed
+        if timestamp and timestamp != self._timestamp:
+            try:
+                utc_time = datetime.strptime(timestamp, EVE_TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+            except ValueError:
+                return self._time
+            self._timestamp = timestamp
+            self._time = utc_time.astimezone().replace(tzinfo=None)
+        return self._time
+
 
 class GameManager:
-    def __init__(self, gui, config_manager=None):
-        self.gui = gui
+    def __init__(self, events, config_manager=None, admin_registry=None, clock=None, auto_timer=True,
+                 scheduler=None, channel=None, journal=None, history=None, metrics=None):
+        # Status messages, entries and countdown ticks are published here (an EventBus or
+        # anything with the same methods); the engine never talks to a GUI directly
+        self.events = events
+        # Chat channel whose giveaways this manager runs (None when there is only one)
+        self.channel = channel
         self.config_manager = config_manager
+        # Replays drive the clock from log timestamps and check expiry themselves
+        self.clock = clock or datetime.now
+        self.auto_timer = auto_timer
+        # One scheduler thread sleeps until the next game deadline or countdown tick
+        self.scheduler = scheduler or (DeadlineScheduler() if auto_timer else None)
+        self.expiry_call = None
+        self.countdown_call = None
         self.current_game = None
         self.participants = {}
-        self.admin_users = set()  # Add admin usernames here
+        # Resolved once; admins.txt is only re-read when it changes on disk
+        self.admin_registry = admin_registry or AdminRegistry()
+        # Game events are journaled so a running game survives a crash (None disables it)
+        self.journal = journal
+        # Finished games go to the SQLite history (None disables it)
+        self.history = history
+        # Accepted entries are counted for the entries/sec rate (None disables it)
+        self.metrics = metrics
         
     def start_pir_game(self, admin_name, command):
-        print(f"DEBUG: PIR game command from {admin_name}, checking admin status...")
+        logger.debug("PIR game command from %s, checking admin status...", admin_name)
         if not self.is_admin(admin_name):
-            print(f"DEBUG: {admin_name} is NOT an admin, command rejected")
+            logger.debug("%s is NOT an admin, command rejected", admin_name)
             return
-        print(f"DEBUG: {admin_name} is confirmed admin, starting PIR game")
+        logger.debug("%s is confirmed admin, starting PIR game", admin_name)
             
         try:
             # Handle case-insensitive command parsing using regex
-            import re
             # More strict pattern: exactly two numbers separated by single dash, no extra characters
             range_match = re.search(r'!pir\s+(\d+)-(\d+)(?:\s|$)', command, re.IGNORECASE)
             if range_match:
                 min_val, max_val = map(int, range_match.groups())
                 # Validate range
                 if min_val > max_val:
-                    self.gui.update_game_status(f"❌ Invalid range: {min_val}-{max_val}. Min must be ≤ Max.")
+                    self.update_status(f"❌ Invalid range: {min_val}-{max_val}. Min must be ≤ Max.")
                     return
                 target = random.randint(min_val, max_val)
                 
@@ -366,39 +591,43 @@ class GameManager:
                     'type': 'PIR',
                     'admin': admin_name,
                     'range': f"{min_val}-{max_val}",
+                    'range_min': min_val,
+                    'range_max': max_val,
                     'target': target,
-                    'start_time': datetime.now(),
-                    'end_time': datetime.now() + timedelta(minutes=self.config_manager.get_game_timer_minutes()),
-                    'participants': {},
+                    'start_time': self.clock(),
+                    'end_time': self.clock() + timedelta(minutes=self.config_manager.get_game_timer_minutes()),
+                    'participants': ParticipantStore(),
+                    'channel': self.channel,
                     'active': True
                 }
                 
-                self.gui.update_game_status(f"🎯 Price is Right game started by {admin_name}!\nRange: {min_val}-{max_val}\n⏰ Game ends in {self.config_manager.get_game_timer_minutes()} minutes!\nPlayers use ?number to enter!")
-                self.gui.clear_participants()
+                self.update_status(f"🎯 Price is Right game started by {admin_name}!\nRange: {min_val}-{max_val}\n⏰ Game ends in {self.config_manager.get_game_timer_minutes()} minutes!\nPlayers use ?number to enter!")
+                self.events.clear_participants(self.channel)
+                
+                self._journal_event(EVENT_START, **{field: self.current_game[field] for field in JOURNAL_GAME_FIELDS})
                 
                 # Start the game timer
                 self.start_game_timer()
                 
         except Exception as e:
-            print(f"Error starting PIR game: {e}")
+            logger.error("Error starting PIR game: %s", e)
     
     def start_gtn_game(self, admin_name, command):
-        print(f"DEBUG: GTN game command from {admin_name}, checking admin status...")
+        logger.debug("GTN game command from %s, checking admin status...", admin_name)
         if not self.is_admin(admin_name):
-            print(f"DEBUG: {admin_name} is NOT an admin, command rejected")
+            logger.debug("%s is NOT an admin, command rejected", admin_name)
             return
-        print(f"DEBUG: {admin_name} is confirmed admin, starting GTN game")
+        logger.debug("%s is confirmed admin, starting GTN game", admin_name)
             
         try:
             # Handle case-insensitive command parsing using regex
-            import re
             # More strict pattern: exactly two numbers separated by single dash, no extra characters
             range_match = re.search(r'!gtn\s+(\d+)-(\d+)(?:\s|$)', command, re.IGNORECASE)
             if range_match:
                 min_val, max_val = map(int, range_match.groups())
                 # Validate range
                 if min_val > max_val:
-                    self.gui.update_game_status(f"❌ Invalid range: {min_val}-{max_val}. Min must be ≤ Max.")
+                    self.update_status(f"❌ Invalid range: {min_val}-{max_val}. Min must be ≤ Max.")
                     return
                 target = random.randint(min_val, max_val)
                 
@@ -406,25 +635,30 @@ class GameManager:
                     'type': 'GTN',
                     'admin': admin_name,
                     'range': f"{min_val}-{max_val}",
+                    'range_min': min_val,
+                    'range_max': max_val,
                     'target': target,
-                    'start_time': datetime.now(),
-                    'end_time': datetime.now() + timedelta(minutes=self.config_manager.get_game_timer_minutes()),
-                    'participants': {},
+                    'start_time': self.clock(),
+                    'end_time': self.clock() + timedelta(minutes=self.config_manager.get_game_timer_minutes()),
+                    'participants': ParticipantStore(),
+                    'channel': self.channel,
                     'active': True
                 }
                 
-                self.gui.update_game_status(f"🎲 Guess the Number game started by {admin_name}!\nRange: {min_val}-{max_val}\n⏰ Game ends in {self.config_manager.get_game_timer_minutes()} minutes!\nPlayers use ?number to enter!")
-                self.gui.clear_participants()
+                self.update_status(f"🎲 Guess the Number game started by {admin_name}!\nRange: {min_val}-{max_val}\n⏰ Game ends in {self.config_manager.get_game_timer_minutes()} minutes!\nPlayers use ?number to enter!")
+                self.events.clear_participants(self.channel)
+                
+                self._journal_event(EVENT_START, **{field: self.current_game[field] for field in JOURNAL_GAME_FIELDS})
                 
                 # Start the game timer
                 self.start_game_timer()
                 
         except Exception as e:
-            print(f"Error starting GTN game: {e}")
+            logger.error("Error starting GTN game: %s", e)
     
     def enter_game(self, character_name, command):
         if not self.current_game or not self.current_game['active']:
-            print(f"DEBUG: No active game or game not active for {character_name}")
+            logger.debug("No active game or game not active for %s", character_name)
             return
             
         try:
@@ -432,183 +666,171 @@ class GameManager:
             # Handle both ?500 and ? 500 (with space)
             if command.startswith('?'):
                 guess_str = command[1:].strip()  # Remove the ? and trim
-                print(f"DEBUG: Extracted guess string: '{guess_str}' from command: '{command}'")
+                logger.debug("Extracted guess string: '%s' from command: '%s'", guess_str, command)
                 
                 # Try to parse the number
                 try:
                     guess = int(guess_str)
-                    print(f"DEBUG: Parsed guess number: {guess}")
+                    logger.debug("Parsed guess number: %s", guess)
                 except ValueError:
                     # If that fails, try to find any number in the string
-                    import re
                     number_match = re.search(r'\d+', guess_str)
                     if number_match:
                         guess = int(number_match.group())
-                        print(f"DEBUG: Found number in string: {guess}")
+                        logger.debug("Found number in string: %s", guess)
                     else:
                         raise ValueError(f"No valid number found in: {command}")
                 
-                min_val, max_val = map(int, self.current_game['range'].split('-'))
+                min_val = self.current_game['range_min']
+                max_val = self.current_game['range_max']
                 
                 if min_val <= guess <= max_val:
-                    # Check if player already entered
-                    if character_name in self.current_game['participants']:
-                        print(f"DEBUG: {character_name} already entered with {self.current_game['participants'][character_name]['guess']}")
-                        self.gui.update_game_status(f"⚠️ {character_name} already entered with {self.current_game['participants'][character_name]['guess']}")
+                    # One dict lookup rejects players who already entered
+                    participants = self.current_game['participants']
+                    if not participants.add(character_name, guess, self.clock()):
+                        logger.debug("%s already entered with %s", character_name, participants[character_name]['guess'])
+                        self.update_status(f"⚠️ {character_name} already entered with {participants[character_name]['guess']}")
                         return
                     
-                    print(f"DEBUG: Adding {character_name} with guess {guess}")
-                    self.current_game['participants'][character_name] = {
-                        'guess': guess,
-                        'time': datetime.now()
-                    }
-                    
-                    print(f"DEBUG: Calling GUI add_participant for {character_name}")
-                    self.gui.add_participant(character_name, guess)
-                    self.gui.update_game_status(f"✅ {character_name} entered with {guess}!")
+                    logger.debug("Added %s with guess %s", character_name, guess)
+                    if self.metrics:
+                        self.metrics.count(RATE_ENTRIES)
+                    self._journal_event(EVENT_ENTRY, name=character_name, guess=guess,
+                                        time=participants[character_name]['time'])
+                    logger.debug("Publishing new participant %s", character_name)
+                    self.events.add_participant(character_name, guess, self.channel, participants[character_name]['time'])
+                    self.update_status(f"✅ {character_name} entered with {guess}!")
                 else:
-                    print(f"DEBUG: Guess {guess} outside range {min_val}-{max_val}")
-                    self.gui.update_game_status(f"❌ {character_name}'s guess {guess} is outside the range {min_val}-{max_val}")
+                    logger.debug("Guess %s outside range %s-%s", guess, min_val, max_val)
+                    self.update_status(f"❌ {character_name}'s guess {guess} is outside the range {min_val}-{max_val}")
             else:
-                print(f"DEBUG: Command doesn't start with ?: {command}")
-                self.gui.update_game_status(f"❌ Invalid format from {character_name}. Use ?number (e.g., ?500)")
+                logger.debug("Command doesn't start with ?: %s", command)
+                self.update_status(f"❌ Invalid format from {character_name}. Use ?number (e.g., ?500)")
                 
         except ValueError as e:
-            print(f"DEBUG: Invalid number format from {character_name}: {command} - Error: {e}")
-            self.gui.update_game_status(f"❌ Invalid number format from {character_name}. Use ?number (e.g., ?500)")
+            logger.debug("Invalid number format from %s: %s - Error: %s", character_name, command, e)
+            self.update_status(f"❌ Invalid number format from {character_name}. Use ?number (e.g., ?500)")
         except Exception as e:
-            print(f"Error processing entry: {e}")
+            logger.error("Error processing entry: %s", e)
     
     def stop_game(self, admin_name):
-        print(f"DEBUG: Stop game command from {admin_name}, checking admin status...")
+        logger.debug("Stop game command from %s, checking admin status...", admin_name)
         if not self.is_admin(admin_name):
-            print(f"DEBUG: {admin_name} is NOT an admin, command rejected")
+            logger.debug("%s is NOT an admin, command rejected", admin_name)
             return
-        if not self.current_game:
-            print(f"DEBUG: No active game to stop")
+        if not self.current_game or not self.current_game['active']:
+            # Already stopped or expired: its winner was announced and recorded then
+            logger.debug("No active game to stop")
             return
-        print(f"DEBUG: {admin_name} is confirmed admin, stopping game")
+        logger.debug("%s is confirmed admin, stopping game", admin_name)
             
-        print(f"DEBUG: Stopping game. Type: {self.current_game['type']}, Target: {self.current_game['target']}")
-        print(f"DEBUG: Participants: {self.current_game['participants']}")
+        logger.debug("Stopping game. Type: %s, Target: %s", self.current_game['type'], self.current_game['target'])
+        logger.debug("Participants: %s", self.current_game['participants'])
         
         if self.current_game['type'] == 'PIR':
             winner = self.select_pir_winner()
-            print(f"DEBUG: PIR winner selected: {winner}")
+            logger.debug("PIR winner selected: %s", winner)
         else:  # GTN
             winner = self.select_gtn_winner()
-            print(f"DEBUG: GTN winner selected: {winner}")
+            logger.debug("GTN winner selected: %s", winner)
         
         if winner:
             if winner['type'] == 'single':
-                self.gui.update_game_status(f"🏆 Game ended! Winner: {winner['name']} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
+                self.update_status(f"🏆 Game ended! Winner: {winner['name']} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
             else:  # multiple winners
                 winner_names = ", ".join(winner['names'])
-                self.gui.update_game_status(f"🏆 Game ended! Winners: {winner_names} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
+                self.update_status(f"🏆 Game ended! Winners: {winner_names} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
         else:
-            self.gui.update_game_status("❌ Game ended! No participants.")
+            self.update_status("❌ Game ended! No participants.")
         
-        # Stop timer thread and clean up
-        self._cleanup_timer_thread()
         self.current_game['active'] = False
+        self._record_game_end(winner, 'stopped')
+        # Cancel the pending expiry and countdown ticks
+        self._cancel_game_timer()
     
     def clear_game(self, admin_name):
-        print(f"DEBUG: Clear game command from {admin_name}, checking admin status...")
+        logger.debug("Clear game command from %s, checking admin status...", admin_name)
         if not self.is_admin(admin_name):
-            print(f"DEBUG: {admin_name} is NOT an admin, command rejected")
+            logger.debug("%s is NOT an admin, command rejected", admin_name)
             return
-        print(f"DEBUG: {admin_name} is confirmed admin, clearing game")
+        logger.debug("%s is confirmed admin, clearing game", admin_name)
             
-        # Stop timer thread and clean up
-        self._cleanup_timer_thread()
         self.current_game = None
-        self.gui.clear_participants()
-        self.gui.update_game_status("🧹 Game cleared! Ready for new game.")
+        self._journal_event(EVENT_STOP, reason='cleared')
+        # Cancel the pending expiry and countdown ticks
+        self._cancel_game_timer()
+        self.events.clear_participants(self.channel)
+        self.update_status("🧹 Game cleared! Ready for new game.")
     
-    def select_pir_winner(self):
-        if not self.current_game['participants']:
-            print("DEBUG: No participants in game")
+    def select_pir_winner(self, game=None):
+        game = game or self.current_game
+        if not game['participants']:
+            logger.debug("No participants in game")
             return None
             
-        print(f"DEBUG: Selecting PIR winner. Target: {self.current_game['target']}")
-        print(f"DEBUG: All participants: {self.current_game['participants']}")
+        logger.debug("Selecting PIR winner. Target: %s", game['target'])
+        logger.debug("All participants: %s", game['participants'])
         
-        # Price is Right: closest without going over
-        valid_guesses = {name: data for name, data in self.current_game['participants'].items() 
-                        if data['guess'] <= self.current_game['target']}
+        # Price is Right: closest without going over, i.e. the highest guess ≤ target
+        max_guess = game['participants'].highest_at_most(game['target'])
         
-        print(f"DEBUG: Valid guesses (≤ target): {valid_guesses}")
-        
-        if not valid_guesses:
-            print("DEBUG: No valid guesses found")
+        if max_guess is None:
+            logger.debug("No valid guesses found")
             return None
-            
-        # Find the highest valid guess (closest without going over)
-        max_guess = max(valid_guesses.values(), key=lambda x: x['guess'])['guess']
         
         # Find ALL players with this winning guess
-        winners = [name for name, data in valid_guesses.items() 
-                  if data['guess'] == max_guess]
-        
-        print(f"DEBUG: Winners found: {winners} with guess {max_guess}")
+        winners = game['participants'].names_with_guess(max_guess)
         
-        if len(winners) == 1:
-            # Single winner
-            return {
-                'name': winners[0],
-                'guess': max_guess,
-                'type': 'single'
-            }
-        else:
-            # Multiple winners - return list
-            return {
-                'names': winners,
-                'guess': max_guess,
-                'type': 'multiple'
-            }
+        logger.debug("Winners found: %s with guess %s", winners, max_guess)
+        return self._winner_result(winners, max_guess)
     
-    def select_gtn_winner(self):
-        if not self.current_game['participants']:
+    def select_gtn_winner(self, game=None):
+        game = game or self.current_game
+        if not game['participants']:
             return None
             
         # Guess the Number: exact match
-        exact_matches = {name: data for name, data in self.current_game['participants'].items() 
-                        if data['guess'] == self.current_game['target']}
-        
+        exact_matches = game['participants'].names_with_guess(game['target'])
         if exact_matches:
-            if len(exact_matches) == 1:
-                # Single winner
-                winner_name = list(exact_matches.keys())[0]
-                return {
-                    'name': winner_name,
-                    'guess': exact_matches[winner_name]['guess'],
-                    'type': 'single'
-                }
-            else:
-                # Multiple winners - return list
-                winner_names = list(exact_matches.keys())
-                winner_guess = list(exact_matches.values())[0]['guess']
-                return {
-                    'names': winner_names,
-                    'guess': winner_guess,
-                    'type': 'multiple'
-                }
+            return self._winner_result(exact_matches, game['target'])
         
         return None
     
+    def _winner_result(self, names, guess):
+        if len(names) == 1:
+            # Single winner
+            return {
+                'name': names[0],
+                'guess': guess,
+                'type': 'single'
+            }
+        # Multiple winners - return list
+        return {
+            'names': names,
+            'guess': guess,
+            'type': 'multiple'
+        }
+    
+    def get_leaderboard(self, game=None, limit=5):
+        """Current leaders as (guess, names) pairs, best first, under the game's winning rule"""
+        game = game or self.current_game
+        if not game:
+            return []
+        return game['participants'].leaderboard(game['target'], limit, allow_over=game['type'] == 'GTN')
+    
     def show_status(self, admin_name):
-        print(f"DEBUG: Status command from {admin_name}, checking admin status...")
+        logger.debug("Status command from %s, checking admin status...", admin_name)
         if not self.is_admin(admin_name):
-            print(f"DEBUG: {admin_name} is NOT an admin, command rejected")
+            logger.debug("%s is NOT an admin, command rejected", admin_name)
             return
-        print(f"DEBUG: {admin_name} is confirmed admin, showing status")
+        logger.debug("%s is confirmed admin, showing status", admin_name)
             
         if not self.current_game:
-            self.gui.update_game_status("📊 No active game. Use !PIR or !GTN to start one!")
+            self.update_status("📊 No active game. Use !PIR or !GTN to start one!")
             return
             
         # Calculate time remaining
-        time_remaining = self.current_game['end_time'] - datetime.now()
+        time_remaining = self.current_game['end_time'] - self.clock()
         if time_remaining.total_seconds() > 0:
             minutes = int(time_remaining.total_seconds() // 60)
             seconds = int(time_remaining.total_seconds() % 60)
@@ -623,1125 +845,674 @@ class GameManager:
         status += f"⏰ Started: {self.current_game['start_time'].strftime('%H:%M:%S')}\n"
         status += f"⏳ Time remaining: {time_str}"
         
-        self.gui.update_game_status(status)
+        leaders = self.get_leaderboard(limit=3)
+        if leaders:
+            status += "\n🏅 Leading: " + ", ".join(f"{', '.join(names)} ({guess})" for guess, names in leaders)
+        
+        self.update_status(status)
+    
+    def update_status(self, message):
+        """Show a game status message, labelled with this manager's channel"""
+        if self.channel:
+            message = f"[{self.channel}] {message}"
+        self.events.update_game_status(message)
     
     def is_admin(self, username):
-        """Check if username is in admin list by reading from admins.txt file"""
+        """Check if username is in the cached admin list (reloaded when admins.txt changes)"""
         try:
-            admin_list = set()
-            # Enhanced path detection for admins.txt
-            possible_paths = [
-                'admins.txt',  # Current working directory
-                os.path.join(os.getcwd(), 'admins.txt'),  # Current working directory (explicit)
-                os.path.join(os.path.dirname(__file__), 'admins.txt'),  # Same directory as script
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'admins.txt'),  # Parent directory
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'admins.txt'),  # Grandparent directory
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..', 'admins.txt'),  # Great-grandparent directory
-            ]
-            
-            # Add executable directory for PyInstaller builds
-            if hasattr(sys, '_MEIPASS'):  # PyInstaller executable
-                possible_paths.insert(0, os.path.join(sys._MEIPASS, 'admins.txt'))
-                possible_paths.insert(0, os.path.join(os.path.dirname(sys.executable), 'admins.txt'))
-            
-            # Add user's home directory
-            home_dir = os.path.expanduser("~")
-            possible_paths.extend([
-                os.path.join(home_dir, 'admins.txt'),
-                os.path.join(home_dir, 'Documents', 'admins.txt'),
-                os.path.join(home_dir, 'Desktop', 'admins.txt'),
-            ])
-            
-            admin_file_found = False
-            for admin_path in possible_paths:
-                if os.path.exists(admin_path):
-                    try:
-                        # Try multiple encodings for better compatibility
-                        encodings = ['utf-8', 'utf-8-sig', 'cp1252', 'iso-8859-1']
-                        file_read = False
-                        
-                        for encoding in encodings:
-                            try:
-                                with open(admin_path, 'r', encoding=encoding) as f:
-                                    for line in f:
-                                        line = line.strip()
-                                        # Skip empty lines and comments
-                                        if line and not line.startswith('#'):
-                                            admin_list.add(line)
-                                    file_read = True
-                                    break
-                            except UnicodeDecodeError:
-                                continue
-                        
-                        if file_read:
-                            admin_file_found = True
-                            print(f"DEBUG: Loaded admin list from: {admin_path}")
-                            print(f"DEBUG: Admin users: {admin_list}")
-                            break
-                        else:
-                            print(f"Warning: Could not read {admin_path} with any encoding")
-                            
-                    except Exception as e:
-                        print(f"Warning: Could not read {admin_path}: {e}")
-                        continue
-            
-            if not admin_file_found:
-                # No admin file found - no admins will be available
-                print("Warning: admins.txt not found in any location. No admin users will be available.")
-                admin_list = set()
-            
-            return username in admin_list
+            return self.admin_registry.is_admin(username)
         except Exception as e:
-            print(f"Error reading admin list: {e}")
+            logger.error("Error reading admin list: %s", e)
             # If there's an error reading the admin list, no admins will be available
             return False
     
     def start_game_timer(self):
-        """Start a timer that will automatically end the game after configured minutes"""
-        # Store reference to current timer thread for cleanup
-        if hasattr(self, 'timer_thread') and self.timer_thread and self.timer_thread.is_alive():
-            # Stop previous timer thread if it exists
-            self.timer_thread.cancel = True
-            self.timer_thread.join(timeout=1)
-        
-        def timer_thread():
-            # Add cancel flag to thread
-            timer_thread.cancel = False
-            while self.current_game and self.current_game['active'] and not timer_thread.cancel:
-                time.sleep(1)  # Check every second
-                try:
-                    if datetime.now() >= self.current_game['end_time']:
-                        # Game time is up!
-                        if self.current_game and self.current_game['active']:
-                            self.current_game['active'] = False
-                            self.gui.update_game_status("⏰ Time's up! Game ended automatically!")
-                            
-                            # Select winner
-                            if self.current_game['type'] == 'PIR':
-                                winner = self.select_pir_winner()
-                            else:  # GTN
-                                winner = self.select_gtn_winner()
-                            
-                            if winner:
-                                if winner['type'] == 'single':
-                                    self.gui.update_game_status(f"🏆 Game ended! Winner: {winner['name']} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
-                                else:  # multiple winners
-                                    winner_names = ", ".join(winner['names'])
-                                    self.gui.update_game_status(f"🏆 Game ended! Winners: {winner_names} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
-                            else:
-                                self.gui.update_game_status("⏰ Game ended! No participants.")
-                        break
-                except Exception as e:
-                    print(f"Error in timer thread: {e}")
-                    break
-        
-        # Start timer in a separate thread
-        self.timer_thread = threading.Thread(target=timer_thread, daemon=True)
-        self.timer_thread.start()
+        """Schedule the current game to end automatically after the configured minutes"""
+        if not self.auto_timer:
+            return
+        # Restarting a game just drops the old deadlines; nothing waits on a thread
+        self._cancel_game_timer(refresh=False)
+        
+        game = self.current_game
+        remaining = (game['end_time'] - self.clock()).total_seconds()
+        self.expiry_call = self.scheduler.call_later(remaining, self._on_game_timer_expired, game)
+        # Tick on whole seconds of the remaining time so the countdown never skips a digit
+        self.countdown_call = self.scheduler.call_every(1.0, self.events.update_countdown, game, self.channel,
+                                                        first_delay=remaining % 1.0)
+        self.events.update_countdown(game, self.channel)
     
-    def _cleanup_timer_thread(self):
-        """Clean up timer thread to prevent memory leaks and crashes"""
-        if hasattr(self, 'timer_thread') and self.timer_thread and self.timer_thread.is_alive():
-            try:
-                self.timer_thread.cancel = True
-                self.timer_thread.join(timeout=2)
-                if self.timer_thread.is_alive():
-                    print("Warning: Timer thread did not stop gracefully")
-            except Exception as e:
-                print(f"Error cleaning up timer thread: {e}")
-
-class EVEGiveawayGUI:
-    def __init__(self):
+    def _on_game_timer_expired(self, game):
+        """Scheduler callback at a game's end time"""
+        if game is not self.current_game:
+            return  # A newer game replaced this one
         try:
-            self.root = tk.Tk()
-            self.root.title("EVE Online Giveaway Tool")
-            
-            # Set a minimum window size to prevent layout issues
-            self.root.minsize(800, 600)
-            
-            # Load saved window size and position
-            self.load_window_settings()
-            
-            # Configuration manager
-            self.config_manager = ConfigManager()
-            
-            # Game manager
-            self.game_manager = GameManager(self, self.config_manager)
-            
-            # Chat monitor
-            chat_monitor_path = self.config_manager.get_eve_logs_path()
-            self.chat_monitor = EVEChatMonitor(self.game_manager, chat_monitor_path)
-            self.observer = None
-            
-            # Setup GUI with error handling
-            try:
-                self.setup_gui()
-            except Exception as e:
-                print(f"Error setting up GUI: {e}")
-                # Fallback to basic GUI if styling fails
-                self.setup_basic_gui()
-            
-            self.start_monitoring()
-            
-            # Bind window close event to save settings
-            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-            
-            # Ensure the window is visible and focused
-            self.root.lift()
-            self.root.focus_force()
-            
+            self.expire_game()
         except Exception as e:
-            print(f"Critical error initializing GUI: {e}")
-            # Show error message and exit gracefully
-            if 'self.root' in locals():
-                messagebox.showerror("Error", f"Failed to initialize GUI: {e}")
-                self.root.destroy()
-            else:
-                print("Could not create root window")
-            raise
+            logger.error("Error ending game on timer: %s", e)
     
-    def setup_gui(self):
-        # Apply dark mode styling
-        self.apply_dark_mode()
-        
-        # Main frame
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configure grid weights
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(1, weight=1)  # Game Status gets weight
-        main_frame.rowconfigure(2, weight=1)  # Participants gets weight
-        main_frame.rowconfigure(3, weight=0)  # Instructions doesn't need weight
-        
-        # Title
-        title_label = ttk.Label(main_frame, text="🎮 EVE Online Giveaway Tool", font=("Arial", 18, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Game status
-        status_frame = ttk.LabelFrame(main_frame, text="🎯 Game Status", padding="10")
-        status_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
-        
-        # Add settings button to status frame
-        status_header = ttk.Frame(status_frame)
-        status_header.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        
-        settings_btn = ttk.Button(status_header, text="⚙️ Settings", command=self.show_settings)
-        settings_btn.grid(row=0, column=1, sticky=tk.E)
-        
-        # Status text below the header
-        self.status_text = tk.Text(status_frame, height=6, width=90, font=("Consolas", 10), 
-                                  bg="#2b2b2b", fg="white", insertbackground="white")
-        self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Countdown timer display
-        self.countdown_label = ttk.Label(status_frame, text="⏰ No active game", font=("Arial", 12, "bold"), foreground="white")
-        self.countdown_label.grid(row=2, column=0, pady=(5, 0))
-        
-        # Participants
-        participants_frame = ttk.LabelFrame(main_frame, text="👥 Participants", padding="10")
-        participants_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Treeview for participants with sorting
-        columns = ('Username', 'Guess', 'Time')
-        self.participants_tree = ttk.Treeview(participants_frame, columns=columns, show='headings', height=12)
-        
-        # Store sort direction for each column
-        self.sort_directions = {'Username': False, 'Guess': False, 'Time': False}
-        
-        for col in columns:
-            self.participants_tree.heading(col, text=col, 
-                                         command=lambda c=col: self.sort_column(c))
-            self.participants_tree.column(col, width=200)
-        
-        self.participants_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Scrollbar for participants
-        participants_scrollbar = ttk.Scrollbar(participants_frame, orient=tk.VERTICAL, command=self.participants_tree.yview)
-        participants_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.participants_tree.configure(yscrollcommand=participants_scrollbar.set)
-        
-        # Instructions (collapsible)
-        instructions_frame = ttk.LabelFrame(main_frame, text="📖 How to Use", padding="10")
-        instructions_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
-        
-        # Collapse/expand button for instructions
-        self.instructions_collapsed = False
-        instructions_toggle_btn = ttk.Button(instructions_frame, text="🔽 Hide", command=lambda: self.toggle_section("instructions"))
-        instructions_toggle_btn.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        
-        # Instructions content frame
-        self.instructions_content_frame = ttk.Frame(instructions_frame)
-        self.instructions_content_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        instructions = """🎮 ADMIN COMMANDS (use !) - Case Insensitive:
-• !PIR min-max - Start Price is Right game (closest without going over)
-  Example: !PIR 1-100, !pir 0-1000, !Pir 50-500
-• !GTN min-max - Start Guess the Number game (exact match)
-  Example: !GTN 1-100, !gtn 0-1000, !Gtn 50-500
-• !stop - End current game and select winner
-• !status - Show game status and time remaining
-• !clear - Clear current game
-
-🎯 PLAYER COMMANDS (use ?):
-• ?number - Enter current game with number
-  Example: ?50, ?100, ? 500 (space works too)
-
-🏆 GAME RULES:
-• Price is Right: Closest guess ≤ target wins
-• Guess the Number: Exact match wins
-• Multiple winners split prize if tied
-• Games auto-end after 2 minutes
-• Players can only enter once per game
-
-⚙️ ADMIN SETUP:
-• Edit admins.txt to add/remove admin users
-• One username per line, # for comments
-
-🔍 The tool automatically monitors EVE chat logs and updates in real-time."""
-        
-        # Make instructions copyable using Text widget
-        self.instructions_text = tk.Text(self.instructions_content_frame, height=8, width=90, font=("Consolas", 10),
-                                        bg="#2b2b2b", fg="white", insertbackground="white", wrap=tk.WORD)
-        self.instructions_text.insert(tk.END, instructions)
-        self.instructions_text.config(state=tk.DISABLED)  # Read-only but copyable
-        self.instructions_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configure frame weights
-        status_frame.columnconfigure(0, weight=1)
-        status_frame.rowconfigure(0, weight=1)
-        status_frame.rowconfigure(1, weight=0)  # Countdown label doesn't need weight
-        participants_frame.columnconfigure(0, weight=1)
-        participants_frame.columnconfigure(1, weight=0)  # Scrollbar doesn't need weight
-        participants_frame.rowconfigure(0, weight=1)
-        instructions_frame.columnconfigure(0, weight=1)
-        instructions_frame.rowconfigure(1, weight=1)  # Content frame gets the weight
-        
-    def setup_basic_gui(self):
-        """Fallback GUI setup in case dark mode styling fails"""
-        print("Applying basic GUI setup due to dark mode styling error.")
-        # Main frame
-        main_frame = ttk.Frame(self.root, padding="10")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configure grid weights
-        self.root.columnconfigure(0, weight=1)
-        self.root.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(0, weight=1)
-        main_frame.columnconfigure(1, weight=1)
-        main_frame.rowconfigure(1, weight=1)  # Game Status gets weight
-        main_frame.rowconfigure(2, weight=1)  # Participants gets weight
-        main_frame.rowconfigure(3, weight=0)  # Instructions doesn't need weight
-        
-        # Title
-        title_label = ttk.Label(main_frame, text="🎮 EVE Online Giveaway Tool", font=("Arial", 18, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 20))
-        
-        # Game status
-        status_frame = ttk.LabelFrame(main_frame, text="🎯 Game Status", padding="10")
-        status_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 20))
-        
-        # Add settings button to status frame
-        status_header = ttk.Frame(status_frame)
-        status_header.grid(row=0, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        
-        settings_btn = ttk.Button(status_header, text="⚙️ Settings", command=self.show_settings)
-        settings_btn.grid(row=0, column=1, sticky=tk.E)
-        
-        # Status text below the header
-        self.status_text = tk.Text(status_frame, height=6, width=90, font=("Consolas", 10), 
-                                  bg="#2b2b2b", fg="white", insertbackground="white")
-        self.status_text.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Countdown timer display
-        self.countdown_label = ttk.Label(status_frame, text="⏰ No active game", font=("Arial", 12, "bold"), foreground="white")
-        self.countdown_label.grid(row=2, column=0, pady=(5, 0))
-        
-        # Participants
-        participants_frame = ttk.LabelFrame(main_frame, text="👥 Participants", padding="10")
-        participants_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Treeview for participants with sorting
-        columns = ('Username', 'Guess', 'Time')
-        self.participants_tree = ttk.Treeview(participants_frame, columns=columns, show='headings', height=12)
-        
-        # Store sort direction for each column
-        self.sort_directions = {'Username': False, 'Guess': False, 'Time': False}
-        
-        for col in columns:
-            self.participants_tree.heading(col, text=col, 
-                                         command=lambda c=col: self.sort_column(c))
-            self.participants_tree.column(col, width=200)
-        
-        self.participants_tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Scrollbar for participants
-        participants_scrollbar = ttk.Scrollbar(participants_frame, orient=tk.VERTICAL, command=self.participants_tree.yview)
-        participants_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        self.participants_tree.configure(yscrollcommand=participants_scrollbar.set)
-        
-        # Instructions (collapsible)
-        instructions_frame = ttk.LabelFrame(main_frame, text="📖 How to Use", padding="10")
-        instructions_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+    def check_expiry(self):
+        """End the current game if its end time has passed; returns True if it has"""
+        if self.current_game and self.clock() >= self.current_game['end_time']:
+            self.expire_game()
+            return True
+        return False
+    
+    def expire_game(self):
+        """Game time is up: end the game automatically and announce the winner"""
+        if not (self.current_game and self.current_game['active']):
+            return
+        self.current_game['active'] = False
+        self.update_status("⏰ Time's up! Game ended automatically!")
         
-        # Collapse/expand button for instructions
-        self.instructions_collapsed = False
-        instructions_toggle_btn = ttk.Button(instructions_frame, text="🔽 Hide", command=lambda: self.toggle_section("instructions"))
-        instructions_toggle_btn.grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
+        # Select winner
+        if self.current_game['type'] == 'PIR':
+            winner = self.select_pir_winner()
+        else:  # GTN
+            winner = self.select_gtn_winner()
         
-        # Instructions content frame
-        self.instructions_content_frame = ttk.Frame(instructions_frame)
-        self.instructions_content_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        if winner:
+            if winner['type'] == 'single':
+                self.update_status(f"🏆 Game ended! Winner: {winner['name']} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
+            else:  # multiple winners
+                winner_names = ", ".join(winner['names'])
+                self.update_status(f"🏆 Game ended! Winners: {winner_names} with guess {winner['guess']}\n🎯 Target was: {self.current_game['target']}")
+        else:
+            self.update_status("⏰ Game ended! No participants.")
         
-        instructions = """🎮 ADMIN COMMANDS (use !) - Case Insensitive:
-• !PIR min-max - Start Price is Right game (closest without going over)
-  Example: !PIR 1-100, !pir 0-1000, !Pir 50-500
-• !GTN min-max - Start Guess the Number game (exact match)
-  Example: !GTN 1-100, !gtn 0-1000, !Gtn 50-500
-• !stop - End current game and select winner
-• !status - Show game status and time remaining
-• !clear - Clear current game
-
-🎯 PLAYER COMMANDS (use ?):
-• ?number - Enter current game with number
-  Example: ?50, ?100, ? 500 (space works too)
-
-🏆 GAME RULES:
-• Price is Right: Closest guess ≤ target wins
-• Guess the Number: Exact match wins
-• Multiple winners split prize if tied
-• Games auto-end after 2 minutes
-• Players can only enter once per game
-
-⚙️ ADMIN SETUP:
-• Edit admins.txt to add/remove admin users
-• One username per line, # for comments
+        self._record_game_end(winner, 'expired')
+        self._cancel_game_timer()
+    
+    def restore_game(self, saved, resume=True):
+        """Rebuild a game from the journal after a restart and resume it with whatever time it had left
+        
+        With resume=False the game is left waiting, timer not started and not
+        ended even if its time is up, until resume_game() is called; the
+        engine first catches up on the chat written while it was closed.
+        """
+        game = {field: saved[field] for field in JOURNAL_GAME_FIELDS}
+        game['participants'] = ParticipantStore()
+        game['channel'] = self.channel
+        game['active'] = True
+        for name, guess, entered_at in saved['entries']:
+            if game['participants'].add(name, guess, entered_at):
+                self.events.add_participant(name, guess, self.channel, entered_at)
+        self.current_game = game
+        logger.debug("Restored %s game with %s entries", game['type'], len(game['participants']))
+        self.update_status(f"♻️ Restored {game['type']} game started by {game['admin']}!\nRange: {game['range']}\n"
+                           f"👥 {len(game['participants'])} entries recovered")
+        if resume:
+            self.resume_game()
+    
+    def resume_game(self):
+        """Start the timer of a game restored or caught up on, or end it if its time ran out meanwhile"""
+        game = self.current_game
+        if not (game and game['active']):
+            return
+        remaining = (game['end_time'] - self.clock()).total_seconds()
+        if remaining > 0:
+            self.update_status(f"⏰ {game['type']} game continues: {int(remaining // 60):02d}:{int(remaining % 60):02d} left")
+            self.start_game_timer()
+        else:
+            # It ran out while the tool was closed; end it now and announce the result
+            self.expire_game()
+    
+    def _journal_event(self, event, **fields):
+        if self.journal:
+            self.journal.record(event, self.channel, **fields)
+    
+    def _record_game_end(self, winner, reason):
+        if winner:
+            self._journal_event(EVENT_WINNER, names=winner.get('names') or [winner['name']], guess=winner['guess'])
+        self._journal_event(EVENT_STOP, reason=reason)
+        if self.history:
+            self.history.record_game(self.current_game, winner, reason, ended_at=self.clock())
+    
+    def _cancel_game_timer(self, refresh=True):
+        """Cancel the scheduled expiry and countdown ticks of the current game"""
+        if not self.auto_timer:
+            return
+        self.scheduler.cancel(self.expiry_call)
+        self.scheduler.cancel(self.countdown_call)
+        self.expiry_call = None
+        self.countdown_call = None
+        if refresh:
+            # Show the final state instead of a frozen countdown
+            self.events.update_countdown(self.current_game, self.channel)
 
-🔍 The tool automatically monitors EVE chat logs and updates in real-time."""
-        
-        # Make instructions copyable using Text widget
-        self.instructions_text = tk.Text(self.instructions_content_frame, height=8, width=90, font=("Consolas", 10),
-                                        bg="#2b2b2b", fg="white", insertbackground="white", wrap=tk.WORD)
-        self.instructions_text.insert(tk.END, instructions)
-        self.instructions_text.config(state=tk.DISABLED)  # Read-only but copyable
-        self.instructions_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+class GiveawayEngine:
+    """Everything that runs giveaways, with no GUI: chat log monitoring, one GameManager per channel,
+    the game timers, journal, history and metrics
+    
+    Game events are published on self.events; the Tk window is just one
+    subscriber, and a headless run subscribes a ConsoleStatus instead.
+    start() recovers interrupted games and starts watching the logs
+    directory, stop() shuts every background thread down. Construction
+    only sets things up; all disk scanning happens in start(), which the
+    GUI runs in the background once the window is up.
+    """
+    
+    # Periodic JSON snapshot of the hot-path metrics
+    METRICS_FILE = 'metrics.json'
+    
+    # Logs read at once when catching up after a restart, and the most read from one per pass
+    CATCH_UP_WORKERS = 4
+    CATCH_UP_CHUNK_BYTES = 256 * 1024
+    
+    def __init__(self, config_manager=None, profile=None):
+        self.config_manager = config_manager or ConfigManager()
+        self.events = EventBus()
+        # Startup phase timings for --profile-startup (a disabled profile records nothing)
+        self.profile = profile or StartupProfile()
+        self._stopped = False
+        self._startup_thread = None
+        
+        # Game managers, one per chat channel, share the admin list and the timer thread
+        self.admin_registry = AdminRegistry()
+        self.scheduler = DeadlineScheduler()
+        self.journal = GameJournal()
+        self.history = GameHistory()
+        # Read positions in every log, so a restart picks up what was written while closed
+        self.checkpoints = ReadCheckpoints()
+        
+        # Hot-path timings for the stats panel and the periodic metrics.json snapshot
+        self.metrics = Metrics()
+        
+        # Chat monitor
+        chat_monitor_path = self.config_manager.get_eve_logs_path()
+        self.chat_monitor = EVEChatMonitor(self.create_game_manager, chat_monitor_path, metrics=self.metrics,
+                                           checkpoints=self.checkpoints, dedup=MessageDeduplicator())
+        self.observer = None
+        # Stats polling for synced and network folders, per CHANGE_DETECTION (None with native events only)
+        self.poller = None
+        self.metrics.add_source('change_detection', self.get_change_detection_stats)
+    
+    def start(self, background=False):
+        """Pick up any giveaway still running at the last exit, then start watching the chat logs
+        
+        With background=True this runs on its own thread and returns at once,
+        so path detection and the backlog scan don't hold up the window.
+        """
+        if background:
+            self._startup_thread = threading.Thread(target=self._start, name="EngineStartup", daemon=True)
+            self._startup_thread.start()
+        else:
+            self._start()
+    
+    def _start(self):
+        snapshot_seconds = self.config_manager.get_metrics_snapshot_seconds()
+        if snapshot_seconds > 0:
+            self.metrics.start_snapshots(self.METRICS_FILE, snapshot_seconds)
+        with self.profile.phase('recover games'):
+            self.recover_games()
+        self.start_monitoring()
+        self.profile.done('engine')
+    
+    def stop(self):
+        """Stop monitoring and every background thread, flushing the journal and history"""
+        self._stopped = True
+        # Startup stops at its next check of _stopped; let it, so it can't start watching after unwatch()
+        if self._startup_thread is not None and self._startup_thread is not threading.current_thread():
+            self._startup_thread.join(timeout=30)
+        # Ingest first, so no game event or read offset arrives after the writers below are closed
+        self.unwatch()
+        self.chat_monitor.stop()
+        self.scheduler.stop()
+        self.metrics.stop()
+        self.journal.close()
+        self.history.close()
+        self.checkpoints.close()
+    
+    def create_game_manager(self, channel):
+        """Game manager for a newly seen chat channel"""
+        return GameManager(self.events, self.config_manager, admin_registry=self.admin_registry,
+                           scheduler=self.scheduler, channel=channel, journal=self.journal,
+                           history=self.history, metrics=self.metrics)
+    
+    def recover_games(self):
+        """Rebuild games that were running at the last exit or crash from the game journal
         
-        # Configure frame weights
-        status_frame.columnconfigure(0, weight=1)
-        status_frame.rowconfigure(0, weight=1)
-        status_frame.rowconfigure(1, weight=0)  # Countdown label doesn't need weight
-        participants_frame.columnconfigure(0, weight=1)
-        participants_frame.columnconfigure(1, weight=0)  # Scrollbar doesn't need weight
-        participants_frame.rowconfigure(0, weight=1)
-        instructions_frame.columnconfigure(0, weight=1)
-        instructions_frame.rowconfigure(1, weight=1)  # Content frame gets the weight
+        They are not resumed yet: the catch-up may hold entries made, or the
+        game's end, while the tool was closed. resume_games() follows it.
+        """
+        try:
+            for channel, saved in self.journal.load_active_games().items():
+                self.chat_monitor.game_manager_for(channel).restore_game(saved, resume=False)
+        except Exception as e:
+            logger.error("Error recovering games from journal: %s", e)
+    
+    def resume_games(self):
+        """Start the timers of games still running after recovery and catch-up, ending those whose time is up"""
+        for game_manager in list(self.chat_monitor.game_managers.values()):
+            try:
+                game_manager.resume_game()
+            except Exception as e:
+                logger.error("Error resuming game in %s: %s", game_manager.channel, e)
     
     def start_monitoring(self):
         # Use configured path or enhanced auto-detection
         eve_logs_path = self.config_manager.get_eve_logs_path()
         if not eve_logs_path:
             # Use the enhanced path detection from EVEChatMonitor
-            eve_logs_path = self.chat_monitor.detect_eve_logs_path()
+            with self.profile.phase('detect logs path'):
+                eve_logs_path = self.chat_monitor.detect_eve_logs_path()
+            self.chat_monitor.eve_logs_path = eve_logs_path
         
         if os.path.exists(eve_logs_path):
-            self.observer = Observer()
-            self.observer.schedule(self.chat_monitor, eve_logs_path, recursive=False)
-            self.observer.start()
-            
-            # Find and monitor the most recent chat log file
-            self.find_and_monitor_latest_chatlog(eve_logs_path)
-            
-            # Process existing files in the directory
-            self.process_existing_files(eve_logs_path)
-            
-            self.update_game_status(f"🔍 Monitoring EVE chat logs at: {eve_logs_path}\n✅ Ready for games!\n\nUse !PIR or !GTN to start a game!")
-            
-            # Start countdown timer update
-            self.start_countdown_timer()
+            self.begin_monitoring(eve_logs_path)
         else:
             # Try to find an alternative path
-            alternative_path = self.chat_monitor.detect_eve_logs_path()
+            with self.profile.phase('detect logs path'):
+                alternative_path = self.chat_monitor.detect_eve_logs_path()
             if alternative_path != eve_logs_path and os.path.exists(alternative_path):
-                self.observer = Observer()
-                self.observer.schedule(self.chat_monitor, alternative_path, recursive=False)
-                self.observer.start()
-                
-                # Find and monitor the most recent chat log file
-                self.find_and_monitor_latest_chatlog(alternative_path)
-                
-                # Process existing files in the directory
-                self.process_existing_files(alternative_path)
-                
-                self.update_game_status(f"🔍 Monitoring EVE chat logs at: {alternative_path}\n✅ Ready for games!\n\nUse !PIR or !GTN to start a game!")
-                
-                # Start countdown timer update
-                self.start_countdown_timer()
+                self.chat_monitor.eve_logs_path = alternative_path
+                self.begin_monitoring(alternative_path)
             else:
-                self.update_game_status(f"❌ EVE logs directory not found at: {eve_logs_path}\nAlternative path also not found: {alternative_path}\nPlease check your EVE Online installation or configure the path in settings.")
+                # Nothing to catch up on, so recovered games go on (or end) by the clock
+                self.resume_games()
+                self.events.update_game_status(f"❌ EVE logs directory not found at: {eve_logs_path}\nAlternative path also not found: {alternative_path}\nPlease check your EVE Online installation or configure the path in settings.")
+    
+    def begin_monitoring(self, logs_directory):
+        """Watch logs_directory and catch up on recent logs, reporting how long startup took"""
+        started = time.perf_counter()
+        # Scan the directory once; file events keep the index current from here on
+        with self.profile.phase('index logs'):
+            self.chat_monitor.chat_index.seed(logs_directory)
+        
+        # Read what was written while the tool was closed, before anything else reads those logs
+        with self.profile.phase('catch-up'):
+            caught_up = self.catch_up()
+        if self._stopped:
+            return
+        # Only now can recovered games and those started during the catch-up be timed or ended
+        self.resume_games()
+        
+        # Before watching, or the first write to an old log would replay its whole history
+        with self.profile.phase('backlog scan'):
+            files_read, files_indexed = self.process_existing_files(logs_directory)
+        
+        with self.profile.phase('start file watcher'):
+            self.watch(logs_directory)
+        # Anything written during the catch-up came before the watcher was looking
+        for file_path in caught_up:
+            self.chat_monitor.event_queue.put(file_path)
+        
+        # Find and monitor the most recent chat log file
+        with self.profile.phase('latest chat log'):
+            self.find_and_monitor_latest_chatlog(logs_directory)
+        elapsed = time.perf_counter() - started
+        
+        self.events.update_game_status(f"🔍 Monitoring EVE chat logs at: {logs_directory}\n"
+                                       f"✅ Ready for games in {elapsed:.2f}s (read the tails of {files_read} of "
+                                       f"{files_indexed} logs)\n\n"
+                                       f"Use !PIR or !GTN to start a game!")
+    
+    def mark_logs_read(self):
+        """Treat every indexed log not already being tailed as read up to the size the index saw
+        
+        Only what is written from now on is acted on; logs created after the
+        index was seeded are not in it, so they are still read from the start.
+        Every indexed log's read position is also saved as its checkpoint, so
+        after a restart whatever was written to an idle log while the tool
+        was closed is caught up on rather than skipped.
+        """
+        chat_monitor = self.chat_monitor
+        chat_index = chat_monitor.chat_index
+        tailer = chat_monitor.tailer
+        for file_path, size in list(chat_index.sizes.items()):
+            if file_path not in tailer.files:
+                tailer.start_at(file_path, size, chat_index.inodes.get(file_path))
+            position = tailer.position(file_path)
+            if position is not None:
+                self.checkpoints.update(file_path, position[0], position[1], chat_monitor.file_channels.get(file_path))
+    
+    def watch(self, logs_directory):
+        """Start finding changed logs in logs_directory with the CHANGE_DETECTION backend"""
+        mode = self.config_manager.get_change_detection()
+        if mode != MODE_POLLING:
+            # Imported here so loading watchdog's observers stays off the startup path
+            from watchdog.observers import Observer
+            self.observer = Observer()
+            self.observer.schedule(self.chat_monitor, logs_directory, recursive=False)
+            self.observer.start()
+        if mode != MODE_NATIVE:
+            scan_hours = self.config_manager.get_startup_scan_hours()
+            self.poller = ChatLogPoller(self.chat_monitor, logs_directory, is_busy=self.chat_monitor.has_active_game,
+                                        active_interval=self.config_manager.get_poll_active_seconds(),
+                                        idle_interval=self.config_manager.get_poll_idle_seconds(),
+                                        active_seconds=scan_hours * 3600 if scan_hours else float('inf'),
+                                        standby=mode == MODE_AUTO, on_fallback=self.on_polling_fallback)
+            self.poller.start()
+        logger.debug("Watching %s for changes (CHANGE_DETECTION=%s)", logs_directory, mode)
+    
+    def unwatch(self):
+        """Stop the file watcher and the poller"""
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+        if self.poller:
+            self.poller.stop()
+            self.poller = None
+    
+    def on_polling_fallback(self, file_path):
+        """Native file events missed a change, so the poller has taken over"""
+        self.events.update_game_status(f"⚠️ File events from {os.path.dirname(file_path)} stopped arriving "
+                                       f"(synced or network folder?); polling for chat instead")
+    
+    def get_change_detection_stats(self):
+        """Which backend finds changed logs, with the poller's counters when it runs"""
+        stats = {'mode': self.config_manager.get_change_detection(), 'native': self.observer is not None}
+        poller = self.poller
+        if poller:
+            stats['poller'] = poller.get_stats()
+        return stats
     
     def find_and_monitor_latest_chatlog(self, logs_directory):
         """Find the most recent chat log file and set it as the current one to monitor"""
         try:
-            # Find all chat log files
-            chat_files = []
-            for filename in os.listdir(logs_directory):
-                if filename.endswith('.txt') and 'Chat' in filename:
-                    file_path = os.path.join(logs_directory, filename)
-                    try:
-                        mod_time = os.path.getmtime(file_path)
-                        chat_files.append((filename, mod_time, file_path))
-                    except:
-                        continue
+            # Scan the directory once; file events keep the index current from here on
+            if self.chat_monitor.chat_index.logs_directory != logs_directory:
+                self.chat_monitor.chat_index.seed(logs_directory)
+            latest_path = self.chat_monitor.chat_index.newest_chat_log()
             
-            if chat_files:
-                # Sort by modification time (newest first)
-                chat_files.sort(key=lambda x: x[1], reverse=True)
-                latest_file = chat_files[0]
+            if latest_path:
+                latest_name = os.path.basename(latest_path)
                 
                 # Set this as the current chat file to monitor
-                self.chat_monitor.current_chat_file = latest_file[0]
-                print(f"DEBUG: Monitoring latest chat log: {latest_file[0]} (modified: {time.ctime(latest_file[1])})")
+                self.chat_monitor.current_chat_file = latest_name
+                logger.debug("Monitoring latest chat log: %s (modified: %s)",
+                             latest_name, time.ctime(self.chat_monitor.chat_index.files[latest_path]))
                 
                 # Process this file to catch up on any recent messages
-                self.chat_monitor.process_chat_log(latest_file[2])
+                self.chat_monitor.prime_chat_log(latest_path)
             else:
-                print("DEBUG: No chat log files found in directory")
+                logger.debug("No chat log files found in directory")
                 
         except Exception as e:
-            print(f"Error finding latest chat log: {e}")
+            logger.error("Error finding latest chat log: %s", e)
+    
+    def catch_up(self):
+        """Resume every indexed log from its saved checkpoint, reading what was written since in parallel
+        
+        Logs with no checkpoint that changed after the checkpoints were last
+        saved, i.e. created or replaced while the tool was closed, are read
+        from the start, their channel taken from the header.
+        
+        Each channel's logs are read by one task, so its lines still reach its
+        game in order; different channels are read at the same time. Within
+        a channel, chunks of its logs are merged by chat time, so an older
+        session's log is read before a newer one and multiboxed clients'
+        copies of a message are read close enough together for the dedup
+        window. While a channel is caught up, its game runs on a LogClock, so
+        games start, take entries and end at the log times of the messages
+        rather than now; admin commands from before the startup window are
+        ignored. Progress goes to the status pane. Returns the logs that were
+        resumed.
+        """
+        chat_monitor = self.chat_monitor
+        chat_index = chat_monitor.chat_index
+        last_saved = self.checkpoints.last_saved()
+        saved = self.checkpoints.load()
+        resumed = []
+        behind = {}  # channel -> [(mtime, file_path, bytes to read)]
+        for file_path, checkpoint in list(saved.items()):
+            if file_path not in chat_index.files:
+                if not os.path.exists(file_path):
+                    self.checkpoints.forget(file_path)
+                continue
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            offset, inode = checkpoint['offset'], checkpoint.get('inode')
+            if stat.st_size < offset or (inode and stat.st_ino and stat.st_ino != inode):
+                # Truncated or replaced since; read from the start below, like a log created while closed
+                self.checkpoints.forget(file_path)
+                del saved[file_path]
+                continue
+            chat_monitor.tailer.start_at(file_path, offset, inode)
+            if checkpoint.get('channel'):
+                chat_monitor.file_channels[file_path] = checkpoint['channel']
+            resumed.append(file_path)
+            if stat.st_size > offset:
+                channel = chat_monitor.channel_for_file(file_path)
+                behind.setdefault(channel, []).append((stat.st_mtime, file_path, stat.st_size - offset))
+        
+        # Logs without a checkpoint that changed after the last save were created or replaced while the tool
+        # was closed, so everything in them is new; without a checkpoints file this is a first run and nothing is
+        scan_hours = self.config_manager.get_startup_scan_hours()
+        if last_saved is not None:
+            oldest = max(last_saved, time.time() - scan_hours * 3600) if scan_hours else last_saved
+            for file_path, mtime in list(chat_index.files.items()):
+                if file_path in saved or mtime <= oldest or not chat_index.sizes.get(file_path):
+                    continue
+                channel = chat_monitor.read_channel_header(file_path)
+                chat_monitor.tailer.start_at(file_path, 0)
+                resumed.append(file_path)
+                behind.setdefault(channel, []).append((mtime, file_path, chat_index.sizes[file_path]))
+        if not behind:
+            return resumed
+        
+        logs = sum(len(files) for files in behind.values())
+        progress = {'total': sum(size for files in behind.values() for _, _, size in files),
+                    'read': 0, 'lines': 0, 'logs_done': 0, 'reported': time.monotonic()}
+        progress_lock = threading.Lock()
+        started = time.perf_counter()
+        self.events.update_game_status(f"⏳ Catching up on {logs} log(s): {progress['total'] / 1048576:.1f} MB "
+                                       f"written while the tool was closed...")
+        commands_since = datetime.now() - timedelta(hours=scan_hours) if scan_hours else None
+        
+        def advance(read, lines, log_done=False):
+            with progress_lock:
+                progress['read'] += read
+                progress['lines'] += lines
+                progress['logs_done'] += log_done
+                now = time.monotonic()
+                if now - progress['reported'] < 1.0:
+                    return
+                progress['reported'] = now
+                # Logs still being written to can run past the total measured at the start
+                message = (f"⏳ Catch-up {min(progress['read'] / progress['total'], 1):.0%} "
+                           f"({progress['logs_done']} of {logs} logs, {progress['lines']:,} lines)")
+            self.events.update_game_status(message)
+        
+        def catch_up_channel(channel, files):
+            tailer = chat_monitor.tailer
+            game_manager = chat_monitor.game_manager_for(channel)
+            log_clock = LogClock()
+            
+            def follow_log_time(chat_message):
+                return self.follow_log_time(game_manager, log_clock, chat_message, commands_since)
+            
+            heads = []  # (chat time of the first line, mtime, file_path, lines, position, bytes read)
+            
+            def read_ahead(mtime, file_path):
+                before = tailer.files[file_path]['offset']
+                lines = tailer.read_new_lines(file_path, max_bytes=self.CATCH_UP_CHUNK_BYTES)
+                state = tailer.files.get(file_path)
+                if state is None or state['offset'] == before:
+                    advance(0, 0, log_done=True)
+                    return
+                first = next((timestamp for timestamp in map(line_timestamp, lines) if timestamp), '')
+                heads.append((first, mtime, file_path, lines, tailer.position(file_path), state['offset'] - before))
+            
+            # One chunk is read ahead from each log and the one that starts earliest is ingested next
+            for mtime, file_path, _ in files:
+                read_ahead(mtime, file_path)
+            # Timers run on the wall clock, so none are started until resume_games()
+            clock, auto_timer = game_manager.clock, game_manager.auto_timer
+            game_manager.clock, game_manager.auto_timer = log_clock, False
+            try:
+                while heads and not self._stopped:
+                    head = min(heads, key=lambda head: head[:2])
+                    heads.remove(head)
+                    _, mtime, file_path, lines, position, read = head
+                    # Already on this channel's only task, so no need to go through the channel workers
+                    chat_monitor.ingest_lines(file_path, lines, channel, position=position, on_message=follow_log_time)
+                    advance(read, len(lines))
+                    read_ahead(mtime, file_path)
+            finally:
+                game_manager.clock, game_manager.auto_timer = clock, auto_timer
+        
+        with ThreadPoolExecutor(max_workers=min(self.CATCH_UP_WORKERS, len(behind)),
+                                thread_name_prefix="CatchUp") as pool:
+            futures = {pool.submit(catch_up_channel, channel, files): channel for channel, files in behind.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("Error catching up on channel %s: %s", futures[future], e)
+        
+        self.events.update_game_status(f"✅ Caught up on {logs} log(s): {progress['lines']:,} lines "
+                                       f"in {time.perf_counter() - started:.2f}s")
+        return resumed
+    
+    def follow_log_time(self, game_manager, log_clock, chat_message, commands_since=None):
+        """Catch-up hook: move game_manager's LogClock to chat_message's log time before it is dispatched
+        
+        A game whose end time comes before the message is ended first, at its
+        end time, as its timer would have. Returns False for messages not to
+        act on: those before the first timestamp, and admin commands older
+        than commands_since.
+        """
+        log_time = log_clock.read(chat_message.timestamp)
+        if log_time is None:
+            return False
+        game = game_manager.current_game
+        if game and game['active'] and log_time >= game['end_time']:
+            log_clock.now = game['end_time']
+            game_manager.check_expiry()
+        log_clock.now = log_time
+        if (commands_since is not None and chat_message.command not in (None, CMD_ENTRY)
+                and log_time < commands_since):
+            logger.debug("Ignoring %s from %s at %s, before the startup window",
+                         chat_message.command, chat_message.speaker, chat_message.timestamp)
+            return False
+        return True
     
     def restart_monitoring(self, new_path):
         """Restart file monitoring with a new path"""
         try:
-            print(f"DEBUG: Restarting monitoring with new path: {new_path}")
+            logger.debug("Restarting monitoring with new path: %s", new_path)
             
             # Stop current monitoring
-            if self.observer:
-                self.observer.stop()
-                self.observer.join()
-                self.observer = None
+            self.unwatch()
             
             # Update chat monitor path
             self.chat_monitor.eve_logs_path = new_path
             
             # Start new monitoring
             if os.path.exists(new_path):
-                self.observer = Observer()
-                self.observer.schedule(self.chat_monitor, new_path, recursive=False)
-                self.observer.start()
-                
-                # Process existing files in the new directory
+                # Process existing files in the new directory before watching it
                 self.process_existing_files(new_path)
+                self.watch(new_path)
                 
-                self.update_game_status(f"🔄 Monitoring restarted at: {new_path}\n✅ Ready for games!")
-                print(f"DEBUG: Monitoring restarted successfully at {new_path}")
+                # Find and monitor the most recent chat log file
+                self.find_and_monitor_latest_chatlog(new_path)
+                
+                self.events.update_game_status(f"🔄 Monitoring restarted at: {new_path}\n✅ Ready for games!")
+                logger.debug("Monitoring restarted successfully at %s", new_path)
             else:
-                self.update_game_status(f"❌ Cannot monitor {new_path} - directory not found")
-                print(f"DEBUG: Failed to restart monitoring - path not found: {new_path}")
+                self.events.update_game_status(f"❌ Cannot monitor {new_path} - directory not found")
+                logger.debug("Failed to restart monitoring - path not found: %s", new_path)
                 
         except Exception as e:
-            print(f"Error restarting monitoring: {e}")
-            self.update_game_status(f"❌ Error restarting monitoring: {e}")
+            logger.error("Error restarting monitoring: %s", e)
+            self.events.update_game_status(f"❌ Error restarting monitoring: {e}")
     
     def process_existing_files(self, directory_path):
-        """Process all existing .txt files in the directory"""
+        """Catch up on recently active logs at startup, reading only their tails, then mark every log read
+        
+        Only the newest line of each tail is acted on (prime_chat_log). Logs
+        outside the configured startup window, and the tails just read, are
+        left where mark_logs_read() puts them: read up to their end. Logs
+        already tailed, e.g. resumed by the catch-up, are skipped. Returns
+        (tails read, logs indexed).
+        """
         try:
             if not os.path.exists(directory_path) or not os.path.isdir(directory_path):
-                return
-            
-            txt_files = [f for f in os.listdir(directory_path) if f.endswith('.txt')]
-            if not txt_files:
-                print(f"DEBUG: No .txt files found in {directory_path}")
-                return
-            
-            print(f"DEBUG: Processing {len(txt_files)} existing .txt files in {directory_path}")
-            
-            for filename in txt_files:
-                file_path = os.path.join(directory_path, filename)
-                try:
-                    # Check if file has content (not empty)
-                    if os.path.getsize(file_path) > 0:
-                        print(f"DEBUG: Processing existing file: {filename}")
-                        self.chat_monitor.process_chat_log(file_path)
-                except Exception as e:
-                    print(f"DEBUG: Error processing existing file {filename}: {e}")
-                    
-        except Exception as e:
-            print(f"Error processing existing files: {e}")
-    
-    def start_countdown_timer(self):
-        """Start a timer that updates the countdown display every second"""
-        def countdown_update():
-            while True:
-                try:
-                    if hasattr(self, 'game_manager') and self.game_manager.current_game and self.game_manager.current_game['active']:
-                        # Calculate time remaining
-                        time_remaining = self.game_manager.current_game['end_time'] - datetime.now()
-                        if time_remaining.total_seconds() > 0:
-                            minutes = int(time_remaining.total_seconds() // 60)
-                            seconds = int(time_remaining.total_seconds() % 60)
-                            time_str = f"⏰ Game ends in: {minutes:02d}:{seconds:02d}"
-                            
-                            # Color coding: red when less than 1 minute, orange when less than 2 minutes
-                            if time_remaining.total_seconds() < 60:
-                                self.countdown_label.config(foreground="#ff6b6b")  # Light red
-                            elif time_remaining.total_seconds() < 120:
-                                self.countdown_label.config(foreground="#ffa726")  # Light orange
-                            else:
-                                self.countdown_label.config(foreground="#66bb6a")  # Light green
-                        else:
-                            time_str = "⏰ Game ended!"
-                            self.countdown_label.config(foreground="#9e9e9e")  # Light gray
-                        
-                        self.countdown_label.config(text=time_str)
-                    else:
-                        self.countdown_label.config(text="⏰ No active game", foreground="#9e9e9e")  # Light gray
-                    
-                    time.sleep(1)  # Update every second
-                except Exception as e:
-                    print(f"Error updating countdown: {e}")
-                    time.sleep(1)
-        
-        # Start countdown in a separate thread
-        countdown_thread = threading.Thread(target=countdown_update, daemon=True)
-        countdown_thread.start()
-        
-        # Start chat log monitoring check every  seconds
-        def chatlog_monitor():
-            while True:
+                return 0, 0
+            
+            chat_index = self.chat_monitor.chat_index
+            if chat_index.logs_directory != directory_path:
+                chat_index.seed(directory_path)
+            if not len(chat_index):
+                logger.debug("No .txt files found in %s", directory_path)
+                return 0, 0
+            
+            scan_hours = self.config_manager.get_startup_scan_hours()
+            recent_files = chat_index.recent_logs(max_age_seconds=scan_hours * 3600 if scan_hours else None,
+                                                  per_channel=self.config_manager.get_startup_files_per_channel())
+            tailer = self.chat_monitor.tailer
+            recent_files = [file_path for file_path in recent_files
+                            if file_path not in tailer.files and chat_index.sizes.get(file_path)]
+            logger.debug("Reading tails of %s of %s existing .txt files in %s",
+                         len(recent_files), len(chat_index), directory_path)
+            
+            tails_read = 0
+            for file_path in recent_files:
+                if self._stopped:
+                    break
                 try:
-                    if hasattr(self, 'chat_monitor') and hasattr(self.chat_monitor, 'eve_logs_path'):
-                        self.chat_monitor.check_for_newer_chatlog()
-                    time.sleep(1)  # Check every 5 seconds
+                    logger.debug("Processing existing file: %s", os.path.basename(file_path))
+                    self.chat_monitor.prime_chat_log(file_path)
+                    tails_read += file_path in tailer.files
                 except Exception as e:
-                    print(f"Error in chat log monitor: {e}")
-                    time.sleep(1)
-        
-        # Start chat log monitoring in a separate thread
-        chatlog_thread = threading.Thread(target=chatlog_monitor, daemon=True)
-        chatlog_thread.start()
-    
-    def show_settings(self):
-        """Show settings dialog for configuring EVE logs path and other options"""
-        settings_window = tk.Toplevel(self.root)
-        settings_window.title("⚙️ Settings")
-        settings_window.geometry("600x500")
-        settings_window.resizable(False, False)
-        settings_window.transient(self.root)
-        settings_window.grab_set()
-        
-        # Apply dark mode to settings window
-        self.apply_dark_mode_to_window(settings_window)
-        
-        # Center the window
-        settings_window.geometry("+%d+%d" % (self.root.winfo_rootx() + 50, self.root.winfo_rooty() + 50))
-        
-        # Main frame
-        main_frame = ttk.Frame(settings_window, padding="30")
-        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Title
-        title_label = ttk.Label(main_frame, text="⚙️ EVE Giveaway Tool Settings", font=("Arial", 16, "bold"))
-        title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
-        
-        # EVE Logs Path
-        path_frame = ttk.LabelFrame(main_frame, text="📁 EVE Chat Logs Path", padding="10")
-        path_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        ttk.Label(path_frame, text="Path to EVE Online chat logs folder:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        
-        self.path_var = tk.StringVar(value=self.config_manager.get_eve_logs_path() or "")
-        path_entry = ttk.Entry(path_frame, textvariable=self.path_var, width=50)
-        path_entry.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        
-        browse_btn = ttk.Button(path_frame, text="Browse...", command=self.browse_eve_logs_path)
-        browse_btn.grid(row=1, column=1, padx=(10, 0))
-        
-        ttk.Label(path_frame, text="Leave empty to use automatic detection", font=("Arial", 9)).grid(row=2, column=0, sticky=tk.W)
-        
-        # Game Timer
-        timer_frame = ttk.LabelFrame(main_frame, text="⏰ Game Timer", padding="10")
-        timer_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        ttk.Label(timer_frame, text="Game duration in minutes:").grid(row=0, column=0, sticky=tk.W, pady=(0, 5))
-        
-        self.timer_var = tk.StringVar(value=str(self.config_manager.get_game_timer_minutes()))
-        timer_entry = ttk.Entry(timer_frame, textvariable=self.timer_var, width=10)
-        timer_entry.grid(row=1, column=0, sticky=tk.W)
-        
-        # Debug Mode
-        debug_frame = ttk.LabelFrame(main_frame, text="🐛 Debug Mode", padding="10")
-        debug_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
-        
-        self.debug_var = tk.BooleanVar(value=self.config_manager.is_debug_mode())
-        debug_check = ttk.Checkbutton(debug_frame, text="Enable debug output", variable=self.debug_var)
-        debug_check.grid(row=0, column=0, sticky=tk.W)
-        
-        # Buttons - Make sure they're visible and properly styled
-        button_frame = ttk.Frame(main_frame)
-        button_frame.grid(row=4, column=0, columnspan=2, pady=(0, 10), sticky=(tk.W, tk.E))
-        
-        # Save button - Make it more prominent and ensure it's visible
-        save_btn = tk.Button(button_frame, text="💾 Save Settings", command=lambda: self.save_settings(settings_window), 
-                           bg="#4CAF50", fg="white", font=("Arial", 12, "bold"), 
-                           relief=tk.RAISED, bd=3, padx=20, pady=10)
-        save_btn.grid(row=0, column=0, padx=(0, 10), sticky=tk.W)
-        
-        cancel_btn = tk.Button(button_frame, text="❌ Cancel", command=settings_window.destroy,
-                             bg="#f44336", fg="white", font=("Arial", 12, "bold"),
-                             relief=tk.RAISED, bd=3, padx=20, pady=10)
-        cancel_btn.grid(row=0, column=1, sticky=tk.E)
-        
-        # Configure button frame columns to expand properly
-        button_frame.columnconfigure(0, weight=1)
-        button_frame.columnconfigure(1, weight=1)
-        
-        # Force the buttons to be visible by updating the window
-        settings_window.update()
-        
-        # Configure grid weights
-        settings_window.columnconfigure(0, weight=1)
-        settings_window.rowconfigure(0, weight=1)
-        main_frame.columnconfigure(0, weight=1)
-        path_frame.columnconfigure(0, weight=1)
-        
-        # Apply dark mode styling to specific widgets after creation
-        self.apply_dark_mode_to_settings_widgets(settings_window)
-        
-        # Force update to ensure buttons are visible
-        settings_window.update_idletasks()
-    
-    def browse_eve_logs_path(self):
-        """Browse for EVE logs directory"""
-        from tkinter import filedialog
-        directory = filedialog.askdirectory(title="Select EVE Chat Logs Folder")
-        if directory:
-            self.path_var.set(directory)
-    
-    def save_settings(self, settings_window):
-        """Save settings to config.txt file"""
-        try:
-            # Validate inputs
-            timer_value = self.timer_var.get().strip()
-            if not timer_value.isdigit() or int(timer_value) < 1:
-                from tkinter import messagebox
-                messagebox.showerror("Invalid Input", "Game timer must be a positive number!")
-                return
-            
-            # Validate EVE logs path if provided
-            new_path = self.path_var.get().strip()
-            if new_path and not os.path.exists(new_path):
-                from tkinter import messagebox
-                messagebox.showerror("Invalid Path", f"The path '{new_path}' does not exist!")
-                return
-            
-            if new_path and not os.path.isdir(new_path):
-                from tkinter import messagebox
-                messagebox.showerror("Invalid Path", f"The path '{new_path}' is not a directory!")
-                return
-            
-            # Check if path contains any .txt files
-            if new_path:
-                txt_files = [f for f in os.listdir(new_path) if f.endswith('.txt')]
-                if not txt_files:
-                    from tkinter import messagebox
-                    result = messagebox.askyesno("No Chat Logs", 
-                        f"The directory '{new_path}' contains no .txt files.\n\n"
-                        "This might not be an EVE chat logs directory.\n\n"
-                        "Do you want to continue anyway?")
-                    if not result:
-                        return
-            
-            # Read existing config or create new
-            config_lines = []
-            if os.path.exists('config.txt'):
-                with open('config.txt', 'r', encoding='utf-8') as f:
-                    config_lines = f.readlines()
-            
-            # Update or add settings
-            new_lines = []
-            settings_updated = {'EVE_LOGS_PATH': False, 'GAME_TIMER_MINUTES': False, 'DEBUG_MODE': False}
-            
-            for line in config_lines:
-                if line.startswith('EVE_LOGS_PATH='):
-                    new_lines.append(f"EVE_LOGS_PATH={self.path_var.get()}\n")
-                    settings_updated['EVE_LOGS_PATH'] = True
-                elif line.startswith('GAME_TIMER_MINUTES='):
-                    new_lines.append(f"GAME_TIMER_MINUTES={timer_value}\n")
-                    settings_updated['GAME_TIMER_MINUTES'] = True
-                elif line.startswith('DEBUG_MODE='):
-                    new_lines.append(f"DEBUG_MODE={str(self.debug_var.get()).lower()}\n")
-                    settings_updated['DEBUG_MODE'] = True
-                else:
-                    new_lines.append(line)
-            
-            # Add new settings if they didn't exist
-            if not settings_updated['EVE_LOGS_PATH']:
-                new_lines.append(f"EVE_LOGS_PATH={self.path_var.get()}\n")
-            if not settings_updated['GAME_TIMER_MINUTES']:
-                new_lines.append(f"GAME_TIMER_MINUTES={timer_value}\n")
-            if not settings_updated['DEBUG_MODE']:
-                new_lines.append(f"DEBUG_MODE={str(self.debug_var.get()).lower()}\n")
-            
-            # Write updated config
-            with open('config.txt', 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            
-            # Reload config
-            self.config_manager.load_config()
-            
-            # Restart monitoring with new path if it changed
-            old_path = self.config_manager.get_eve_logs_path()
-            if new_path != old_path:
-                self.restart_monitoring(new_path)
-            
-            # Show success message
-            from tkinter import messagebox
-            messagebox.showinfo("Settings Saved", "Settings have been saved successfully!\n\nMonitoring has been updated to use the new path.")
-            
-            # Close the settings window
-            settings_window.destroy()
-            
-        except Exception as e:
-            from tkinter import messagebox
-            messagebox.showerror("Error", f"Failed to save settings: {e}")
-            print(f"Error saving settings: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def toggle_section(self, section):
-        """Toggle the visibility of a section (collapse/expand)"""
-        if section == "instructions":
-            if self.instructions_collapsed:
-                # Expand
-                self.instructions_content_frame.grid()
-                self.instructions_collapsed = False
-                # Update button text
-                for child in self.instructions_content_frame.master.winfo_children():
-                    if isinstance(child, ttk.Button):
-                        child.config(text="🔽 Hide")
-            else:
-                # Collapse
-                self.instructions_content_frame.grid_remove()
-                self.instructions_collapsed = True
-                # Update button text
-                for child in self.instructions_content_frame.master.winfo_children():
-                    if isinstance(child, ttk.Button):
-                        child.config(text="▶️ Show")
-    
-    def apply_dark_mode(self):
-        """Apply dark mode styling to the application"""
-        try:
-            # Configure ttk styles for dark mode
-            style = ttk.Style()
-            
-            # Try to use clam theme, fallback to default if not available
-            try:
-                style.theme_use('clam')  # Use clam theme as base
-            except Exception as e:
-                print(f"Warning: 'clam' theme not available: {e}")
-            
-            # Configure the root window
-            try:
-                self.root.configure(bg="#1e1e1e")
-            except Exception as e:
-                print(f"Warning: Could not set root background: {e}")
-            
-            # Configure frame styles with error handling
-            try:
-                style.configure('TFrame', background='#1e1e1e')
-                style.configure('TLabelframe', background='#1e1e1e', foreground='white')
-                style.configure('TLabelframe.Label', background='#1e1e1e', foreground='white')
-                style.configure('TLabel', background='#1e1e1e', foreground='white')
-            except Exception as e:
-                print(f"Warning: Could not configure frame/label styles: {e}")
-            
-            # Configure button styles with error handling
-            try:
-                style.configure('TButton', background='#404040', foreground='white')
-                style.map('TButton', 
-                         background=[('active', '#505050'), ('pressed', '#303030')],
-                         foreground=[('active', 'white'), ('pressed', 'white')])
-            except Exception as e:
-                print(f"Warning: Could not configure button styles: {e}")
-            
-            # Configure treeview styles with error handling
-            try:
-                style.configure('Treeview', background='#2b2b2b', foreground='white', fieldbackground='#2b2b2b')
-                style.configure('Treeview.Heading', background='#404040', foreground='white')
-                style.map('Treeview', 
-                         background=[('selected', '#505050')],
-                         foreground=[('selected', 'white')])
-            except Exception as e:
-                print(f"Warning: Could not configure treeview styles: {e}")
-            
-            # Configure scrollbar styles with error handling
-            try:
-                style.configure('Vertical.TScrollbar', background='#404040', troughcolor='#2b2b2b')
-                style.map('Vertical.TScrollbar', 
-                         background=[('active', '#505050'), ('pressed', '#303030')])
-            except Exception as e:
-                print(f"Warning: Could not configure scrollbar styles: {e}")
-            
-            # Configure additional dark mode styles for settings window
-            try:
-                style.configure('Dark.TLabelframe', background='#1e1e1e', foreground='white')
-                style.configure('Dark.TLabelframe.Label', background='#1e1e1e', foreground='white')
-                style.configure('Dark.TLabel', background='#1e1e1e', foreground='white')
-                style.configure('Dark.TButton', background='#404040', foreground='white')
-                style.configure('Dark.TEntry', fieldbackground='#2b2b2b', foreground='white', insertbackground='white')
-                style.configure('Dark.TCheckbutton', background='#1e1e1e', foreground='white')
-                
-                # Force Entry widget styling
-                style.map('Dark.TEntry',
-                         fieldbackground=[('readonly', '#2b2b2b'), ('focus', '#2b2b2b')],
-                         foreground=[('readonly', 'white'), ('focus', 'white')])
-                
-                # Force Button widget styling
-                style.map('Dark.TButton',
-                         background=[('active', '#505050'), ('pressed', '#303030')],
-                         foreground=[('active', 'white'), ('pressed', 'white')])
-                
-            except Exception as e:
-                print(f"Warning: Could not configure dark mode styles: {e}")
-                
-        except Exception as e:
-            print(f"Warning: Could not apply dark mode styling: {e}")
-            print("Using default system styling instead.")
-    
-    def apply_dark_mode_to_window(self, window):
-        """Apply dark mode styling to a specific window (like settings)"""
-        try:
-            # Configure the window background
-            try:
-                window.configure(bg="#1e1e1e")
-            except Exception as e:
-                print(f"Warning: Could not set window background: {e}")
-            
-            # Apply dark mode to all child widgets recursively
-            self.apply_dark_mode_to_widgets(window)
+                    logger.debug("Error processing existing file %s: %s", os.path.basename(file_path), e)
             
+            self.mark_logs_read()
+            return tails_read, len(chat_index)
         except Exception as e:
-            print(f"Warning: Could not apply dark mode to window: {e}")
-    
-    def apply_dark_mode_to_widgets(self, parent):
-        """Recursively apply dark mode to all child widgets"""
-        try:
-            for child in parent.winfo_children():
-                try:
-                    # Apply dark mode based on widget type
-                    if isinstance(child, tk.Label):
-                        child.configure(bg="#1e1e1e", fg="white")
-                    elif isinstance(child, tk.Entry):
-                        child.configure(bg="#2b2b2b", fg="white", insertbackground="white")
-                    elif isinstance(child, tk.Checkbutton):
-                        child.configure(bg="#1e1e1e", fg="white", selectcolor="#404040")
-                    elif isinstance(child, tk.Button):
-                        child.configure(bg="#404040", fg="white", activebackground="#505050", activeforeground="white")
-                    elif isinstance(child, tk.Frame) or isinstance(child, ttk.Frame):
-                        child.configure(bg="#1e1e1e")
-                    elif isinstance(child, ttk.LabelFrame):
-                        child.configure(style='Dark.TLabelframe')
-                    elif isinstance(child, ttk.Label):
-                        child.configure(style='Dark.TLabel')
-                    elif isinstance(child, ttk.Button):
-                        child.configure(style='Dark.TButton')
-                    elif isinstance(child, ttk.Entry):
-                        child.configure(style='Dark.TCheckbutton')
-                except Exception as e:
-                    # Continue with other widgets if one fails
-                    pass
-                
-                # Recursively apply to children
-                self.apply_dark_mode_to_widgets(child)
-                
-        except Exception as e:
-            print(f"Warning: Could not apply dark mode to widgets: {e}")
+            logger.error("Error processing existing files: %s", e)
+            return 0, 0
+
+# Time from launch until the window is up and the engine has caught up, checked by --profile-startup
+STARTUP_BUDGET_SECONDS = 2.0
+
+def run_headless(config_manager, profile=None):
+    """Run the engine without any GUI until interrupted (Ctrl+C or SIGTERM)"""
+    engine = GiveawayEngine(config_manager, profile)
+    engine.events.subscribe(ConsoleStatus())
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+    engine.start()
+    logger.info("Running headless; press Ctrl+C to stop")
+    try:
+        while not stopped.wait(1):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        logger.info("Shutting down")
+        engine.stop()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="EVE Online giveaway tool")
+    parser.add_argument('--headless', action='store_true',
+                        help="run the chat monitor and games without a window (status goes to the log)")
+    parser.add_argument('--profile-startup', action='store_true',
+                        help=f"log how long each startup phase takes against a {STARTUP_BUDGET_SECONDS:.0f}s budget")
+    args = parser.parse_args(argv)
     
-    def apply_dark_mode_to_settings_widgets(self, settings_window):
-        """Apply dark mode specifically to settings window widgets"""
-        try:
-            # Find and style the Entry widgets specifically
-            for widget in settings_window.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.LabelFrame):
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, ttk.Entry):
-                                    # Force dark styling for Entry widgets
-                                    grandchild.configure(style='Dark.TEntry')
-                                    # Also try direct configuration as fallback
-                                    try:
-                                        grandchild.configure(background="#2b2b2b", foreground="white", insertbackground="white")
-                                    except:
-                                        pass
-                                elif isinstance(grandchild, ttk.Button):
-                                    grandchild.configure(style='Dark.TButton')
-                                elif isinstance(grandchild, ttk.Label):
-                                    grandchild.configure(style='Dark.TLabel')
-                                elif isinstance(grandchild, ttk.Checkbutton):
-                                    grandchild.configure(style='Dark.TCheckbutton')
-                        elif isinstance(child, ttk.Button):
-                            child.configure(style='Dark.TButton')
-                        elif isinstance(child, ttk.Label):
-                            child.configure(style='Dark.TLabel')
-            
-            # Ensure the button frame is visible
-            button_frame = None
-            for widget in settings_window.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Frame) and len(child.winfo_children()) > 0:
-                            # Check if this is the button frame (has buttons)
-                            for grandchild in child.winfo_children():
-                                if isinstance(grandchild, ttk.Button) and "Save" in grandchild.cget("text"):
-                                    button_frame = child
-                                    break
-                            if button_frame:
-                                break
-                    if button_frame:
-                        break
-            
-            if button_frame:
-                # Make sure button frame is visible and properly styled
-                button_frame.configure(style='Dark.TFrame')
-                print("DEBUG: Button frame found and styled")
-            else:
-                print("DEBUG: Button frame not found")
-                
-        except Exception as e:
-            print(f"Warning: Could not apply dark mode to settings widgets: {e}")
-            import traceback
-            traceback.print_exc()
-    
-    def sort_column(self, column):
-        """Sort the participants tree by the specified column"""
-        # Get all items from the tree
-        items = [(self.participants_tree.set(item, column), item) for item in self.participants_tree.get_children('')]
-        
-        # Sort items based on column type
-        if column == 'Username':
-            # Sort alphabetically
-            items.sort(key=lambda x: x[0].lower())
-        elif column == 'Guess':
-            # Sort numerically
-            items.sort(key=lambda x: int(x[0]) if x[0].isdigit() else 0)
-        elif column == 'Time':
-            # Sort by time (HH:MM:SS format)
-            items.sort(key=lambda x: x[0])
-        
-        # Reverse if already sorted in this direction
-        if self.sort_directions[column]:
-            items.reverse()
-            self.sort_directions[column] = False
-        else:
-            self.sort_directions[column] = True
-        
-        # Rearrange items in the tree
-        for index, (val, item) in enumerate(items):
-            self.participants_tree.move(item, '', index)
-        
-        # Update column header to show sort direction
-        current_text = self.participants_tree.heading(column)['text']
-        if self.sort_directions[column]:
-            self.participants_tree.heading(column, text=f"{current_text} ↓")
+    profile = StartupProfile(enabled=args.profile_startup, started=STARTED, budget=STARTUP_BUDGET_SECONDS,
+                             parts=('engine',) if args.headless else ('window', 'engine'))
+    profile.record('imports', STARTED, time.perf_counter())
+    with profile.phase('config + logging'):
+        config_manager = ConfigManager()
+        configure_logging(debug=config_manager.is_debug_mode())
+    try:
+        if args.headless:
+            run_headless(config_manager, profile)
         else:
-            self.participants_tree.heading(column, text=f"{current_text} ↑")
-    
-    def update_game_status(self, message):
-        """Thread-safe game status update"""
-        if hasattr(self, 'root') and self.root:
-            self.root.after(0, self._update_game_status_safe, message)
-    
-    def _update_game_status_safe(self, message):
-        """Internal method to update game status (called from main thread)"""
-        try:
-            self.status_text.delete(1.0, tk.END)
-            timestamp = datetime.now().strftime('%H:%M:%S')
-            self.status_text.insert(tk.END, f"[{timestamp}] {message}")
-            self.status_text.see(tk.END)
-        except Exception as e:
-            print(f"Error updating game status: {e}")
-    
-    def add_participant(self, username, guess):
-        """Thread-safe participant addition"""
-        if hasattr(self, 'root') and self.root:
-            self.root.after(0, self._add_participant_safe, username, guess)
-    
-    def _add_participant_safe(self, username, guess):
-        """Internal method to add participant (called from main thread)"""
-        try:
-            time_str = datetime.now().strftime('%H:%M:%S')
-            print(f"DEBUG: GUI adding participant {username} with guess {guess} at {time_str}")
-            self.participants_tree.insert('', 'end', values=(username, guess, time_str))
-            print(f"DEBUG: Participant tree now has {len(self.participants_tree.get_children())} entries")
-        except Exception as e:
-            print(f"Error adding participant: {e}")
-    
-    def clear_participants(self):
-        """Thread-safe participant clearing"""
-        if hasattr(self, 'root') and self.root:
-            self.root.after(0, self._clear_participants_safe)
-    
-    def _clear_participants_safe(self):
-        """Internal method to clear participants (called from main thread)"""
-        try:
-            for item in self.participants_tree.get_children():
-                self.participants_tree.delete(item)
-        except Exception as e:
-            print(f"Error clearing participants: {e}")
-    
-    def load_window_settings(self):
-        """Load saved window size and position from settings file"""
-        try:
-            if os.path.exists('window_settings.json'):
-                with open('window_settings.json', 'r') as f:
-                    settings = json.load(f)
-                    geometry = settings.get('geometry', '1200x800')
-                    x = settings.get('x', 100)
-                    y = settings.get('y', 100)
-                    self.root.geometry(geometry)
-                    self.root.geometry(f"+{x}+{y}")
-            else:
-                # Default size if no settings file
-                self.root.geometry("1200x800+100+100")
-        except Exception as e:
-            print(f"Error loading window settings: {e}")
-            # Fallback to default size
-            self.root.geometry("1200x800+100+100")
-    
-    def save_window_settings(self):
-        """Save current window size and position to settings file"""
-        try:
-            geometry = self.root.geometry()
-            x = self.root.winfo_x()
-            y = self.root.winfo_y()
-            
-            settings = {
-                'geometry': geometry,
-                'x': x,
-                'y': y
-            }
-            
-            with open('window_settings.json', 'w') as f:
-                json.dump(settings, f)
-        except Exception as e:
-            print(f"Error saving window settings: {e}")
-    
-    def on_closing(self):
-        """Handle window closing - save settings and cleanup"""
-        self.save_window_settings()
-        if self.observer:
-            self.observer.stop()
-            self.observer.join()
-        self.root.destroy()
-    
-    def run(self):
-        self.root.mainloop()
+            # Tk is only imported when there is a window to show
+            with profile.phase('gui import'):
+                from gui import EVEGiveawayGUI
+            with profile.phase('engine setup'):
+                engine = GiveawayEngine(config_manager, profile)
+            app = EVEGiveawayGUI(engine)
+            app.run()
+    finally:
+        shutdown_logging()
 
 if __name__ == "__main__":
-    app = EVEGiveawayGUI()
-    app.run()
\ No newline at end of file
+    main()
@@ -0,0 +1,137 @@
+import calendar
+import logging
+import re
+import threading
+from collections import deque
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Leading "[ 2024.01.15 18:30:45 ]" of a chat log line, matched as loosely as the parser does
+_TIMESTAMP_RE = re.compile(r'\s*\[\s*(?P<timestamp>[\d.]+\s+[\d:]+)\s*\]\s*')
+
+
+def line_timestamp(line):
+    """EVE timestamp a raw log line starts with, e.g. '2024.01.15 18:30:45', or None"""
+    match = _TIMESTAMP_RE.match(line)
+    return ' '.join(match.group('timestamp').split()) if match else None
+
+
+@lru_cache(maxsize=4096)
+def timestamp_seconds(timestamp):
+    """Seconds since the epoch (UTC, as EVE logs) for an EVE timestamp, or None if it doesn't parse"""
+    try:
+        date, clock = timestamp.split()
+        year, month, day = (int(part) for part in date.split('.'))
+        hour, minute, second = (int(part) for part in clock.split(':'))
+    except ValueError:
+        return None
+    return calendar.timegm((year, month, day, hour, minute, second))
+
+
+class MessageDeduplicator:
+    """Drops chat lines already ingested from another log of the same channel
+
+    With multiboxing every logged-in character writes its own log of a
+    shared channel, so each message arrives once per listener. Lines are
+    keyed on the whole stripped line, i.e. EVE timestamp, speaker and body,
+    plus how often that message already appeared earlier in the same log,
+    so a player who really does repeat themselves within a second is still
+    counted each time. The check happens before parsing and costs a slice
+    and a couple of hash lookups per line.
+
+    Keys are kept per channel for window seconds of EVE time behind the
+    newest message seen there, and at most max_keys of them, which keeps
+    memory bounded however long the tool runs. Lines without a timestamp
+    are never dropped.
+    """
+
+    def __init__(self, window=600, max_keys=200000):
+        self.window = window
+        self.max_keys = max_keys
+        self._channels = {}  # channel -> _ChannelKeys
+        self._lock = threading.Lock()
+
+    def filter_lines(self, channel, file_path, lines):
+        """The lines of a batch from file_path not already ingested from another log of channel, in order"""
+        keys = self._channels.get(channel)
+        if keys is None:
+            with self._lock:
+                keys = self._channels.setdefault(channel, _ChannelKeys())
+        unique = []
+        with keys.lock:
+            seen, expiry, occurrences, order = keys.seen, keys.expiry, keys.occurrences, keys.order
+            for line in lines:
+                text = line.strip()
+                if '\x00' in text:
+                    text = text.replace('\x00', '')
+                # EVE's own layout is sliced directly; anything looser goes through the regex
+                if text[:2] == '[ ' and text[21:24] == ' ] ':
+                    timestamp = text[2:21]
+                else:
+                    timestamp = line_timestamp(text)
+                if timestamp != keys.timestamp:
+                    seconds = timestamp_seconds(timestamp) if timestamp else None
+                    keys.timestamp, keys.seconds = timestamp, seconds
+                    if seconds is not None and seconds > keys.newest:
+                        keys.newest = seconds
+                        self._evict(keys)
+                seconds = keys.seconds
+                if seconds is None:
+                    unique.append(line)
+                    continue
+                keys.checked += 1
+
+                # The nth copy of a message within one log only matches the nth copy in another
+                occurrence = occurrences.get((file_path, text), 0)
+                occurrences[(file_path, text)] = occurrence + 1
+                if occurrence == 0:
+                    order.append((seconds, (file_path, text)))
+                    key = text
+                else:
+                    key = (text, occurrence)
+
+                if key in seen:
+                    keys.duplicates += 1
+                    continue
+                seen.add(key)
+                expiry.append((seconds, key))
+                unique.append(line)
+            if len(seen) > self.max_keys or len(order) > self.max_keys:
+                self._evict(keys)
+        return unique
+
+    def get_stats(self):
+        """Lines checked and dropped, and keys held, across all channels"""
+        with self._lock:
+            channels = list(self._channels.values())
+        stats = {'checked': 0, 'duplicates': 0, 'keys': 0}
+        for keys in channels:
+            stats['checked'] += keys.checked
+            stats['duplicates'] += keys.duplicates
+            stats['keys'] += len(keys.seen)
+        return stats
+
+    def _evict(self, keys):
+        # Caller holds keys.lock; keys were added roughly in chat time order, so the oldest are at the front
+        cutoff = keys.newest - self.window
+        while keys.expiry and (keys.expiry[0][0] < cutoff or len(keys.seen) > self.max_keys):
+            keys.seen.discard(keys.expiry.popleft()[1])
+        while keys.order and (keys.order[0][0] < cutoff or len(keys.order) > self.max_keys):
+            keys.occurrences.pop(keys.order.popleft()[1], None)
+
+
+class _ChannelKeys:
+    """Keys of one channel's recent messages; only used under its lock"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.seen = set()  # Stripped line of each message ingested within the window, with its copy number after the first
+        self.expiry = deque()  # (seconds, key) in the order keys were added
+        self.occurrences = {}  # (file_path, stripped line) -> copies seen so far in that log
+        self.order = deque()  # (seconds, occurrences key) in the order they were added
+        self.newest = 0  # Chat time of the newest message, in seconds
+        self.timestamp = None  # Last timestamp converted, and its seconds (consecutive lines mostly share one)
+        self.seconds = None
+        self.checked = 0
+        self.duplicates = 0
@@ -0,0 +1,204 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
+
+# Hot-path stages, in the order a chat line passes through them
+STAGE_QUEUE_WAIT = 'queue_wait'  # Watchdog event -> file read starts (includes the coalescing window)
+STAGE_FILE_READ = 'file_read'    # Reading the appended lines
+STAGE_PARSE = 'parse'            # Cleaning and parsing one line (parse_chat_line)
+STAGE_DISPATCH = 'dispatch'      # Game logic for one command or entry
+STAGE_END_TO_END = 'end_to_end'  # Watchdog event -> every line of the read handled by the game logic
+STAGE_GUI_UPDATE = 'gui_update'  # One frame of participant table / status log updates
+STAGES = (STAGE_QUEUE_WAIT, STAGE_FILE_READ, STAGE_PARSE, STAGE_DISPATCH, STAGE_END_TO_END, STAGE_GUI_UPDATE)
+
+# Counters reported as a rate
+RATE_LINES = 'lines'
+RATE_ENTRIES = 'entries'
+
+# Upper bounds of the histogram buckets in seconds: 1 µs doubling up to ~67 s
+_BUCKET_BOUNDS = [1e-6 * 2 ** i for i in range(27)]
+
+
+class LatencyHistogram:
+    """Fixed log-scale histogram of durations
+
+    record() is a bisect and a few additions, so it is cheap enough for
+    every parsed line. Percentiles are read from the buckets and are
+    accurate to within a factor of two, which is plenty to tell whether a
+    stage takes microseconds or milliseconds.
+    """
+
+    def __init__(self):
+        self.counts = [0] * (len(_BUCKET_BOUNDS) + 1)  # Last bucket is everything slower
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, fraction):
+        """Upper bound in seconds of the bucket holding the given fraction of samples"""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= wanted:
+                return min(_BUCKET_BOUNDS[index], self.max) if index < len(_BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def summary(self):
+        """Count plus average, p50/p95/p99 and max in milliseconds"""
+        return {
+            'count': self.count,
+            'avg_ms': self.total / self.count * 1000 if self.count else 0.0,
+            'p50_ms': self.percentile(0.50) * 1000,
+            'p95_ms': self.percentile(0.95) * 1000,
+            'p99_ms': self.percentile(0.99) * 1000,
+            'max_ms': self.max * 1000,
+        }
+
+
+class RateCounter:
+    """Events per second over a sliding window of one-second buckets, plus the busiest second seen"""
+
+    def __init__(self, window=10):
+        self.window = window
+        self.buckets = deque()  # [second, count], oldest first
+        self.total = 0
+        self.peak = 0
+
+    def add(self, count=1, now=None):
+        second = int(now if now is not None else time.monotonic())
+        if self.buckets and self.buckets[-1][0] == second:
+            self.buckets[-1][1] += count
+        else:
+            self.buckets.append([second, count])
+            while self.buckets[0][0] <= second - self.window:
+                self.buckets.popleft()
+        self.total += count
+        if self.buckets[-1][1] > self.peak:
+            self.peak = self.buckets[-1][1]
+
+    def rate(self, now=None):
+        """Average events per second over the last window seconds"""
+        second = int(now if now is not None else time.monotonic())
+        recent = sum(count for bucket_second, count in self.buckets if bucket_second > second - self.window)
+        return recent / self.window
+
+
+class Metrics:
+    """Per-stage latency histograms and throughput counters for the ingest hot path
+
+    Stages call record() with a duration measured with time.perf_counter()
+    and count() for lines and accepted entries; both only take a lock and
+    update a few numbers. snapshot() gathers everything, along with the
+    stats of any source registered with add_source() (e.g. the file event
+    queue), for the stats panel. start_snapshots() additionally writes the
+    snapshot as JSON every interval seconds, replacing the file atomically.
+    """
+
+    def __init__(self, rate_window=10):
+        self.started = time.time()
+        self.histograms = {stage: LatencyHistogram() for stage in STAGES}
+        self.rates = {name: RateCounter(rate_window) for name in (RATE_LINES, RATE_ENTRIES)}
+        self.sources = {}  # name -> callable returning a dict of stats
+        self._lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+        self.snapshot_path = None
+        self.snapshot_interval = None
+
+    def record(self, stage, seconds):
+        """Add one duration to stage's histogram (thread-safe)"""
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram()
+            histogram.record(seconds)
+
+    def count(self, name, count=1):
+        """Count events for a rate such as RATE_LINES or RATE_ENTRIES (thread-safe)"""
+        with self._lock:
+            rate = self.rates.get(name)
+            if rate is None:
+                rate = self.rates[name] = RateCounter()
+            rate.add(count)
+
+    def add_source(self, name, get_stats):
+        """Include get_stats() under name in every snapshot"""
+        self.sources[name] = get_stats
+
+    def snapshot(self):
+        """Everything measured so far as plain, JSON-ready data"""
+        now = time.monotonic()
+        with self._lock:
+            stages = {stage: histogram.summary() for stage, histogram in self.histograms.items()}
+            rates = {name: {'per_sec': rate.rate(now), 'peak_per_sec': rate.peak, 'total': rate.total}
+                     for name, rate in self.rates.items()}
+        snapshot = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'uptime_s': round(time.time() - self.started, 1),
+            'stages': stages,
+            'rates': rates,
+        }
+        for name, get_stats in self.sources.items():
+            try:
+                snapshot[name] = get_stats()
+            except Exception as e:
+                logger.error("Error collecting %s metrics: %s", name, e)
+        return snapshot
+
+    def write_snapshot(self, path=None):
+        """Write the current snapshot to path as JSON"""
+        path = path or self.snapshot_path
+        temp_path = path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.snapshot(), f, indent=2)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error("Error writing metrics snapshot %s: %s", path, e)
+
+    def start_snapshots(self, path='metrics.json', interval=10):
+        """Write a snapshot to path every interval seconds on a background thread"""
+        with self._condition:
+            self.snapshot_path = path
+            self.snapshot_interval = interval
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="MetricsSnapshots", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop periodic snapshots, writing one last snapshot"""
+        with self._condition:
+            was_running = self._running
+            self._running = False
+            self._condition.notify()
+        if was_running:
+            self._thread.join(timeout=5)
+            self.write_snapshot()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._running:
+                    self._condition.wait(self.snapshot_interval)
+                if not self._running:
+                    return
+            self.write_snapshot()
@@ -0,0 +1,91 @@
+import bisect
+
+
+class ParticipantStore:
+    """One game's entries, indexed by character name and by guess
+
+    Reads like the dict it replaces (len, in, [name], items()), and also keeps
+    the distinct guesses in a sorted list with a guess -> names index, so the
+    PIR winner is a bisect, the GTN winner a dict lookup, and the current
+    leaders can be listed at any point during the game without a scan.
+    """
+
+    def __init__(self):
+        self._entries = {}  # name -> {'guess', 'time'}, in entry order
+        self._names_by_guess = {}  # guess -> names in entry order
+        self._guesses = []  # distinct guesses, ascending
+
+    def add(self, name, guess, time):
+        """Record an entry; returns False if name has already entered"""
+        if name in self._entries:
+            return False
+        self._entries[name] = {'guess': guess, 'time': time}
+        names = self._names_by_guess.get(guess)
+        if names is None:
+            self._names_by_guess[guess] = [name]
+            bisect.insort(self._guesses, guess)
+        else:
+            names.append(name)
+        return True
+
+    def names_with_guess(self, guess):
+        """Everyone who guessed exactly guess, in the order they entered"""
+        return list(self._names_by_guess.get(guess, ()))
+
+    def highest_at_most(self, limit):
+        """Highest guess that is <= limit, or None"""
+        index = bisect.bisect_right(self._guesses, limit)
+        return self._guesses[index - 1] if index else None
+
+    def leaderboard(self, target, limit=5, allow_over=False):
+        """Up to limit (guess, names) pairs, best first
+
+        Without allow_over only guesses <= target count, highest first (Price
+        is Right). With it, guesses are ranked by distance from target, lower
+        guess first on a tie (Guess the Number).
+        """
+        index = bisect.bisect_right(self._guesses, target)
+        below = index - 1  # Walks down from the highest guess <= target
+        above = index  # Walks up from the lowest guess > target
+        leaders = []
+        while len(leaders) < limit:
+            take_below = below >= 0
+            if allow_over and above < len(self._guesses):
+                take_below = take_below and target - self._guesses[below] <= self._guesses[above] - target
+            elif not take_below:
+                break
+            if take_below:
+                guess = self._guesses[below]
+                below -= 1
+            else:
+                guess = self._guesses[above]
+                above += 1
+            leaders.append((guess, self.names_with_guess(guess)))
+        return leaders
+
+    def distinct_guesses(self):
+        return len(self._guesses)
+
+    def items(self):
+        return self._entries.items()
+
+    def values(self):
+        return self._entries.values()
+
+    def get(self, name, default=None):
+        return self._entries.get(name, default)
+
+    def __getitem__(self, name):
+        return self._entries[name]
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"ParticipantStore({len(self._entries)} entries, {len(self._guesses)} distinct guesses)"
@@ -0,0 +1,117 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ReadCheckpoints:
+    """Byte offset each chat log has been handled up to, saved so a restart resumes where it stopped
+
+    update() only changes the in-memory table; a background thread rewrites
+    the JSON file at most once per flush_interval while anything changed,
+    through a temporary file and os.replace so a crash never leaves it
+    half-written. Offsets are recorded after their lines have been through
+    the game logic, so at worst the last second of chat is read twice.
+    """
+
+    def __init__(self, path='read_checkpoints.json', flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._files = {}  # file_path -> {'offset', 'inode', 'channel'}
+        self._dirty = False
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+        self._running = False
+        self._closed = False
+
+    def load(self):
+        """Read the saved checkpoints; returns {file_path: {'offset', 'inode', 'channel'}}"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                files = json.load(f).get('files', {})
+        except FileNotFoundError:
+            files = {}
+        except Exception as e:
+            logger.error("Error reading read checkpoints %s: %s", self.path, e)
+            files = {}
+        with self._condition:
+            self._files = files
+        return dict(files)
+
+    def last_saved(self):
+        """When the checkpoints file was last written (seconds since the epoch), or None if it doesn't exist"""
+        try:
+            return os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def update(self, file_path, offset, inode=None, channel=None):
+        """Record that file_path has been handled up to offset (thread-safe, never touches the disk)"""
+        with self._condition:
+            if self._closed:
+                logger.warning("Read checkpoints %s are closed; dropped offset %s of %s", self.path, offset, file_path)
+                return
+            checkpoint = self._files.get(file_path)
+            if checkpoint is not None and checkpoint['offset'] == offset and checkpoint['inode'] == inode:
+                return
+            self._files[file_path] = {'offset': offset, 'inode': inode, 'channel': channel}
+            self._dirty = True
+            running = self._running
+        if not running:
+            self.start()
+
+    def forget(self, file_path):
+        """Drop the checkpoint of a log that was deleted, moved away or replaced"""
+        with self._condition:
+            if self._files.pop(file_path, None) is not None:
+                self._dirty = True
+
+    def flush(self):
+        """Write the checkpoints to disk if anything changed"""
+        with self._write_lock:
+            with self._condition:
+                if not self._dirty:
+                    return
+                files = dict(self._files)
+                self._dirty = False
+            try:
+                temp_path = self.path + '.tmp'
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'files': files}, f, ensure_ascii=False, indent=1)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.path)
+            except Exception as e:
+                logger.error("Error writing read checkpoints %s: %s", self.path, e)
+
+    def start(self):
+        """Start the background writer (done automatically on first update)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="ReadCheckpoints", daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop the background writer and save what is left; later updates are refused"""
+        with self._condition:
+            self._closed = True
+            self._running = False
+            self._condition.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self.flush()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._running:
+                    self._condition.wait(self.flush_interval)
+                running = self._running
+            self.flush()
+            if not running:
+                return
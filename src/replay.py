@@ -0,0 +1,259 @@
+"""Headless replay of recorded EVE chat logs.
+
+Streams saved Chatlogs files through the chat parser and game logic without
+the Tk GUI, either as fast as possible or paced by the original timestamps,
+and prints per-game results and throughput. Each channel runs its own games,
+just as in the GUI.
+
+Usage:
+    python src/replay.py Chatlogs/Corp_20240115_183000_12345.txt [more logs...]
+    python src/replay.py --realtime --speed 4 Chatlogs/*.txt
+    python src/replay.py --seed 42 --admins admins.txt --quiet Chatlogs/*.txt
+"""
+import argparse
+import heapq
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+from admin_registry import AdminRegistry
+from chat_index import channel_from_filename
+from chat_parser import EVE_TIMESTAMP_FORMAT, parse_channel_header, parse_chat_line
+from chat_tail import ChatLogTailer
+from log_setup import configure_logging, shutdown_logging
+from main import ConfigManager, EVEChatMonitor, GameManager
+
+# Bytes read per chunk while streaming a log (even, so UTF-16 splits cleanly)
+READ_CHUNK_BYTES = 1 << 20
+
+
+class ReplayClock:
+    """Game clock that follows the timestamps of the replayed messages"""
+
+    def __init__(self):
+        self.now = datetime.now()
+
+    def __call__(self):
+        return self.now
+
+
+class ReplayReporter:
+    """Stands in for the GUI: prints game status against log time and counts entries"""
+
+    def __init__(self, clock, quiet=False):
+        self.clock = clock
+        self.quiet = quiet
+        self.entries = 0
+
+    def update_game_status(self, message):
+        if self.quiet:
+            return
+        stamp = self.clock().strftime('%H:%M:%S')
+        for line in message.splitlines():
+            print(f"[{stamp}] {line}")
+
+    def add_participant(self, username, guess, channel=None, entered_at=None):
+        self.entries += 1
+
+    def clear_participants(self, channel=None):
+        pass
+
+    def update_countdown(self, game, channel=None):
+        pass
+
+
+def read_log_messages(file_path):
+    """Yield (log time, line number, channel, ChatMessage) for every message in one chat log, in file order"""
+    tailer = ChatLogTailer()
+    file_size = os.path.getsize(file_path)
+    channel = channel_from_filename(os.path.basename(file_path))
+    last_time = None
+    lines_read = 0
+    while True:
+        lines = tailer.read_new_lines(file_path, max_bytes=READ_CHUNK_BYTES)
+        state = tailer.files.get(file_path)
+        for line in lines:
+            lines_read += 1
+            chat_message = parse_chat_line(line)
+            if chat_message is None:
+                # The header's "Channel Name:" wins over the name in the filename
+                channel = parse_channel_header(line) or channel
+                continue
+            if chat_message.timestamp:
+                try:
+                    last_time = datetime.strptime(chat_message.timestamp, EVE_TIMESTAMP_FORMAT)
+                except ValueError:
+                    pass
+            if last_time is not None:
+                # Messages without their own timestamp inherit the previous one
+                yield last_time, lines_read, channel, chat_message
+        if state is None or state['offset'] >= file_size:
+            break
+
+
+def replay(file_paths, realtime=False, speed=1.0, quiet=False, admin_path=None, timer_minutes=None):
+    """Replay chat logs through GameManager and return the collected statistics"""
+    clock = ReplayClock()
+    reporter = ReplayReporter(clock, quiet=quiet)
+    config_manager = ConfigManager()
+    if timer_minutes is not None:
+        config_manager.game_timer_minutes = timer_minutes
+    admin_registry = AdminRegistry(admin_path)
+
+    def create_game_manager(channel):
+        return GameManager(reporter, config_manager, admin_registry=admin_registry,
+                           clock=clock, auto_timer=False, channel=channel)
+
+    # No worker pool: messages are dispatched in timestamp order on this thread
+    monitor = EVEChatMonitor(create_game_manager, eve_logs_path=os.path.dirname(os.path.abspath(file_paths[0])),
+                             workers=0)
+
+    games = []
+    stats = {'messages': 0, 'lines': 0}
+    line_counts = {}
+
+    def note_game_end(game_manager, game):
+        if game is not None and not game['active'] and not game.get('reported'):
+            game['reported'] = True
+            games.append(summarize_game(game_manager, game))
+
+    def expire_games(until):
+        """End every channel's game whose end time is at or before until, in end time order"""
+        due = [manager for manager in monitor.game_managers.values()
+               if manager.current_game and manager.current_game['active'] and until >= manager.current_game['end_time']]
+        for manager in sorted(due, key=lambda manager: manager.current_game['end_time']):
+            game = manager.current_game
+            clock.now = game['end_time']
+            manager.check_expiry()
+            note_game_end(manager, game)
+
+    streams = [tag_stream(path, read_log_messages(path), line_counts) for path in file_paths]
+    started = time.perf_counter()
+    previous_time = None
+    for log_time, _, channel, chat_message in heapq.merge(*streams, key=lambda item: item[0]):
+        if realtime and previous_time is not None and log_time > previous_time:
+            time.sleep((log_time - previous_time).total_seconds() / speed)
+        previous_time = log_time
+
+        # Let games expire at their end time before handling later messages
+        expire_games(log_time)
+        clock.now = log_time
+
+        game_manager = monitor.game_manager_for(channel)
+        game = game_manager.current_game
+        monitor.dispatch_message(chat_message, channel)
+        stats['messages'] += 1
+        if game is not None and game is not game_manager.current_game and game['active']:
+            # Replaced or cleared before it finished
+            game['active'] = False
+            game['cleared'] = True
+        note_game_end(game_manager, game)
+
+    # Games still running at the end of the logs end when their timers would have
+    expire_games(datetime.max)
+
+    stats['elapsed'] = time.perf_counter() - started
+    stats['lines'] = sum(line_counts.values())
+    stats['entries'] = reporter.entries
+    stats['games'] = games
+    stats['stages'] = monitor.metrics.snapshot()['stages']
+    return stats
+
+
+def tag_stream(file_path, stream, line_counts):
+    """Pass a log's messages through while recording how many lines it held"""
+    for log_time, lines_read, channel, chat_message in stream:
+        line_counts[file_path] = lines_read
+        yield log_time, lines_read, channel, chat_message
+
+
+def summarize_game(game_manager, game):
+    """Build the per-game result row printed at the end of a replay"""
+    if game.get('cleared'):
+        result = "cleared before finishing"
+    else:
+        if game['type'] == 'PIR':
+            winner = game_manager.select_pir_winner(game)
+        else:  # GTN
+            winner = game_manager.select_gtn_winner(game)
+        if not winner:
+            result = "no winner"
+        elif winner['type'] == 'single':
+            result = f"winner {winner['name']} ({winner['guess']})"
+        else:  # multiple winners
+            result = f"winners {', '.join(winner['names'])} ({winner['guess']})"
+    return {
+        'channel': game['channel'],
+        'type': game['type'],
+        'admin': game['admin'],
+        'range': game['range'],
+        'target': game['target'],
+        'start_time': game['start_time'],
+        'participants': len(game['participants']),
+        'result': result,
+    }
+
+
+def print_report(stats):
+    """Print per-game results followed by throughput numbers"""
+    print()
+    print("🎮 Games")
+    if not stats['games']:
+        print("  (no games found in the replayed logs)")
+    for number, game in enumerate(stats['games'], 1):
+        print(f"  #{number} [{game['channel']}] {game['type']} {game['range']} started {game['start_time'].strftime('%Y.%m.%d %H:%M:%S')} "
+              f"by {game['admin']}: target {game['target']}, {game['participants']} participants, {game['result']}")
+
+    elapsed = max(stats['elapsed'], 1e-9)
+    print()
+    print("📈 Throughput")
+    print(f"  Lines read:        {stats['lines']:,}")
+    print(f"  Messages handled:  {stats['messages']:,}")
+    print(f"  Entries accepted:  {stats['entries']:,}")
+    print(f"  Elapsed:           {stats['elapsed']:.3f}s")
+    print(f"  Lines/sec:         {stats['lines'] / elapsed:,.0f}")
+    print(f"  Messages/sec:      {stats['messages'] / elapsed:,.0f}")
+
+    measured = {stage: stage_stats for stage, stage_stats in stats.get('stages', {}).items() if stage_stats['count']}
+    if measured:
+        print()
+        print("⏱️ Stage latency (ms)")
+        for stage, stage_stats in measured.items():
+            print(f"  {stage + ':':<18} n={stage_stats['count']:,}  avg {stage_stats['avg_ms']:.3f}  "
+                  f"p95 {stage_stats['p95_ms']:.3f}  p99 {stage_stats['p99_ms']:.3f}  max {stage_stats['max_ms']:.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded EVE chat logs through the giveaway game logic.")
+    parser.add_argument('logs', nargs='+', help="Chatlogs .txt files to replay (merged by timestamp)")
+    parser.add_argument('--realtime', action='store_true', help="pace messages by their original timestamps")
+    parser.add_argument('--speed', type=float, default=1.0, help="speed multiplier for --realtime (default: 1)")
+    parser.add_argument('--seed', type=int, help="random seed so target numbers are reproducible")
+    parser.add_argument('--admins', help="admins.txt to use instead of the usual search locations")
+    parser.add_argument('--minutes', type=int, help="game duration in minutes (default: from config.txt)")
+    parser.add_argument('--quiet', action='store_true', help="only print the final report")
+    parser.add_argument('--debug', action='store_true', help="show debug logging (default: DEBUG_MODE from config.txt)")
+    args = parser.parse_args(argv)
+
+    missing = [path for path in args.logs if not os.path.isfile(path)]
+    if missing:
+        parser.error(f"chat log not found: {', '.join(missing)}")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    configure_logging(debug=args.debug or ConfigManager().is_debug_mode(), log_file=None)
+    try:
+        stats = replay(args.logs, realtime=args.realtime, speed=args.speed, quiet=args.quiet,
+                       admin_path=args.admins, timer_minutes=args.minutes)
+    finally:
+        shutdown_logging()
+    print_report(stats)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledCall:
+    """Handle for a callback queued on a DeadlineScheduler; pass it to cancel()"""
+
+    __slots__ = ('deadline', 'callback', 'args', 'interval', 'cancelled')
+
+    def __init__(self, deadline, callback, args, interval=None):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.interval = interval
+        self.cancelled = False
+
+
+class DeadlineScheduler:
+    """Runs callbacks at their deadlines from one thread that sleeps until the next is due
+
+    Deadlines live in a heap keyed on time.monotonic(). The worker waits on a
+    condition until the earliest deadline or until the heap changes, so there
+    is no polling. Cancelling only flags the call; it is dropped when it
+    reaches the top of the heap, so cancel() never blocks.
+    """
+
+    def __init__(self, name="DeadlineScheduler"):
+        self.name = name
+        self._heap = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def call_later(self, delay, callback, *args):
+        """Run callback(*args) once, delay seconds from now"""
+        return self._push(ScheduledCall(time.monotonic() + max(0.0, delay), callback, args))
+
+    def call_every(self, interval, callback, *args, first_delay=None):
+        """Run callback(*args) every interval seconds until cancelled"""
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        delay = interval if first_delay is None else max(0.0, first_delay)
+        return self._push(ScheduledCall(time.monotonic() + delay, callback, args, interval))
+
+    def cancel(self, call):
+        """Cancel a scheduled call; safe to call more than once or with None"""
+        if call is not None:
+            call.cancelled = True
+
+    def start(self):
+        """Start the worker thread (done automatically on first use)"""
+        with self._condition:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout=5):
+        """Stop the worker thread and drop every pending call, waiting for one already running"""
+        with self._condition:
+            self._running = False
+            self._heap.clear()
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def pending(self):
+        """Number of calls waiting to run (including cancelled ones not yet discarded)"""
+        with self._condition:
+            return len(self._heap)
+
+    def _push(self, call):
+        with self._condition:
+            heapq.heappush(self._heap, (call.deadline, next(self._sequence), call))
+            # Wake the worker in case this deadline is now the earliest
+            self._condition.notify()
+            running = self._running
+        if not running:
+            self.start()
+        return call
+
+    def _run(self):
+        while True:
+            with self._condition:
+                call = None
+                while self._running and call is None:
+                    if not self._heap:
+                        self._condition.wait()
+                        continue
+                    deadline, _, head = self._heap[0]
+                    if head.cancelled:
+                        heapq.heappop(self._heap)
+                        continue
+                    delay = deadline - time.monotonic()
+                    if delay > 0:
+                        self._condition.wait(delay)
+                        continue
+                    heapq.heappop(self._heap)
+                    call = head
+                    if call.interval:
+                        # Stay on the original cadence, skipping ticks that were missed
+                        now = time.monotonic()
+                        call.deadline += call.interval
+                        if call.deadline <= now:
+                            call.deadline += call.interval * ((now - call.deadline) // call.interval + 1)
+                        heapq.heappush(self._heap, (call.deadline, next(self._sequence), call))
+                if not self._running:
+                    return
+
+            # Run outside the lock so callbacks can schedule or cancel freely
+            try:
+                call.callback(*call.args)
+            except Exception as e:
+                logger.error("Error in scheduled callback %s: %s", getattr(call.callback, '__name__', call.callback), e)
@@ -0,0 +1,75 @@
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """Per-phase timing of startup, reported once every part of startup has finished
+
+    Phases are timed with phase() as a context manager and may run on
+    different threads (the window is built on the main thread while the
+    engine catches up on logs in the background). Each part of startup
+    calls done(part); when the last expected part is done the breakdown is
+    logged with the offset of every phase from started, and compared with
+    budget seconds. When disabled, phase() and done() do nothing.
+    """
+
+    def __init__(self, enabled=False, started=None, budget=2.0, parts=('engine',)):
+        self.enabled = enabled
+        self.started = started if started is not None else time.perf_counter()
+        self.budget = budget
+        self.phases = []  # (name, offset from started, duration) in the order they finished
+        self.marks = {}  # part -> offset when it finished
+        self._waiting = set(parts)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        phase_started = time.perf_counter()
+        try:
+            yield
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                self.phases.append((name, phase_started - self.started, finished - phase_started))
+
+    def record(self, name, phase_started, finished=None):
+        """Record a phase timed by the caller with time.perf_counter()"""
+        if self.enabled:
+            finished = finished if finished is not None else time.perf_counter()
+            with self._lock:
+                self.phases.append((name, phase_started - self.started, finished - phase_started))
+
+    def done(self, part):
+        """Mark one part of startup (e.g. 'window' or 'engine') as finished; reports after the last one"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.marks[part] = time.perf_counter() - self.started
+            self._waiting.discard(part)
+            finished = not self._waiting
+        if finished:
+            for line in self.format_report():
+                logger.info("%s", line)
+
+    def format_report(self):
+        """The breakdown as lines of text"""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+            marks = sorted(self.marks.items(), key=lambda mark: mark[1])
+        lines = [f"Startup profile (budget {self.budget:.2f}s):",
+                 f"  {'Phase':<26}{'Starts at':>10}{'Took':>10}"]
+        for name, offset, duration in phases:
+            lines.append(f"  {name:<26}{offset:>9.3f}s{duration:>9.3f}s")
+        for part, offset in marks:
+            lines.append(f"  {part + ' ready':<26}{offset:>9.3f}s")
+        total = max(offset for _, offset in marks) if marks else 0.0
+        verdict = "within budget" if total <= self.budget else f"OVER BUDGET by {total - self.budget:.3f}s"
+        lines.append(f"  Total {total:.3f}s - {verdict}")
+        return lines
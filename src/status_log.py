@@ -0,0 +1,88 @@
+import logging
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from datetime import datetime
+
+from metrics import STAGE_GUI_UPDATE
+
+logger = logging.getLogger(__name__)
+
+
+class StatusLog:
+    """Scrollback log in a Text widget, bounded by a ring buffer of the last max_lines lines
+
+    append() may be called from any thread. Lines are timestamped when they
+    arrive and queued; once per frame (refresh_ms) everything queued is
+    written with a single insert, and the oldest lines are trimmed in one
+    delete once the widget holds trim_slack lines more than max_lines, so
+    the Text widget never grows without bound and is edited at most once
+    per frame however busy the channel is.
+    """
+
+    def __init__(self, text_widget, max_lines=500, refresh_ms=100, trim_slack=50, metrics=None):
+        self.text = text_widget
+        self.metrics = metrics  # Frame times are recorded as the GUI update stage when given
+        self.max_lines = max_lines
+        self.refresh_ms = refresh_ms
+        self.trim_slack = trim_slack
+        self.lines = deque(maxlen=max_lines)  # Most recent lines, oldest first
+        self._pending = []
+        self._widget_lines = 0  # Lines currently in the Text widget
+        self._flush_scheduled = False
+        self._lock = threading.Lock()
+
+    def append(self, message):
+        """Queue a (possibly multi-line) message, stamped with the current time (thread-safe)"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        lines = f"[{timestamp}] {message}".split('\n')
+        with self._lock:
+            self._pending.extend(lines)
+            if not self._flush_scheduled:
+                self._flush_scheduled = True
+                self.text.after(self.refresh_ms, self._flush)
+
+    def clear(self):
+        """Empty the log (main thread)"""
+        with self._lock:
+            self._pending = []
+            self.lines.clear()
+        self.text.delete('1.0', tk.END)
+        self._widget_lines = 0
+
+    def _flush(self):
+        """Write everything queued since the last frame in one widget edit (main thread)"""
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+            self._flush_scheduled = False
+        if not pending:
+            return
+
+        started = time.perf_counter()
+        try:
+            self.lines.extend(pending)
+            # Follow the newest line unless the operator has scrolled back
+            at_bottom = self.text.yview()[1] >= 0.999
+
+            if len(pending) >= self.max_lines or not self._widget_lines:
+                # The frame replaces everything shown anyway; rewrite from the ring buffer
+                self.text.delete('1.0', tk.END)
+                self.text.insert(tk.END, '\n'.join(self.lines))
+                self._widget_lines = len(self.lines)
+            else:
+                self.text.insert(tk.END, '\n' + '\n'.join(pending))
+                self._widget_lines += len(pending)
+                excess = self._widget_lines - self.max_lines
+                if excess >= self.trim_slack:
+                    # Drop the oldest lines in one bulk delete
+                    self.text.delete('1.0', f'{excess + 1}.0')
+                    self._widget_lines -= excess
+
+            if at_bottom:
+                self.text.see(tk.END)
+        except Exception as e:
+            logger.error("Error updating game status: %s", e)
+        if self.metrics:
+            self.metrics.record(STAGE_GUI_UPDATE, time.perf_counter() - started)
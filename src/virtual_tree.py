@@ -0,0 +1,210 @@
+import logging
+import threading
+import time
+
+from metrics import STAGE_GUI_UPDATE
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualTreeview:
+    """Shows a window onto a list of rows through a small, fixed pool of Treeview items
+
+    Rows live in Python lists (self.rows in display order); the Treeview only
+    ever holds the rows that fit in the viewport, and scrolling rewrites those
+    items' values instead of moving thousands of items around inside Tk. Rows can be added or cleared
+    from any thread: additions are collected and applied in bulk once per
+    frame, refresh_ms apart, so a rush of entries costs one redraw per frame
+    rather than one Tk call per entry.
+
+    Rows are kept as typed values and turned into display strings by
+    format_row only when drawn. Sorting works on the rows in memory; each
+    sort key's ordering is cached and extended as rows arrive, so switching
+    columns or directions never re-reads cells from Tk or moves items.
+    """
+
+    # Fallback geometry until a row has been drawn and can be measured
+    DEFAULT_ROW_HEIGHT = 20
+    DEFAULT_HEADER_HEIGHT = 25
+
+    def __init__(self, tree, scrollbar, refresh_ms=100, format_row=tuple, metrics=None):
+        self.tree = tree
+        self.metrics = metrics  # Frame times are recorded as the GUI update stage when given
+        self.scrollbar = scrollbar
+        self.refresh_ms = refresh_ms
+        self.format_row = format_row
+        self.arrival = []  # Every row, in the order added
+        self.rows = self.arrival  # Every row, in display order
+        self.sort_state = None  # (name, key, reverse) of the active sort
+        self._sort_cache = {}  # sort name -> rows ascending by that key
+        self.first = 0  # Index into rows of the top visible row
+        self.visible_rows = max(1, int(tree.cget('height')))
+        self.row_height = None
+        self.header_height = None
+        self._items = []  # Pooled Treeview item ids, top to bottom
+        self._shown = []  # Values currently displayed by each pooled item
+        self._pending = []
+        self._clear_requested = False
+        self._clear_filters = []  # Row predicates from partial clears since the last frame
+        self._flush_scheduled = False
+        self._lock = threading.Lock()
+
+        self.scrollbar.configure(command=self._on_scrollbar)
+        self.tree.bind('<Configure>', self._on_configure)
+        # Scroll the model, not the Treeview; "break" stops Tk's own scrolling
+        self.tree.bind('<MouseWheel>', self._on_mousewheel)
+        self.tree.bind('<Button-4>', lambda event: self.scroll(-3))
+        self.tree.bind('<Button-5>', lambda event: self.scroll(3))
+
+    def add(self, values):
+        """Queue a row for the next frame (thread-safe)"""
+        with self._lock:
+            self._pending.append(values)
+            self._schedule_flush()
+
+    def clear(self, match=None):
+        """Drop every row, or only rows for which match(row) is true, including queued ones (thread-safe)"""
+        with self._lock:
+            if match is None:
+                self._pending = []
+                self._clear_filters = []
+                self._clear_requested = True
+            else:
+                self._pending = [row for row in self._pending if not match(row)]
+                self._clear_filters.append(match)
+            self._schedule_flush()
+
+    def __len__(self):
+        return len(self.arrival) + len(self._pending)
+
+    def sort(self, name, key, reverse=False):
+        """Show rows ordered by key, keeping that order as new rows arrive (main thread)
+
+        name identifies the key in the cache of sorted orders; sorting by the
+        same name again only merges in rows added since it was last used.
+        """
+        self.sort_state = (name, key, reverse)
+        self._apply_sort()
+        self._render()
+
+    def _apply_sort(self):
+        if self.sort_state is None:
+            self.rows = self.arrival
+            return
+        name, key, reverse = self.sort_state
+        ordered = self._sort_cache.get(name)
+        if ordered is None:
+            ordered = self._sort_cache[name] = sorted(self.arrival, key=key)
+        elif len(ordered) < len(self.arrival):
+            # Timsort merges the already sorted run with the new tail in near-linear time
+            ordered.extend(self.arrival[len(ordered):])
+            ordered.sort(key=key)
+        self.rows = ordered[::-1] if reverse else ordered
+
+    def scroll(self, rows):
+        """Scroll by a number of rows; negative scrolls up (main thread)"""
+        self._scroll_to(self.first + rows)
+        return "break"
+
+    def _schedule_flush(self):
+        # Caller holds the lock
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.tree.after(self.refresh_ms, self._flush)
+
+    def _flush(self):
+        """Apply everything queued since the last frame in one pass (main thread)"""
+        with self._lock:
+            pending = self._pending
+            clear_requested = self._clear_requested
+            clear_filters = self._clear_filters
+            self._pending = []
+            self._clear_requested = False
+            self._clear_filters = []
+            self._flush_scheduled = False
+
+        started = time.perf_counter()
+        try:
+            if clear_requested:
+                self.arrival = []
+                self._sort_cache = {}
+                self.first = 0
+            for match in clear_filters:
+                # Filtering keeps the cached sort orders sorted, so they stay valid
+                self.arrival = [row for row in self.arrival if not match(row)]
+                for name, ordered in self._sort_cache.items():
+                    self._sort_cache[name] = [row for row in ordered if not match(row)]
+            self.arrival.extend(pending)
+            self._apply_sort()
+            self._render()
+            if pending:
+                logger.debug("Added %s participant row(s) in one frame, table now has %s entries",
+                             len(pending), len(self.arrival))
+        except Exception as e:
+            logger.error("Error updating participants table: %s", e)
+        if self.metrics:
+            self.metrics.record(STAGE_GUI_UPDATE, time.perf_counter() - started)
+
+    def _render(self):
+        """Point the pooled items at rows[first:first + visible_rows]"""
+        self.first = max(0, min(self.first, len(self.rows) - self.visible_rows))
+        window = self.rows[self.first:self.first + self.visible_rows]
+
+        while len(self._items) > len(window):
+            self.tree.delete(self._items.pop())
+            self._shown.pop()
+        while len(self._items) < len(window):
+            self._items.append(self.tree.insert('', 'end', values=()))
+            self._shown.append(None)
+
+        for index, row in enumerate(window):
+            values = self.format_row(row)
+            if self._shown[index] != values:
+                self.tree.item(self._items[index], values=values)
+                self._shown[index] = values
+
+        if self._items and self.row_height is None:
+            self._measure_rows()
+        self._update_scrollbar()
+
+    def _measure_rows(self):
+        """Read the real row and header heights off the first drawn row"""
+        bbox = self.tree.bbox(self._items[0])
+        if bbox:
+            _, y, _, height = bbox
+            self.header_height = y
+            self.row_height = height
+
+    def _update_scrollbar(self):
+        total = len(self.rows)
+        if total <= self.visible_rows:
+            self.scrollbar.set(0.0, 1.0)
+        else:
+            self.scrollbar.set(self.first / total, (self.first + self.visible_rows) / total)
+
+    def _scroll_to(self, first):
+        first = max(0, min(first, len(self.rows) - self.visible_rows))
+        if first != self.first:
+            self.first = first
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == 'moveto':
+            self._scroll_to(int(float(amount) * len(self.rows)))
+        elif action == 'scroll':
+            step = self.visible_rows if unit == 'pages' else 1
+            self._scroll_to(self.first + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120 per notch, macOS small deltas
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-notches * 3)
+
+    def _on_configure(self, event):
+        """Resize the item pool to however many rows fit in the widget"""
+        row_height = self.row_height or self.DEFAULT_ROW_HEIGHT
+        header_height = self.DEFAULT_HEADER_HEIGHT if self.header_height is None else self.header_height
+        visible_rows = max(1, (event.height - header_height) // row_height)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self._render()
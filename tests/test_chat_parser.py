@@ -0,0 +1,74 @@
+import pytest
+
+from chat_parser import (
+    CMD_CLEAR, CMD_ENTRY, CMD_GTN, CMD_PIR, CMD_STATUS, CMD_STOP,
+    ChatMessage, clean_line, command_kind, parse_channel_header, parse_chat_line,
+)
+
+
+@pytest.mark.parametrize('line', [
+    "[ 2024.01.15 18:30:45 ] Some Pilot > ?500",
+    "[2024.01.15 18:30:45] Some Pilot > ?500",
+    "[ 2024.01.15 18:30:45 ] Some Pilot: ?500",
+])
+def test_timestamped_formats(line):
+    assert parse_chat_line(line) == ChatMessage('2024.01.15 18:30:45', 'Some Pilot', '?500', CMD_ENTRY)
+
+
+def test_format_without_timestamp():
+    assert parse_chat_line("Some Pilot > !PIR 1-100") == ChatMessage(None, 'Some Pilot', '!PIR 1-100', CMD_PIR)
+
+
+def test_colon_format_needs_a_timestamp():
+    # Without one, "Name: text" is ordinary text such as the log header, not a message
+    assert parse_chat_line("Listener: Some Pilot") is None
+
+
+def test_null_bytes_and_irregular_spacing():
+    line = "\x00[\x00 2024.01.15  18:30:45 ]  Some   Pilot  >   ?7  \x00"
+    assert parse_chat_line(line) == ChatMessage('2024.01.15 18:30:45', 'Some Pilot', '?7', CMD_ENTRY)
+
+
+@pytest.mark.parametrize('line', [
+    "[ 2024.01.15 18:30:45 ] Some Pilot >",
+    "[ 2024.01.15 18:30:45 ] Some Pilot >    ",
+    "---------------------------------------------------------------",
+    "",
+])
+def test_lines_that_are_not_messages(line):
+    assert parse_chat_line(line) is None
+
+
+def test_body_keeps_its_own_separators():
+    message = parse_chat_line("[ 2024.01.15 18:30:45 ] Some Pilot > a > b: c")
+    assert (message.speaker, message.body) == ('Some Pilot', 'a > b: c')
+
+
+def test_channel_header():
+    assert parse_channel_header("          Channel Name:    Corp") == 'Corp'
+    assert parse_channel_header("\x00Channel Name:\x00 Fleet Ops ") == 'Fleet Ops'
+    assert parse_channel_header("          Listener:        Some Pilot") is None
+    assert parse_channel_header("[ 2024.01.15 18:30:45 ] Some Pilot > Channel Name: x") is None
+
+
+@pytest.mark.parametrize('body, kind', [
+    ('!PIR 1-100', CMD_PIR),
+    ('!pir 1-100', CMD_PIR),
+    ('!GTN 1-10', CMD_GTN),
+    ('!stop', CMD_STOP),
+    ('!STATUS', CMD_STATUS),
+    ('!clear now', CMD_CLEAR),
+    ('?500', CMD_ENTRY),
+    ('? 500', CMD_ENTRY),
+    ('!stopwatch', None),
+    ('!pirate 1-100', None),
+    ('!unknown', None),
+    ('hello ?500', None),
+    ('o7', None),
+])
+def test_command_kind(body, kind):
+    assert command_kind(body) == kind
+
+
+def test_clean_line():
+    assert clean_line("\x00[ 2024.01.15   18:30:45 ]\x00  A  > hi ") == "[ 2024.01.15 18:30:45 ] A > hi"
@@ -0,0 +1,84 @@
+import codecs
+
+from chat_tail import ChatLogTailer, sniff_encoding
+
+
+def write(path, text, mode='ab'):
+    with open(path, mode) as f:
+        f.write(text.encode('utf-16-le') if isinstance(text, str) else text)
+
+
+def new_log(tmp_path, text=''):
+    path = str(tmp_path / 'Corp_20240115_183000_1.txt')
+    write(path, codecs.BOM_UTF16_LE, 'wb')
+    write(path, text)
+    return path
+
+
+def test_reads_only_appended_lines(tmp_path):
+    path = new_log(tmp_path, "[ 2024.01.15 18:30:00 ] A > ?1\r\n")
+    tailer = ChatLogTailer()
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 18:30:00 ] A > ?1"]
+    assert tailer.read_new_lines(path) == []
+    write(path, "[ 2024.01.15 18:30:01 ] B > ?2\r\n")
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 18:30:01 ] B > ?2"]
+    assert tailer.files[path]['encoding'] == 'utf-16-le'
+
+
+def test_partial_line_is_held_until_finished(tmp_path):
+    path = new_log(tmp_path, "[ 2024.01.15 18:30:00 ] A > ?1\r\n[ 2024.01.15 18:30:01 ] B > ?")
+    tailer = ChatLogTailer()
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 18:30:00 ] A > ?1"]
+    # The checkpoint offset stops at the end of the last complete line
+    assert tailer.position(path)[0] == 2 + len("[ 2024.01.15 18:30:00 ] A > ?1\r\n") * 2
+    write(path, "22\r\n")
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 18:30:01 ] B > ?22"]
+
+
+def test_utf16_character_split_across_reads(tmp_path):
+    line = "[ 2024.01.15 18:30:00 ] Ænima 🚀 > ?7"
+    data = (line + "\r\n").encode('utf-16-le')
+    cut = data.index('🚀'.encode('utf-16-le')) + 3  # Inside the surrogate pair, between a code unit's bytes
+    path = new_log(tmp_path)
+    write(path, data[:cut])
+    tailer = ChatLogTailer()
+    assert tailer.read_new_lines(path) == []
+    write(path, data[cut:])
+    assert tailer.read_new_lines(path) == [line]
+
+
+def test_chunked_reads_split_characters_cleanly(tmp_path):
+    lines = [f"[ 2024.01.15 18:30:{second:02d} ] Pilot ✓{second} > ?{second}" for second in range(20)]
+    path = new_log(tmp_path, "".join(line + "\r\n" for line in lines))
+    tailer = ChatLogTailer()
+    read = []
+    while True:
+        chunk = tailer.read_new_lines(path, max_bytes=7)  # Odd, so reads end mid code unit
+        if not chunk and tailer.files[path]['offset'] >= len(open(path, 'rb').read()):
+            break
+        read.extend(chunk)
+    assert read == lines
+
+
+def test_truncated_log_is_read_again_from_the_start(tmp_path):
+    path = new_log(tmp_path, "[ 2024.01.15 18:30:00 ] A > a rather long first message\r\n")
+    tailer = ChatLogTailer()
+    tailer.read_new_lines(path)
+    write(path, codecs.BOM_UTF16_LE, 'wb')
+    write(path, "[ 2024.01.15 19:00:00 ] B > ?3\r\n")
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 19:00:00 ] B > ?3"]
+
+
+def test_start_at_skips_what_was_already_there(tmp_path):
+    path = new_log(tmp_path, "[ 2024.01.15 18:30:00 ] Boss > !PIR 1-10\r\n")
+    tailer = ChatLogTailer()
+    tailer.start_at(path, len(open(path, 'rb').read()))
+    write(path, "[ 2024.01.15 18:31:00 ] A > ?4\r\n")
+    assert tailer.read_new_lines(path) == ["[ 2024.01.15 18:31:00 ] A > ?4"]
+
+
+def test_sniff_encoding():
+    assert sniff_encoding(codecs.BOM_UTF16_LE + "x".encode('utf-16-le')) == ('utf-16-le', 2)
+    assert sniff_encoding("[ 2024.01.15 ] A > hi".encode('utf-16-le')) == ('utf-16-le', 0)
+    assert sniff_encoding("[ 2024.01.15 ] A > hi".encode('utf-8')) == ('utf-8', 0)
+    assert sniff_encoding(b'caf\xe9') == ('cp1252', 0)
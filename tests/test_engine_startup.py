@@ -0,0 +1,105 @@
+import codecs
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from main import ConfigManager, GiveawayEngine
+
+
+@pytest.fixture
+def logs(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    logs = tmp_path / 'logs'
+    logs.mkdir()
+    (tmp_path / 'config.txt').write_text(f"EVE_LOGS_PATH={logs}\nCHANGE_DETECTION=native\nSTARTUP_SCAN_HOURS=6\n",
+                                         encoding='utf-8')
+    (tmp_path / 'admins.txt').write_text("Boss\n", encoding='utf-8')
+    return logs
+
+
+def write_log(logs, name, *lines, age_hours=0):
+    path = logs / name
+    with open(path, 'ab') as f:
+        if not f.tell():
+            f.write(codecs.BOM_UTF16_LE)
+        f.write("".join(line + "\r\n" for line in lines).encode('utf-16-le'))
+    if age_hours:
+        stamp = time.time() - age_hours * 3600
+        os.utime(path, (stamp, stamp))
+    return str(path)
+
+
+def start_engine():
+    engine = GiveawayEngine(ConfigManager())
+    engine.start()
+    return engine
+
+
+def current_game(engine, channel):
+    game_manager = engine.chat_monitor.game_managers.get(channel)
+    return game_manager and game_manager.current_game
+
+
+def test_newest_line_of_a_recent_log_is_acted_on(logs):
+    write_log(logs, 'Corp_20240115_183000_1.txt',
+              "[ 2024.01.15 18:30:00 ] Alpha > ?5", "[ 2024.01.15 18:30:01 ] Boss > !PIR 1-100")
+    engine = start_engine()
+    try:
+        game = current_game(engine, 'Corp')
+        assert game['type'] == 'PIR' and len(game['participants']) == 0
+    finally:
+        engine.stop()
+
+
+def test_logs_outside_the_startup_window_are_not_acted_on(logs):
+    write_log(logs, 'Corp_20240115_183000_1.txt', "[ 2024.01.15 18:30:01 ] Boss > !PIR 1-100", age_hours=12)
+    engine = start_engine()
+    try:
+        assert current_game(engine, 'Corp') is None
+    finally:
+        engine.stop()
+
+
+def test_history_of_an_old_log_is_not_replayed_when_it_grows(logs):
+    path = write_log(logs, 'Corp_20240115_183000_1.txt',
+                     "[ 2024.01.15 18:30:00 ] Boss > !GTN 1-10", "[ 2024.01.15 18:30:01 ] Alpha > ?3",
+                     age_hours=12)
+    engine = start_engine()
+    try:
+        write_log(logs, 'Corp_20240115_183000_1.txt', "[ 2024.01.15 19:00:00 ] Bravo > ?4")
+        engine.chat_monitor.process_chat_log(path)
+        assert current_game(engine, 'Corp') is None
+    finally:
+        engine.stop()
+
+
+def now_stamp():
+    return datetime.now(timezone.utc).strftime('%Y.%m.%d %H:%M:%S')
+
+
+def test_restart_catches_up_on_idle_and_new_logs(logs):
+    header = "          Channel Name:    {}"
+    corp = write_log(logs, 'Corp_20240115_183000_1.txt', header.format('Corp'))
+    # Outside the startup window, so not even its tail is read
+    write_log(logs, 'Fleet_20240115_183000_1.txt', header.format('Fleet'), age_hours=12)
+    engine = start_engine()
+    write_log(logs, 'Corp_20240115_183000_1.txt',
+              f"[ {now_stamp()} ] Boss > !PIR 1-100", f"[ {now_stamp()} ] Alpha > ?10")
+    engine.chat_monitor.process_chat_log(corp)
+    engine.stop()
+
+    # While the tool is closed: the idle Fleet log gets a game, and EVE starts a new Corp session log
+    time.sleep(0.01)
+    write_log(logs, 'Fleet_20240115_183000_1.txt', f"[ {now_stamp()} ] Boss > !GTN 1-10", f"[ {now_stamp()} ] Bravo > ?3")
+    write_log(logs, 'Corp_20240115_190000_2.txt', header.format('Corp'),
+              f"[ {now_stamp()} ] Charlie > ?20", f"[ {now_stamp()} ] Delta > ?30")
+
+    engine = start_engine()
+    try:
+        assert sorted(current_game(engine, 'Corp')['participants']) == ['Alpha', 'Charlie', 'Delta']
+        fleet = current_game(engine, 'Fleet')
+        assert fleet['type'] == 'GTN' and list(fleet['participants']) == ['Bravo']
+    finally:
+        engine.stop()
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+
+from game_journal import EVENT_ENTRY, EVENT_START, EVENT_STOP, EVENT_WINNER, GameJournal
+
+STARTED = datetime(2024, 1, 15, 18, 30)
+GAME = {'type': 'PIR', 'admin': 'Boss', 'range': '1-100', 'range_min': 1, 'range_max': 100, 'target': 50,
+        'start_time': STARTED, 'end_time': STARTED + timedelta(minutes=2)}
+
+
+def write_game(journal, channel, entries):
+    journal.record(EVENT_START, channel, **GAME)
+    for seconds, (name, guess) in enumerate(entries, 1):
+        journal.record(EVENT_ENTRY, channel, name=name, guess=guess, time=STARTED + timedelta(seconds=seconds))
+
+
+def test_running_games_are_rebuilt_with_their_entries(tmp_path):
+    path = str(tmp_path / 'game_journal.jsonl')
+    journal = GameJournal(path)
+    write_game(journal, 'Corp', [('Alpha', 10), ('Bravo', 20)])
+    journal.close()
+
+    games = GameJournal(path).load_active_games()
+    assert list(games) == ['Corp']
+    game = games['Corp']
+    assert {field: game[field] for field in GAME} == GAME
+    assert game['entries'] == [('Alpha', 10, STARTED + timedelta(seconds=1)),
+                               ('Bravo', 20, STARTED + timedelta(seconds=2))]
+
+
+def test_finished_games_are_not_rebuilt_and_are_compacted_away(tmp_path):
+    path = str(tmp_path / 'game_journal.jsonl')
+    journal = GameJournal(path)
+    write_game(journal, 'Corp', [('Alpha', 10)])
+    journal.record(EVENT_WINNER, 'Corp', names=['Alpha'], guess=10)
+    journal.record(EVENT_STOP, 'Corp', reason='stopped')
+    write_game(journal, 'Alliance', [('Charlie', 30)])
+    journal.close()
+
+    assert list(GameJournal(path).load_active_games()) == ['Alliance']
+    with open(path, encoding='utf-8') as f:
+        assert '"Corp"' not in f.read()
+
+
+def test_a_torn_last_line_loses_only_that_event(tmp_path):
+    path = str(tmp_path / 'game_journal.jsonl')
+    journal = GameJournal(path)
+    write_game(journal, 'Corp', [('Alpha', 10), ('Bravo', 20)])
+    journal.close()
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"event": "entry", "channel": "Corp", "name": "Cha')
+
+    games = GameJournal(path).load_active_games()
+    assert [name for name, _, _ in games['Corp']['entries']] == ['Alpha', 'Bravo']
+
+
+def test_missing_journal_means_no_games(tmp_path):
+    assert GameJournal(str(tmp_path / 'missing.jsonl')).load_active_games() == {}
+
+
+def test_records_after_close_are_refused(tmp_path):
+    path = str(tmp_path / 'game_journal.jsonl')
+    journal = GameJournal(path)
+    write_game(journal, 'Corp', [('Alpha', 10)])
+    journal.close()
+    journal.record(EVENT_ENTRY, 'Corp', name='Late', guess=99, time=STARTED)
+    assert journal._thread is None or not journal._thread.is_alive()
+    journal.flush()
+    games = GameJournal(path).load_active_games()
+    assert [name for name, _, _ in games['Corp']['entries']] == ['Alpha']
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from admin_registry import AdminRegistry
+from event_bus import EventBus
+from main import ConfigManager, GameManager, LogClock
+
+STARTED = datetime(2024, 1, 15, 18, 30)
+
+
+class Clock:
+    def __init__(self):
+        self.now = STARTED
+
+    def __call__(self):
+        return self.now
+
+
+class History:
+    def __init__(self):
+        self.games = []
+
+    def record_game(self, game, winner, outcome, ended_at=None):
+        self.games.append((game['type'], winner, outcome))
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def history():
+    return History()
+
+
+@pytest.fixture
+def game_manager(tmp_path, monkeypatch, clock, history):
+    # No config.txt here, so the defaults apply
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'admins.txt').write_text("Boss\n", encoding='utf-8')
+    return GameManager(EventBus(), ConfigManager(), admin_registry=AdminRegistry(str(tmp_path / 'admins.txt')),
+                       clock=clock, auto_timer=False, channel='Corp', history=history)
+
+
+def start(game_manager, command, target):
+    if command.startswith('!pir'):
+        game_manager.start_pir_game('Boss', command)
+    else:
+        game_manager.start_gtn_game('Boss', command)
+    game_manager.current_game['target'] = target
+    return game_manager.current_game
+
+
+def enter(game_manager, *entries):
+    for name, guess in entries:
+        game_manager.enter_game(name, f"?{guess}")
+
+
+def test_only_admins_start_games(game_manager):
+    game_manager.start_pir_game('Nobody', '!pir 1-100')
+    assert game_manager.current_game is None
+    game_manager.start_pir_game('Boss', '!pir 1-100')
+    assert game_manager.current_game['range'] == '1-100'
+
+
+def test_entries_outside_the_range_or_repeated_are_rejected(game_manager):
+    game = start(game_manager, '!pir 1-100', 50)
+    enter(game_manager, ('Alpha', 10), ('Alpha', 20), ('Bravo', 101), ('Charlie', 0))
+    assert dict((name, entry['guess']) for name, entry in game['participants'].items()) == {'Alpha': 10}
+
+
+def test_price_is_right_picks_the_highest_guess_not_over(game_manager):
+    start(game_manager, '!pir 1-100', 50)
+    enter(game_manager, ('Alpha', 30), ('Bravo', 49), ('Charlie', 51))
+    assert game_manager.select_pir_winner() == {'name': 'Bravo', 'guess': 49, 'type': 'single'}
+
+
+def test_price_is_right_tie_shares_the_win(game_manager):
+    start(game_manager, '!pir 1-100', 50)
+    enter(game_manager, ('Alpha', 45), ('Bravo', 60), ('Charlie', 45))
+    assert game_manager.select_pir_winner() == {'names': ['Alpha', 'Charlie'], 'guess': 45, 'type': 'multiple'}
+
+
+def test_price_is_right_without_a_guess_under_the_target(game_manager):
+    start(game_manager, '!pir 1-100', 5)
+    enter(game_manager, ('Alpha', 6))
+    assert game_manager.select_pir_winner() is None
+
+
+def test_guess_the_number_needs_an_exact_match(game_manager):
+    start(game_manager, '!gtn 1-10', 7)
+    enter(game_manager, ('Alpha', 6), ('Bravo', 8))
+    assert game_manager.select_gtn_winner() is None
+    enter(game_manager, ('Charlie', 7), ('Delta', 7))
+    assert game_manager.select_gtn_winner() == {'names': ['Charlie', 'Delta'], 'guess': 7, 'type': 'multiple'}
+
+
+def test_a_stopped_game_is_recorded_once(game_manager, history):
+    start(game_manager, '!pir 1-100', 50)
+    enter(game_manager, ('Alpha', 40))
+    game_manager.stop_game('Boss')
+    game_manager.stop_game('Boss')
+    assert history.games == [('PIR', {'name': 'Alpha', 'guess': 40, 'type': 'single'}, 'stopped')]
+    enter(game_manager, ('Bravo', 41))
+    assert 'Bravo' not in game_manager.current_game['participants']
+
+
+def test_game_expires_at_its_end_time(game_manager, clock, history):
+    game = start(game_manager, '!gtn 1-10', 3)
+    clock.now = game['end_time'] - timedelta(seconds=1)
+    assert not game_manager.check_expiry()
+    clock.now = game['end_time']
+    assert game_manager.check_expiry()
+    assert not game['active']
+    assert history.games == [('GTN', None, 'expired')]
+
+
+def test_restored_game_waits_for_resume(game_manager, clock, history):
+    saved = {'type': 'PIR', 'admin': 'Boss', 'range': '1-100', 'range_min': 1, 'range_max': 100, 'target': 50,
+             'start_time': STARTED, 'end_time': STARTED + timedelta(minutes=2),
+             'entries': [('Alpha', 40, STARTED + timedelta(seconds=5))]}
+    clock.now = STARTED + timedelta(hours=1)
+    game_manager.restore_game(saved, resume=False)
+    assert game_manager.current_game['active']
+    assert game_manager.current_game['participants']['Alpha']['time'] == STARTED + timedelta(seconds=5)
+    game_manager.resume_game()
+    assert not game_manager.current_game['active']
+    assert history.games == [('PIR', {'name': 'Alpha', 'guess': 40, 'type': 'single'}, 'expired')]
+
+
+def test_log_clock_reads_eve_time_as_utc():
+    log_clock = LogClock()
+    assert log_clock.read(None) is None
+    local = datetime(2024, 1, 15, 18, 30, 45, tzinfo=timezone.utc).astimezone().replace(tzinfo=None)
+    assert log_clock.read('2024.01.15 18:30:45') == local
+    assert log_clock.read('not a time') == local
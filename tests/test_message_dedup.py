@@ -0,0 +1,56 @@
+from message_dedup import MessageDeduplicator, line_timestamp
+
+LINES = [
+    "[ 2024.01.15 18:30:00 ] Boss > !PIR 1-100",
+    "[ 2024.01.15 18:30:01 ] Alpha > ?10",
+    "[ 2024.01.15 18:30:01 ] Bravo > ?20",
+]
+
+
+def test_copies_from_another_log_of_the_channel_are_dropped():
+    dedup = MessageDeduplicator()
+    assert dedup.filter_lines('Corp', 'first.txt', LINES) == LINES
+    assert dedup.filter_lines('Corp', 'second.txt', LINES) == []
+    assert dedup.get_stats() == {'checked': 6, 'duplicates': 3, 'keys': 3}
+
+
+def test_copies_interleaved_across_logs_keep_the_first_arrival():
+    dedup = MessageDeduplicator()
+    assert dedup.filter_lines('Corp', 'first.txt', LINES[:2]) == LINES[:2]
+    assert dedup.filter_lines('Corp', 'second.txt', LINES) == LINES[2:]
+    assert dedup.filter_lines('Corp', 'first.txt', LINES[2:]) == []
+
+
+def test_channels_are_kept_apart():
+    dedup = MessageDeduplicator()
+    dedup.filter_lines('Corp', 'corp.txt', LINES)
+    assert dedup.filter_lines('Alliance', 'alliance.txt', LINES) == LINES
+
+
+def test_a_genuine_repeat_counts_once_per_copy():
+    repeated = [LINES[1], LINES[1]]
+    dedup = MessageDeduplicator()
+    assert dedup.filter_lines('Corp', 'first.txt', repeated) == repeated
+    # The other log's two copies match the two already read; a third is new
+    assert dedup.filter_lines('Corp', 'second.txt', repeated) == []
+    assert dedup.filter_lines('Corp', 'second.txt', [LINES[1]]) == [LINES[1]]
+
+
+def test_lines_without_a_timestamp_are_never_dropped():
+    dedup = MessageDeduplicator()
+    lines = ["Channel Name:    Corp", "Alpha > ?10"]
+    assert dedup.filter_lines('Corp', 'first.txt', lines) == lines
+    assert dedup.filter_lines('Corp', 'second.txt', lines) == lines
+
+
+def test_keys_older_than_the_window_are_forgotten():
+    dedup = MessageDeduplicator(window=60)
+    dedup.filter_lines('Corp', 'first.txt', [LINES[1]])
+    dedup.filter_lines('Corp', 'first.txt', ["[ 2024.01.15 18:40:00 ] Charlie > ?30"])
+    assert dedup.filter_lines('Corp', 'second.txt', [LINES[1]]) == [LINES[1]]
+
+
+def test_line_timestamp():
+    assert line_timestamp("[ 2024.01.15 18:30:45 ] A > hi") == '2024.01.15 18:30:45'
+    assert line_timestamp("[2024.01.15  18:30:45] A > hi") == '2024.01.15 18:30:45'
+    assert line_timestamp("A > hi") is None
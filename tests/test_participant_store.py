@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from participant_store import ParticipantStore
+
+ENTERED = datetime(2024, 1, 15, 18, 30)
+
+
+def store_with(*entries):
+    store = ParticipantStore()
+    for name, guess in entries:
+        store.add(name, guess, ENTERED)
+    return store
+
+
+def test_each_character_enters_once():
+    store = ParticipantStore()
+    assert store.add('Alpha', 10, ENTERED)
+    assert not store.add('Alpha', 20, ENTERED)
+    assert store['Alpha'] == {'guess': 10, 'time': ENTERED}
+    assert len(store) == 1 and 'Alpha' in store and 'Bravo' not in store
+
+
+def test_guess_index():
+    store = store_with(('Alpha', 50), ('Bravo', 20), ('Charlie', 50), ('Delta', 80))
+    assert store.names_with_guess(50) == ['Alpha', 'Charlie']
+    assert store.names_with_guess(51) == []
+    assert store.distinct_guesses() == 3
+    assert store.highest_at_most(79) == 50
+    assert store.highest_at_most(80) == 80
+    assert store.highest_at_most(19) is None
+
+
+def test_price_is_right_leaderboard_ignores_guesses_over_the_target():
+    store = store_with(('Alpha', 50), ('Bravo', 20), ('Charlie', 50), ('Delta', 80))
+    assert store.leaderboard(60) == [(50, ['Alpha', 'Charlie']), (20, ['Bravo'])]
+    assert store.leaderboard(60, limit=1) == [(50, ['Alpha', 'Charlie'])]
+    assert store.leaderboard(10) == []
+
+
+def test_guess_the_number_leaderboard_ranks_by_distance_lower_first():
+    store = store_with(('Alpha', 40), ('Bravo', 60), ('Charlie', 75), ('Delta', 10))
+    assert store.leaderboard(50, allow_over=True) == [(40, ['Alpha']), (60, ['Bravo']), (75, ['Charlie']),
+                                                      (10, ['Delta'])]
@@ -0,0 +1,56 @@
+import json
+
+from read_checkpoints import ReadCheckpoints
+
+
+def test_offsets_survive_a_restart(tmp_path):
+    path = str(tmp_path / 'read_checkpoints.json')
+    checkpoints = ReadCheckpoints(path)
+    checkpoints.update('Corp_1.txt', 100, inode=7, channel='Corp')
+    checkpoints.update('Corp_1.txt', 250, inode=7, channel='Corp')
+    checkpoints.update('Alliance_1.txt', 40, channel='Alliance')
+    checkpoints.close()
+
+    assert ReadCheckpoints(path).load() == {
+        'Corp_1.txt': {'offset': 250, 'inode': 7, 'channel': 'Corp'},
+        'Alliance_1.txt': {'offset': 40, 'inode': None, 'channel': 'Alliance'},
+    }
+
+
+def test_forgotten_logs_are_dropped(tmp_path):
+    path = str(tmp_path / 'read_checkpoints.json')
+    checkpoints = ReadCheckpoints(path)
+    checkpoints.update('Corp_1.txt', 100)
+    checkpoints.update('Corp_2.txt', 200)
+    checkpoints.forget('Corp_1.txt')
+    checkpoints.close()
+    assert list(ReadCheckpoints(path).load()) == ['Corp_2.txt']
+
+
+def test_background_writer_flushes_without_close(tmp_path):
+    path = tmp_path / 'read_checkpoints.json'
+    checkpoints = ReadCheckpoints(str(path), flush_interval=0.01)
+    checkpoints.update('Corp_1.txt', 100)
+    for _ in range(200):
+        if path.exists():
+            break
+        checkpoints._thread.join(0.01)
+    assert json.loads(path.read_text(encoding='utf-8'))['files']['Corp_1.txt']['offset'] == 100
+    checkpoints.close()
+
+
+def test_unreadable_file_loads_as_empty(tmp_path):
+    path = tmp_path / 'read_checkpoints.json'
+    path.write_text('{"files": {"Corp_1.txt": ', encoding='utf-8')
+    assert ReadCheckpoints(str(path)).load() == {}
+
+
+def test_updates_after_close_are_refused(tmp_path):
+    path = str(tmp_path / 'read_checkpoints.json')
+    checkpoints = ReadCheckpoints(path)
+    checkpoints.update('Corp_1.txt', 100)
+    checkpoints.close()
+    checkpoints.update('Corp_1.txt', 900)
+    assert not checkpoints._thread.is_alive()
+    checkpoints.flush()
+    assert ReadCheckpoints(path).load()['Corp_1.txt']['offset'] == 100
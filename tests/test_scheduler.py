@@ -0,0 +1,69 @@
+import threading
+import time
+
+import pytest
+
+from scheduler import DeadlineScheduler
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = DeadlineScheduler()
+    yield scheduler
+    scheduler.stop()
+
+
+def test_calls_run_in_deadline_order(scheduler):
+    ran = []
+    done = threading.Event()
+    scheduler.call_later(0.06, lambda: (ran.append('late'), done.set()))
+    scheduler.call_later(0.02, ran.append, 'early')
+    scheduler.call_later(0.0, ran.append, 'now')
+    assert done.wait(2)
+    assert ran == ['now', 'early', 'late']
+
+
+def test_cancelled_call_never_runs(scheduler):
+    ran = []
+    done = threading.Event()
+    call = scheduler.call_later(0.02, ran.append, 'cancelled')
+    scheduler.call_later(0.05, done.set)
+    scheduler.cancel(call)
+    scheduler.cancel(None)  # Nothing scheduled is fine too
+    assert done.wait(2)
+    assert ran == []
+
+
+def test_repeating_call_keeps_its_cadence_until_cancelled(scheduler):
+    ticks = []
+    three = threading.Event()
+
+    def tick():
+        ticks.append(time.monotonic())
+        if len(ticks) == 3:
+            three.set()
+
+    call = scheduler.call_every(0.02, tick, first_delay=0)
+    assert three.wait(2)
+    scheduler.cancel(call)
+    count = len(ticks)
+    time.sleep(0.06)
+    assert len(ticks) == count
+
+
+def test_a_failing_callback_does_not_stop_the_scheduler(scheduler):
+    done = threading.Event()
+    scheduler.call_later(0, lambda: 1 / 0)
+    scheduler.call_later(0.01, done.set)
+    assert done.wait(2)
+
+
+def test_stop_drops_pending_calls_and_joins_the_worker(scheduler):
+    ran = []
+    scheduler.call_later(0.05, ran.append, 'dropped')
+    thread = scheduler._thread
+    scheduler.stop()
+    assert not thread.is_alive()
+    assert scheduler.pending() == 0
+    time.sleep(0.08)
+    assert ran == []